@@ -0,0 +1,65 @@
+'''Measures the cold import time of specargs and the cost of detecting the active framework
+
+Usage::
+
+    python benchmarks/bench_import_time.py [--repeat 10]
+'''
+import argparse
+import pkgutil
+import statistics
+import subprocess
+import sys
+import time
+
+from specargs import framework
+
+
+def time_cold_import(statement: str) -> float:
+    # A fresh interpreter is required as modules are cached after the first import
+    output = subprocess.run(
+        [sys.executable, "-c", f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output)
+
+
+def scan_installed_modules():
+    installed_modules = {module.name for module in pkgutil.iter_modules()}
+    return [framework_ for framework_ in framework.Framework if framework_.value in installed_modules]
+
+
+def probe_installed_modules():
+    return [framework_ for framework_ in framework.Framework if framework._is_installed(framework_.value)]
+
+
+def time_call(func, repeat: int) -> list:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(name: str, timings: list):
+    print(f"{name}: min {min(timings) * 1000:.2f}ms, median {statistics.median(timings) * 1000:.2f}ms")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=10)
+    options = arg_parser.parse_args()
+
+    report("import specargs", [time_cold_import("import specargs") for _ in range(options.repeat)])
+    report(
+        "import specargs + framework module",
+        [time_cold_import("import specargs; specargs.WebargsPlugin") for _ in range(options.repeat)],
+    )
+    report("framework detection (sys.path scan)", time_call(scan_installed_modules, options.repeat))
+    report("framework detection (find_spec probes)", time_call(probe_installed_modules, options.repeat))
+
+
+if __name__ == "__main__":
+    main()
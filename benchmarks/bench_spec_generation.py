@@ -0,0 +1,65 @@
+'''Measures OpenAPI spec generation time for a Flask app with many decorated operations
+
+Usage::
+
+    python benchmarks/bench_spec_generation.py [--operations 1000] [--repeat 5] [--processes 4]
+'''
+import argparse
+import statistics
+import time
+from typing import Optional
+
+from flask import Flask
+from marshmallow import Schema, fields
+
+from specargs import WebargsAPISpec, WebargsPlugin, use_args, use_response, use_empty_response
+
+
+class ItemSchema(Schema):
+    id = fields.Integer(required=True)
+    name = fields.String(required=True)
+    tags = fields.List(fields.String())
+
+
+def create_app(operations: int) -> Flask:
+    app = Flask(__name__, static_folder=None)
+    for i in range(operations):
+        @use_args({"name": fields.String(required=True), "tags": fields.List(fields.String())}, location="json")
+        @use_response(ItemSchema, description="The item")
+        @use_empty_response(status_code=404, description="The item was not found")
+        def view(args, item_id):
+            ...  # pragma: no cover
+
+        app.add_url_rule(f"/items{i}/<int:item_id>", endpoint=f"item{i}", view_func=view, methods=["POST"])
+
+    return app
+
+
+def generate_spec(app: Flask, processes: Optional[int] = None) -> dict:
+    spec = WebargsAPISpec("Benchmark", "1.0.0", "3.0.2", plugins=[WebargsPlugin()])
+    spec.create_paths(app, processes=processes)
+    return spec.to_dict()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--operations", type=int, default=1000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--processes", type=int, default=None)
+    options = arg_parser.parse_args()
+
+    app = create_app(options.operations)
+    timings = []
+    for _ in range(options.repeat):
+        start = time.perf_counter()
+        generate_spec(app, options.processes)
+        timings.append(time.perf_counter() - start)
+
+    print(
+        f"{options.operations} operations: "
+        f"min {min(timings):.3f}s, median {statistics.median(timings):.3f}s over {options.repeat} runs"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+'''Benchmarks request parsing, response dumping and spec generation with synthetic Flask apps
+
+Each scenario reports throughput, latency percentiles and the peak memory allocated during a single run. Results can be
+saved as a baseline and later runs compared against it.
+
+Usage::
+
+    python benchmarks/bench_suite.py [--filter parse] [--quick] [--save baseline.json] [--compare baseline.json]
+'''
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from flask import Flask
+from marshmallow import Schema, fields
+
+from specargs import OneOf, WebargsAPISpec, WebargsPlugin, use_args, use_response
+
+from bench_spec_generation import create_app, generate_spec
+
+
+class TagSchema(Schema):
+    name = fields.String(required=True)
+    weight = fields.Float()
+
+
+class OwnerSchema(Schema):
+    id = fields.Integer(required=True)
+    email = fields.Email(required=True)
+    tags = fields.List(fields.Nested(TagSchema))
+
+
+class FlatItemSchema(Schema):
+    id = fields.Integer(required=True)
+    name = fields.String(required=True)
+    price = fields.Float()
+    active = fields.Boolean()
+
+
+class NestedItemSchema(FlatItemSchema):
+    owner = fields.Nested(OwnerSchema, required=True)
+    tags = fields.List(fields.Nested(TagSchema))
+
+
+class ItemsSchema(Schema):
+    items = fields.List(fields.Nested(FlatItemSchema), required=True)
+
+
+class NestedItemsSchema(Schema):
+    items = fields.List(fields.Nested(NestedItemSchema), required=True)
+
+
+def make_item(i: int, nested: bool) -> dict:
+    item = {"id": i, "name": f"item {i}", "price": i * 1.5, "active": i % 2 == 0}
+    if nested:
+        tags = [{"name": f"tag {t}", "weight": t / 10} for t in range(3)]
+        item.update(owner={"id": i, "email": f"owner{i}@example.com", "tags": tags}, tags=tags)
+    return item
+
+
+def make_body(size: int, nested: bool) -> bytes:
+    '''Produces a JSON body of roughly `size` bytes containing a list of items'''
+    item_size = len(json.dumps(make_item(0, nested))) + 2
+    items = [make_item(i, nested) for i in range(max(1, size // item_size))]
+    return json.dumps({"items": items}).encode()
+
+
+def oneof_variants(count: int) -> List[type]:
+    return [
+        Schema.from_dict({f"kind{i}": fields.String(required=True), "value": fields.Integer()}, name=f"Variant{i}")
+        for i in range(count)
+    ]
+
+
+def parse_scenario(schema, body: bytes) -> Callable[[], object]:
+    app = Flask(__name__, static_folder=None)
+
+    @use_args(schema, location="json")
+    def view(args):
+        return args
+
+    def run():
+        with app.test_request_context("/", method="POST", data=body, content_type="application/json"):
+            return view()
+
+    return run
+
+
+def dump_scenario(schema, data) -> Callable[[], object]:
+    app = Flask(__name__, static_folder=None)
+
+    @use_response(schema)
+    def view():
+        return data
+
+    def run():
+        with app.app_context():
+            return view()
+
+    return run
+
+
+def spec_scenario(routes: int, processes: Optional[int] = None) -> Callable[[], object]:
+    app = create_app(routes)
+    return lambda: generate_spec(app, processes)
+
+
+def incremental_spec_scenario(routes: int) -> Callable[[], object]:
+    app = create_app(routes)
+    spec = WebargsAPISpec("Benchmark", "1.0.0", "3.0.2", plugins=[WebargsPlugin()])
+    spec.create_paths(app)
+    return lambda: spec.create_paths(app)
+
+
+def scenarios(quick: bool) -> Iterator[Tuple[str, Callable[[], Callable[[], object]], int]]:
+    '''Yields each scenario's name, a function producing the callable to measure, and its number of runs'''
+    large_body_size = 1_000_000 if quick else 10_000_000
+    for nested, schema in ((False, ItemsSchema), (True, NestedItemsSchema)):
+        shape = "nested" if nested else "flat"
+        yield f"parse/{shape}/small", lambda s=schema, n=nested: parse_scenario(s, make_body(1_000, n)), 500
+        yield (
+            f"parse/{shape}/{large_body_size // 1_000_000}MB",
+            lambda s=schema, n=nested: parse_scenario(s, make_body(large_body_size, n)),
+            3,
+        )
+        yield (
+            f"dump/{shape}/1000 items",
+            lambda s=schema, n=nested: dump_scenario(s, {"items": [make_item(i, n) for i in range(1_000)]}),
+            50,
+        )
+
+    for variants in (2, 20):
+        def oneof(variants=variants):
+            schemas = oneof_variants(variants)
+            return parse_scenario(OneOf(*schemas), json.dumps({f"kind{variants - 1}": "last", "value": 1}).encode())
+        yield f"parse/oneof/{variants} variants", oneof, 500
+
+        def oneof_dump(variants=variants):
+            schemas = oneof_variants(variants)
+            return dump_scenario(OneOf(*schemas), {f"kind{variants - 1}": "last", "value": 1})
+        yield f"dump/oneof/{variants} variants", oneof_dump, 500
+
+        def oneof_dump_many(variants=variants):
+            schemas = oneof_variants(variants)
+            # Model objects of a class per variant, as returned by polymorphic list endpoints. Each class always matches
+            # the same variant, so the schemas matched by each class are remembered
+            models = [type(f"Variant{i}Model", (), {f"kind{i}": "kind", "value": 1}) for i in range(variants)]
+            oneof = OneOf(*schemas, dump_cache_size=variants)
+            return dump_scenario(oneof, [models[i % variants]() for i in range(1_000)])
+        yield f"dump/oneof/{variants} variants/1000 items", oneof_dump_many, 20
+
+    for routes in ((10, 100, 1_000) if quick else (10, 100, 1_000, 5_000)):
+        yield f"spec/{routes} routes", lambda r=routes: spec_scenario(r), 3 if routes >= 1_000 else 10
+        yield f"spec/{routes} routes/unchanged rebuild", lambda r=routes: incremental_spec_scenario(r), 10
+
+    processes = os.cpu_count() or 1
+    if processes > 1:
+        routes = 1_000 if quick else 5_000
+        yield f"spec/{routes} routes/{processes} processes", lambda: spec_scenario(routes, processes), 3
+
+
+def measure(func: Callable[[], object], repeat: int) -> Dict[str, float]:
+    func()  # Warm up caches built on first use
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    # Memory is traced in a separate run as tracing slows execution down considerably
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    percentiles = statistics.quantiles(timings, n=100, method="inclusive") if repeat > 1 else timings * 99
+    median = statistics.median(timings)
+    return {
+        "ops_per_sec": 1 / median,
+        "p50_ms": median * 1000,
+        "p95_ms": percentiles[94] * 1000,
+        "p99_ms": percentiles[98] * 1000,
+        "peak_memory_mb": peak / 1_000_000,
+    }
+
+
+def format_change(result: Dict[str, float], baseline: Dict[str, float]) -> str:
+    if not baseline: return ""
+    change = (result["p50_ms"] - baseline["p50_ms"]) / baseline["p50_ms"] * 100
+    return f"  {change:+.1f}% p50 vs baseline"
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--filter", default="", help="Only run scenarios whose names contain this string")
+    arg_parser.add_argument("--quick", action="store_true", help="Use smaller bodies and apps")
+    arg_parser.add_argument("--save", help="Write the results to this JSON file")
+    arg_parser.add_argument("--compare", help="Compare the results against a JSON file written by --save")
+    options = arg_parser.parse_args()
+
+    baseline = {}
+    if options.compare:
+        with open(options.compare) as baseline_file: baseline = json.load(baseline_file)["results"]
+
+    results = {}
+    for name, setup, repeat in scenarios(options.quick):
+        if options.filter not in name: continue
+        result = results[name] = measure(setup(), repeat)
+        print(
+            f"{name:<40} {result['ops_per_sec']:>10.1f} ops/s  p50 {result['p50_ms']:>9.3f}ms  "
+            f"p95 {result['p95_ms']:>9.3f}ms  p99 {result['p99_ms']:>9.3f}ms  "
+            f"peak {result['peak_memory_mb']:>8.2f}MB{format_change(result, baseline.get(name))}"
+        )
+
+    if options.save:
+        with open(options.save, "w") as results_file:
+            json.dump({"python": sys.version.split()[0], "results": results}, results_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,16 @@ __version__ = '0.1.0'
 
 from .apispec import WebargsAPISpec
 from .decorators import use_args, use_kwargs, use_response, use_empty_response
+from .encoding import set_json_decoder, set_json_encoder
+from .instrumentation import add_observer, remove_observer
 from .in_poly import OneOf, AnyOf, AllOf
 from .oas import Response
 from .view_response import ViewResponse
-from .framework import WebargsPlugin
+
+
+def __getattr__(name: str):
+    # Deferred so that importing specargs doesn't import the active framework
+    if name == "WebargsPlugin":
+        from .framework import WebargsPlugin
+        return WebargsPlugin
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -0,0 +1,57 @@
+'''The specargs command line interface
+
+Usage::
+
+    python -m specargs build myapp.module:spec myapp.module:app --output openapi-artifact.json [--processes 8]
+'''
+import argparse
+import importlib
+import sys
+from typing import Any, List, Optional
+
+from .apispec import WebargsAPISpec
+
+
+def import_object(import_path: str) -> Any:
+    '''Imports the object at an import path of the form `package.module:attribute`'''
+    module_name, _, attribute_path = import_path.partition(":")
+    if not module_name or not attribute_path:
+        raise ValueError(f"'{import_path}' is not of the form 'package.module:attribute'!")
+
+    obj = importlib.import_module(module_name)
+    for attribute in attribute_path.split("."): obj = getattr(obj, attribute)
+    return obj
+
+
+def build(spec_path: str, framework_obj_path: str, output: str, processes: Optional[int] = None):
+    spec = import_object(spec_path)
+    if not isinstance(spec, WebargsAPISpec):
+        raise TypeError(f"'{spec_path}' is not a WebargsAPISpec object!")
+
+    spec.write_artifact(import_object(framework_obj_path), output, processes=processes)
+
+
+def main(args: Optional[List[str]] = None):
+    arg_parser = argparse.ArgumentParser(prog="python -m specargs")
+    subparsers = arg_parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser(
+        "build", help="Generate the OpenAPI spec and write it to an artifact for WebargsAPISpec.create_paths"
+    )
+    build_parser.add_argument("spec", help="The import path of the WebargsAPISpec object, e.g. 'myapp.module:spec'")
+    build_parser.add_argument(
+        "framework_obj", help="The import path of the framework object (e.g. Flask app), e.g. 'myapp.module:app'"
+    )
+    build_parser.add_argument("-o", "--output", default="openapi-artifact.json", help="The path of the artifact file")
+    build_parser.add_argument(
+        "-p", "--processes", type=int, default=None, help="Create paths across this many processes (default: 1)"
+    )
+    options = arg_parser.parse_args(args)
+
+    # Mimic running a script from the current directory so the application can be imported
+    if "" not in sys.path: sys.path.insert(0, "")
+    build(options.spec, options.framework_obj, options.output, options.processes)
+    print(f"Wrote {options.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,40 @@
 from abc import ABC, abstractmethod
+import copy
+import hashlib
+import json
 import os
-from typing import Any, Dict, Optional, Type, Union
+from typing import Any, Dict, Optional, Tuple, Type, Union
 
 from apispec import APISpec
+from attrs import field, frozen
 from marshmallow import Schema
 from webargs.core import ArgMap
 
+from .common import default_schema_name
+from .framework import Framework, get_backend
 from .in_poly import InPoly
 from .oas import Response, ensure_response
 
 
+@frozen
+class RenderedSpec:
+    '''A serialized OpenAPI spec document as produced by :meth:`WebargsAPISpec.render`'''
+    #: The serialized document
+    body: bytes
+    #: The media type of :attr:`body`
+    content_type: str
+    #: A strong entity tag computed from :attr:`body`
+    etag: str = field(init=False)
+
+    @etag.default
+    def _etag_default(self) -> str:
+        return hashlib.sha256(self.body).hexdigest()
+
+
+#: The media types of the formats accepted by :meth:`WebargsAPISpec.render`
+RENDER_CONTENT_TYPES = {"json": "application/json", "yaml": "application/yaml"}
+
+
 class WebargsAPISpec(APISpec):
     '''Stores metadata that describes a RESTful API and generates an OpenAPI spec from that metadata
 
@@ -17,13 +42,82 @@ class WebargsAPISpec(APISpec):
     and schema objects. This class also adds convenient extraction of operation metadata from components of the
     supported frameworks (e.g. Flask, Tornado, etc.).
     '''
-    def __init__(self, title, version, openapi_version, plugins=(), **options):
+    def __init__(self, title, version, openapi_version, plugins=(), *, backend=None, **options):
         '''Initializes a :class:`WebargsAPISpec` object
         
-        This accepts the same arguments as the constructor for :class:`apispec.APISpec`
+        This accepts the same arguments as the constructor for :class:`apispec.APISpec`, as well as `backend`: the
+        framework of the objects given to :meth:`create_paths` and :meth:`add_spec_route`, as a
+        :class:`~specargs.framework.Framework` or its value (e.g. `"flask"`). Defaults to the active framework
         '''
         super().__init__(title, version, openapi_version, plugins, **options)
+        #: The framework selected by the `backend` argument, or `None` for the active framework
+        self.backend: Optional[Union[Framework, str]] = backend
         self.response_refs: Dict[Response, str] = {}
+        self._rendered: Dict[str, RenderedSpec] = {}
+        #: The view functions/methods of the paths added by :meth:`create_paths`, keyed by framework specific routes
+        self.created_paths: Dict[Any, Any] = {}
+        #: The JSON spec loaded from an artifact by :meth:`create_paths`. When set, it's output by :meth:`render` and
+        #: :meth:`to_dict` instead of the spec generated from registered metadata
+        self.artifact_spec: Optional[RenderedSpec] = None
+        # The arguments of the `create_paths` call that loaded `artifact_spec`, whose paths weren't created
+        self._artifact_paths_args: Optional[Tuple[Any, Optional[int]]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        '''The same as :meth:`apispec.APISpec.to_dict` unless a spec has been loaded from an artifact, in which case the
+        artifact's spec is returned instead'''
+        if self.artifact_spec is not None: return json.loads(self.artifact_spec.body)
+        # apispec merges the generated spec into `options` in place, so a copy is given to it to keep them unchanged
+        options = self.options
+        self.options = copy.deepcopy(options)
+        try:
+            return super().to_dict()
+        finally:
+            self.options = options
+
+    def render(self, format: str = "json") -> RenderedSpec:
+        '''Serializes the OpenAPI spec, reusing the previous output if nothing has been registered since
+
+        The output is discarded whenever a path, tag, schema, or response is registered through this object. Components
+        registered directly through :attr:`components` after rendering require a call to :meth:`clear_rendered`.
+
+        Args:
+            format: The serialization format. Either `"json"` or `"yaml"`
+
+        Raises:
+            :exc:`ValueError`: If `format` is not a supported serialization format
+        '''
+        rendered = self._rendered.get(format)
+        if rendered is not None: return rendered
+
+        if format == "json" and self.artifact_spec is not None: return self.artifact_spec
+        if format == "json": body = json.dumps(self.to_dict()).encode()
+        elif format == "yaml": body = self.to_yaml().encode()
+        else: raise ValueError(f"Unsupported spec format '{format}'! Must be one of {', '.join(RENDER_CONTENT_TYPES)}.")
+
+        rendered = self._rendered[format] = RenderedSpec(body, RENDER_CONTENT_TYPES[format])
+        return rendered
+
+    def clear_rendered(self):
+        '''Discards any output stored by :meth:`render`
+
+        A spec loaded from an artifact is discarded as well since it no longer reflects the registered metadata, in
+        which case the paths that were skipped by loading it are created instead.
+        '''
+        self._rendered.clear()
+        if self.artifact_spec is None: return
+        framework_obj, processes = self._artifact_paths_args
+        self.artifact_spec = self._artifact_paths_args = None
+        get_backend(self.backend).create_paths(self, framework_obj, processes)
+
+    def path(self, *args, **kwargs) -> "WebargsAPISpec":
+        '''The same as :meth:`apispec.APISpec.path` but also discards any output stored by :meth:`render`'''
+        self.clear_rendered()
+        return super().path(*args, **kwargs)
+
+    def tag(self, tag: dict) -> "WebargsAPISpec":
+        '''The same as :meth:`apispec.APISpec.tag` but also discards any output stored by :meth:`render`'''
+        self.clear_rendered()
+        return super().tag(tag)
 
     def response(
         self,
@@ -50,6 +144,7 @@ class WebargsAPISpec(APISpec):
             :class:`~oas.Response` instance created from `response_or_argpoly`, `description`, and `**headers`
         '''
         response = ensure_response(response_or_argpoly, description=description, headers=headers)
+        self.clear_rendered()
         self.response_refs[response] = response_id
         self.components.response(response_id, response=response)
         return response
@@ -97,30 +192,80 @@ class WebargsAPISpec(APISpec):
         # When used as a decorator with arguments
         if isinstance(schema_class_or_name, str):
             def decorator(schema_class: Type[Schema]):
+                self.clear_rendered()
                 self.components.schema(schema_class_or_name, schema=schema_class)
                 return schema_class
 
             return decorator
 
         # When passed a Schema class or used as a decorator without arguments
-        if custom_name: schema_name = custom_name
-        else:
-            schema_name = schema_class_or_name.__name__
-            # Remove 'Schema' from the end of the Schema class name unless the Schema class name is 'Schema'
-            if schema_name.endswith("Schema"): schema_name = schema_name[:-6] or schema_name
+        schema_name = custom_name or default_schema_name(schema_class_or_name)
 
+        self.clear_rendered()
         self.components.schema(schema_name, schema=schema_class_or_name)
         return schema_class_or_name
 
     @abstractmethod
-    def create_paths(self, framework_obj: Any):
+    def create_paths(self, framework_obj: Any, *, artifact: Optional[str] = None, processes: Optional[int] = None):
         '''Creates the `paths` section of the OpenAPI spec from the appropriate framework object
 
+        Routes that were already added by a previous call are skipped unless their view function/method has changed,
+        so this can be called again after registering more routes (e.g. a Flask blueprint) to add only the new paths.
+
         Args:
             framework_obj: The object corresponding to the framework being used.
+            artifact: The path of an artifact written by :meth:`write_artifact` or `python -m specargs build`. If the
+                artifact is up to date with `framework_obj` and this spec, the spec it contains is used as is and the
+                view functions/methods of `framework_obj` are not inspected until anything else is registered with this
+                spec. Otherwise, paths are created as usual
+            processes: If greater than 1, the paths are created across up to this many forked processes and merged
+                back in order, producing the same spec as creating them in this process. Only worthwhile for thousands
+                of routes. Ignored on platforms that don't support forking processes (e.g. Windows)
 
         The list of supported frameworks and accepted objects is as follows:
 
-        - Flask: :class:`flask.Flask`'''
-        from .framework import create_paths
-        create_paths(self, framework_obj)
+        - Flask: :class:`flask.Flask`
+        - Django: :class:`django.urls.URLResolver`, or a URLconf module or its import path
+        - Tornado: :class:`tornado.web.Application`
+        - Bottle: :class:`bottle.Bottle`
+        - Starlette: :class:`starlette.applications.Starlette` or :class:`starlette.routing.Router`'''
+        if artifact is not None:
+            from .artifact import read_artifact
+            artifact_spec = read_artifact(self, framework_obj, artifact)
+            if artifact_spec is not None:
+                self._rendered.clear()
+                self.artifact_spec, self._artifact_paths_args = artifact_spec, (framework_obj, processes)
+                return
+
+        get_backend(self.backend).create_paths(self, framework_obj, processes)
+
+    def write_artifact(self, framework_obj: Any, path: str, *, processes: Optional[int] = None):
+        '''Creates the paths of the framework object and writes the resulting spec to an artifact file
+
+        The artifact can later be given to :meth:`create_paths` to skip inspecting view functions/methods while it's up
+        to date with the framework object and this spec.
+
+        Args:
+            framework_obj: The object corresponding to the framework being used. Accepts the same objects as
+                :meth:`create_paths`
+            path: The path of the artifact file
+            processes: The same as the `processes` argument of :meth:`create_paths`
+        '''
+        from .artifact import write_artifact
+        write_artifact(self, framework_obj, path, processes=processes)
+
+    def add_spec_route(self, framework_obj: Any, rule: str = "/openapi.json", *, format: str = "json"):
+        '''Registers a route to the appropriate framework object that serves the output of :meth:`render`
+
+        The route responds with a strong `ETag` header and responds with `304 Not Modified` to requests with a matching
+        `If-None-Match` header.
+
+        Args:
+            framework_obj: The object corresponding to the framework being used. Accepts the same objects as
+                :meth:`create_paths`
+            rule: The URL rule of the route
+            format: The serialization format served by the route. Accepts the same values as :meth:`render`
+        '''
+        if format not in RENDER_CONTENT_TYPES:
+            raise ValueError(f"Unsupported spec format '{format}'! Must be one of {', '.join(RENDER_CONTENT_TYPES)}.")
+        get_backend(self.backend).add_spec_route(self, framework_obj, rule, format)
@@ -0,0 +1,172 @@
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any, Callable, Optional, Set
+
+from marshmallow import Schema, fields, missing
+
+from . import __version__
+from .framework import get_backend
+from .in_poly import OneOf
+from .oas import Response
+
+if TYPE_CHECKING:
+    from .apispec import RenderedSpec, WebargsAPISpec
+
+
+#: The version of the artifact file format written by :func:`write_artifact`
+ARTIFACT_VERSION = 1
+
+
+def _qualified_name(obj: Any) -> str:
+    return f"{getattr(obj, '__module__', '')}.{getattr(obj, '__qualname__', repr(obj))}"
+
+
+def _field_fingerprint(field: Optional[fields.Field], seen: Set[type]) -> Any:
+    if field is None: return None
+    fingerprint = [
+        type(field).__qualname__, field.required, field.allow_none, field.data_key, field.load_only, field.dump_only
+    ]
+    # The remaining attributes are usually unset and are skipped in that case to keep fingerprinting cheap
+    if field.load_default is not missing or field.dump_default is not missing:
+        fingerprint.append(("default", repr(field.load_default), repr(field.dump_default)))
+    if field.metadata: fingerprint.append(("metadata", repr(sorted(field.metadata.items()))))
+    if field.validators:
+        # Validator functions are identified by name as their repr includes their memory address
+        fingerprint.append(("validators", [
+            _qualified_name(validator) if hasattr(validator, "__qualname__") else repr(validator)
+            for validator in field.validators
+        ]))
+    if isinstance(field, fields.Nested): fingerprint += [field.many, _schema_fingerprint(field.schema, seen)]
+    elif isinstance(field, fields.List): fingerprint.append(_field_fingerprint(field.inner, seen))
+    elif isinstance(field, fields.Tuple): fingerprint.append([_field_fingerprint(f, seen) for f in field.tuple_fields])
+    elif isinstance(field, fields.Mapping):
+        fingerprint += [_field_fingerprint(field.key_field, seen), _field_fingerprint(field.value_field, seen)]
+    return fingerprint
+
+
+def _schema_fingerprint(schema: Any, seen: Set[type]) -> Any:
+    if schema is None: return None
+    # Schemas are checked first as the InPoly check is comparatively slow for the many generated Schema classes
+    if not isinstance(schema, Schema):
+        if isinstance(schema, fields.Field): return _field_fingerprint(schema, seen)
+        fingerprint = [schema.keyword, [_schema_fingerprint(member, seen) for member in schema.schemas]]
+        if isinstance(schema, OneOf) and schema.discriminator: fingerprint += [schema.discriminator, sorted(schema.mapping)]
+        return fingerprint
+
+    schema_class = type(schema)
+    # Only the name is needed for self-referencing schemas as their fields are already part of the fingerprint
+    if schema_class in seen: return _qualified_name(schema_class)
+    seen = seen | {schema_class}
+    return [
+        _qualified_name(schema_class),
+        # Sorted as the order of unordered schema fields varies between processes
+        sorted((name, _field_fingerprint(field, seen)) for name, field in schema.fields.items()),
+    ]
+
+
+def _response_fingerprint(response: Response) -> Any:
+    return [response.description, sorted(response.headers.items()), _schema_fingerprint(response.schema, set())]
+
+
+def _view_fingerprint(view: Callable) -> Any:
+    views = [view]
+    # The methods of class-based views are decorated rather than the view function itself
+    view_class = getattr(view, "view_class", None)
+    if view_class:
+        # Flask views list their methods while Django views only list the methods their class may handle
+        methods = getattr(view, "methods", None) or getattr(view_class, "http_method_names", None) or ()
+        views += [getattr(view_class, method.lower(), None) for method in sorted(methods)]
+    # Django function views may list their methods like class-based views do
+    function_view_methods = None if view_class else getattr(view, "http_method_names", None)
+    return [function_view_methods] + [
+        [
+            _qualified_name(func),
+            [(webargs.location, _schema_fingerprint(webargs.schema_or_inpoly, set()))
+                for webargs in getattr(func, "webargs", ())],
+            [(int(status_code), _response_fingerprint(response))
+                for status_code, response in getattr(func, "responses", {}).items()],
+        ]
+        for func in views if func is not None
+    ]
+
+
+def fingerprint(spec: "WebargsAPISpec", framework_obj: Any) -> str:
+    '''Produces a hash of the metadata that determines the paths created from a framework object
+
+    This covers the routes of `framework_obj`, the arguments given to the specargs decorators of their view
+    functions/methods, and the components and tags registered to `spec`. It's considerably cheaper to compute than the spec
+    itself, so it's used to check whether an artifact written by :func:`write_artifact` is still up to date.
+
+    Args:
+        spec: The spec that the paths would be created for
+        framework_obj: The object corresponding to the framework being used. Accepts the same objects as
+            :meth:`~specargs.WebargsAPISpec.create_paths`
+    '''
+    route_views = get_backend(spec.backend).route_views
+    digest = hashlib.sha256()
+
+    def update(data: Any):
+        digest.update(json.dumps(data, sort_keys=True, default=repr).encode() + b"\n")
+
+    update([
+        __version__,
+        [spec.title, spec.version, str(spec.openapi_version), spec.options],
+        spec.components.to_dict(),
+        spec._tags,
+    ])
+    # Each route is hashed as it's fingerprinted since building one large structure triggers costly garbage collection
+    for route, view in route_views(framework_obj): update([route, _view_fingerprint(view)])
+    return digest.hexdigest()
+
+
+def write_artifact(spec: "WebargsAPISpec", framework_obj: Any, path: str, *, processes: Optional[int] = None):
+    '''Creates the paths of `framework_obj` in `spec` and writes the resulting spec to an artifact file
+
+    The first line of the artifact is a JSON object containing the artifact format version, the :func:`fingerprint`
+    of `spec` and `framework_obj`, and a SHA-256 hash of the spec. The rest of the artifact is the spec as JSON, which
+    is stored exactly as output by :meth:`~specargs.WebargsAPISpec.render` so it can be served without being parsed.
+
+    Args:
+        spec: The spec to create paths in
+        framework_obj: The object corresponding to the framework being used. Accepts the same objects as
+            :meth:`~specargs.WebargsAPISpec.create_paths`
+        path: The path of the artifact file
+        processes: The same as the `processes` argument of :meth:`~specargs.WebargsAPISpec.create_paths`
+    '''
+    spec.create_paths(framework_obj, processes=processes)
+    rendered = spec.render("json")
+    header = {
+        "artifact_version": ARTIFACT_VERSION,
+        "fingerprint": fingerprint(spec, framework_obj),
+        "spec_sha256": rendered.etag,
+    }
+    with open(path, "wb") as artifact_file:
+        artifact_file.write(json.dumps(header).encode() + b"\n")
+        artifact_file.write(rendered.body)
+
+
+def read_artifact(spec: "WebargsAPISpec", framework_obj: Any, path: str) -> Optional["RenderedSpec"]:
+    '''Reads the spec from an artifact written by :func:`write_artifact` if it's still up to date
+
+    Args:
+        spec: The spec the artifact is being loaded for
+        framework_obj: The object corresponding to the framework being used. Accepts the same objects as
+            :meth:`~specargs.WebargsAPISpec.create_paths`
+        path: The path of the artifact file
+
+    Returns:
+        The spec stored in the artifact as JSON, or `None` if the artifact doesn't exist, isn't valid, or its
+        fingerprint no longer matches `spec` and `framework_obj`
+    '''
+    from .apispec import RenderedSpec
+    try:
+        with open(path, "rb") as artifact_file:
+            header = json.loads(artifact_file.readline())
+            body = artifact_file.read()
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(header, dict) or header.get("artifact_version") != ARTIFACT_VERSION: return None
+    if header.get("fingerprint") != fingerprint(spec, framework_obj): return None
+    rendered = RenderedSpec(body, "application/json")
+    return rendered if rendered.etag == header.get("spec_sha256") else None
@@ -4,6 +4,7 @@ from typing import Any, Dict, Union, TYPE_CHECKING, Type
 from attrs import define, field, frozen
 from cattrs import GenConverter
 from marshmallow import Schema, fields
+from webargs import core
 
 
 if TYPE_CHECKING:
@@ -27,8 +28,8 @@ def ensure_schema_or_inpoly(argpoly: Union[ArgMap, InPoly]) -> Union[Schema, InP
     '''Produces a marshmallow `Schema` or an :class:`InPoly` from the input if possible
 
     `Schema` and :class:`InPoly` instances are returned immediately. Dictionaries mapping names to marshmallow `Field`
-    instances are converted into `Schema` instances using the webargs `parser`. `Schema` classes are called to produce
-    `Schema` instances. All other objects raise a `TypeError`.
+    instances are converted into `Schema` instances using the default schema class of webargs parsers. `Schema`
+    classes are called to produce `Schema` instances. All other objects raise a `TypeError`.
 
     Args:
         argpoly: The object from which to produce a `Schema` or :class:`InPoly` instance
@@ -37,8 +38,18 @@ def ensure_schema_or_inpoly(argpoly: Union[ArgMap, InPoly]) -> Union[Schema, InP
         :exc:`TypeError`: If given an object from which a `Schema` or :class:`InPoly` instance cannot be produced
     '''
     from .in_poly import InPoly
-    from .framework import parser
     if isinstance(argpoly, Schema) or isinstance(argpoly, InPoly): return argpoly
-    if isinstance(argpoly, dict): return parser.schema_class.from_dict(argpoly)()
+    # Every framework's parser uses the same schema class, so dictionaries don't require a backend to be selected
+    if isinstance(argpoly, dict): return core.Parser.DEFAULT_SCHEMA_CLASS.from_dict(argpoly)()
     if isinstance(argpoly, type(Schema)): return argpoly()
     raise TypeError(f"Unable to produce Schema or InPoly from {argpoly}!")
+
+
+def default_schema_name(schema_class: Type[Schema]) -> str:
+    '''Produces the default OpenAPI schema name of a marshmallow `Schema` class
+
+    The name is the class name with 'Schema' removed from the end unless the class name is 'Schema'
+    '''
+    schema_name = schema_class.__name__
+    if schema_name.endswith("Schema"): schema_name = schema_name[:-6] or schema_name
+    return schema_name
@@ -1,45 +1,166 @@
+import asyncio
+import contextvars
 import functools
 from http import HTTPStatus
-from typing import Any, Callable, Optional, Union, Tuple
+import inspect
+import time
+from types import ModuleType
+from typing import Any, Callable, Iterable, Iterator, Optional, Union, Tuple
 
 from marshmallow import Schema
-from webargs import fields
+from webargs import core, fields
 
+from . import encoding, framework, instrumentation
 from .common import ArgMap, Webargs
 from .view_response import ViewResponse
-from .framework import parser, make_response
 from .in_poly import InPoly
 from .oas import ensure_response, Response
 
 
-def use_args(argpoly: Union[ArgMap, InPoly], *args, location: str = parser.DEFAULT_LOCATION, **kwargs) -> Callable[..., Callable]:
+#: The :func:`use_args` locations that are loaded from the request body
+BODY_LOCATIONS = ("json", "json_or_form")
+
+
+def use_args(
+    argpoly: Union[ArgMap, InPoly],
+    *args,
+    location: str = core.Parser.DEFAULT_LOCATION,
+    offload_threshold: Optional[int] = None,
+    backend: Optional[Union[framework.Framework, str]] = None,
+    **kwargs
+) -> Callable[..., Callable]:
     '''A wrapper around webargs' :meth:`~webargs.core.Parser.use_args` decorator function
 
     This attaches attributes to the wrapped view function that are later used to populate the operation data for the
-    generated API spec.
+    generated API spec. Coroutine functions (`async def` views) are wrapped in coroutine functions.
     
     Args:
         argpoly: A dictionary of :mod:`webargs.fields`, a :class:`marshmallow.Schema` instance or class, or an object that inherits from
             :class:`~in_poly.InPoly` to be used for request argument parsing
         *args: Any other positional arguments accepted by webargs' :meth:`~webargs.core.Parser.use_args`
         location: Identical to the `location` argument of webargs' :meth:`~webargs.core.Parser.use_args`
+        offload_threshold: If provided, requests to a coroutine function whose body is at least this many bytes are
+            parsed in the event loop's default executor rather than on the event loop itself. Useful for large bodies,
+            particularly with an :class:`~in_poly.InPoly` which loads the body with each of its schemas
+        backend: The framework of the view function/method, as a :class:`~specargs.framework.Framework` or its value
+            (e.g. `"flask"`). Defaults to the active framework
         **kwargs: Any other keyword arguments accepted by webargs' :meth:`~webargs.core.Parser.use_args`
 
     Raises:
-        ValueError: If `argmap` is an :class:`~in_poly.InPoly` object and `location` is anything besides `"json"`
+        ValueError: If `argmap` is an :class:`~in_poly.InPoly` object and `location` is anything besides `"json"`, or
+            if `offload_threshold` is provided for a view function/method that isn't a coroutine function
     '''
-    if isinstance(argpoly, InPoly) and location != "json":
-        raise ValueError("OneOf, AnyOf, and AllOf are only compatible with json body parameters!")
+    if isinstance(argpoly, InPoly):
+        if location != "json":
+            raise ValueError("OneOf, AnyOf, and AllOf are only compatible with json body parameters!")
+        # Use the `unknown` behavior of the InPoly unless one is given explicitly
+        kwargs.setdefault("unknown", None)
 
     def decorator(func):
+        backend_module = framework.get_backend(backend)
+        is_async = inspect.iscoroutinefunction(func)
+        if offload_threshold is not None and not is_async:
+            raise ValueError(f"offload_threshold requires '{func.__qualname__}' to be a coroutine function!")
+
+        route = _route_name(func)
+        argmap = argpoly
+        if isinstance(argpoly, InPoly):
+            # webargs loads request data with whatever a callable argmap returns. Returning the InPoly itself means the
+            # data loaded while selecting member schemas is passed to the view rather than being loaded a second time
+            argmap = lambda _: argpoly if not instrumentation.observers else _ObservedInPoly(argpoly, route)
+        dispatches = not getattr(func, IS_SPECARGS_WRAPPER, False)
         func.webargs = getattr(func, "webargs", [])
         func.webargs.append(Webargs(argpoly, location))
-        inner_decorator = parser.use_args(argpoly, *args, location = location, **kwargs)
-        return inner_decorator(func)
+
+        @functools.wraps(func)
+        def parsed(*args, **kwargs):
+            # Called by webargs once the request has been parsed. Coroutine functions only create their coroutine here,
+            # so they're dispatched once the coroutine is awaited by the async wrapper
+            if not instrumentation.observers: return func(*args, **kwargs)
+            start = instrumentation.parse_start.get()
+            if start is not None:
+                instrumentation.record(instrumentation.PARSE, route, start, time.perf_counter_ns())
+                instrumentation.parse_start.set(None)
+            if dispatches and not is_async:
+                return instrumentation.observe(instrumentation.DISPATCH, route, func, *args, **kwargs)
+            return func(*args, **kwargs)
+
+        inner_decorator = backend_module.parser.use_args(argmap, *args, location = location, **kwargs)
+        parse = inner_decorator(parsed)
+
+        if is_async:
+            # Frameworks that can only read request bodies asynchronously receive the body before it's parsed
+            receive_request_body = backend_module.receive_request_body if location in BODY_LOCATIONS else None
+
+            @functools.wraps(parse)
+            async def wrapper(*args, **kwargs):
+                if receive_request_body is not None:
+                    await receive_request_body(_view_request(backend_module, func, args, kwargs))
+                observed = bool(instrumentation.observers)
+                call = functools.partial(_observed_parse if observed else _parse, route, parse, args, kwargs)
+                if (
+                    offload_threshold is not None
+                    and _content_length(backend_module, func, args, kwargs) >= offload_threshold
+                ):
+                    # The context is copied so the framework's request and the instrumentation state are available
+                    loop = asyncio.get_running_loop()
+                    coroutine = await loop.run_in_executor(None, contextvars.copy_context().run, call)
+                else:
+                    coroutine = call()
+
+                if observed and dispatches:
+                    return await instrumentation.observe_async(instrumentation.DISPATCH, route, coroutine)
+                return await coroutine
+        else:
+            @functools.wraps(parse)
+            def wrapper(*args, **kwargs):
+                if not instrumentation.observers: return parse(*args, **kwargs)
+                return _observed_parse(route, parse, args, kwargs)
+
+        setattr(wrapper, IS_SPECARGS_WRAPPER, True)
+        return wrapper
 
     return decorator
 
 
+def _parse(route: str, parse: Callable, args: tuple, kwargs: dict) -> Any:
+    return parse(*args, **kwargs)
+
+
+def _observed_parse(route: str, parse: Callable, args: tuple, kwargs: dict) -> Any:
+    token = instrumentation.parse_start.set(time.perf_counter_ns())
+    try:
+        return parse(*args, **kwargs)
+    except BaseException as error:
+        # The start time is only still set if the error was raised while parsing rather than by the view
+        start = instrumentation.parse_start.get()
+        if start is not None:
+            instrumentation.record(instrumentation.PARSE, route, start, time.perf_counter_ns(), error)
+        raise
+    finally:
+        instrumentation.parse_start.reset(token)
+
+
+def _view_request(backend_module: ModuleType, func: Callable, args: tuple, kwargs: dict) -> Any:
+    parser = backend_module.parser
+    return parser.get_default_request() or parser.get_request_from_view_args(func, args, kwargs)
+
+
+def _content_length(backend_module: ModuleType, func: Callable, args: tuple, kwargs: dict) -> int:
+    request = _view_request(backend_module, func, args, kwargs)
+    return backend_module.get_content_length(request) if request is not None else 0
+
+
+class _ObservedInPoly:
+    '''Records the loading of request data by an :class:`~in_poly.InPoly` as the validate phase'''
+    def __init__(self, inpoly: InPoly, route: str):
+        self.inpoly = inpoly
+        self.route = route
+
+    def load(self, data: Any, **kwargs) -> Any:
+        return instrumentation.observe(instrumentation.VALIDATE, self.route, self.inpoly.load, data, **kwargs)
+
+
 def use_kwargs(*args, **kwargs) -> Callable[..., Callable]:
     '''A decorator equivalent to :func:`use_args` with the keyword argument `as_kwargs` set to `True`'''
     return use_args(*args, as_kwargs=True, **kwargs)
@@ -59,17 +180,80 @@ class UnregisteredResponseCodeError(Exception):
     pass
 
 
+#: Set on the view function/method wrappers produced by :func:`use_args` and :func:`use_response`
+IS_SPECARGS_WRAPPER = "is_specargs_wrapper"
+
+
+def _route_name(func: Callable) -> str:
+    # Views aren't necessarily functions, e.g. they may be callable objects or partials
+    return f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', type(func).__qualname__)}"
+
+
 def _get_response_data_and_status(data: Any, default_status: HTTPStatus) -> Tuple[Any, HTTPStatus]:
     if isinstance(data, ViewResponse):
         return data.data, data.status_code
     return data, default_status
 
 
-def _dump_response_schema(obj: Any, schema: Optional[Union[Schema, InPoly, fields.Field]]):
-    is_list_tuple_or_set = any(isinstance(obj, type_) for type_ in (list, tuple, set))
-    if isinstance(schema, Schema) or isinstance(schema, InPoly): return schema.dump(obj, many=is_list_tuple_or_set)
-    if isinstance(schema, fields.Field): return schema.serialize("unused", obj, lambda o, *_: o)
-    if schema is None: return ""
+def _item_count(data: Any) -> int:
+    return len(data) if isinstance(data, (list, tuple, set)) else 1
+
+
+def _response_dumper(schema: Optional[Union[Schema, InPoly, fields.Field]]) -> Callable[[Any], Any]:
+    '''Produces a function that serializes view function/method return data using the given response schema'''
+    if isinstance(schema, (Schema, InPoly)):
+        dump = schema.dump
+        return lambda obj: dump(obj, many=isinstance(obj, (list, tuple, set)))
+    if isinstance(schema, fields.Field):
+        serialize = schema.serialize
+        return lambda obj: serialize("unused", obj, lambda o, *_: o)
+    return lambda _: ""
+
+
+def _json_content_type(response: Response) -> Optional[str]:
+    if response.schema is None: return None
+    content_type = next(iter(response.content), None)
+    return content_type if content_type == "application/json" else None
+
+
+#: The media types of the formats accepted by the `stream` argument of :func:`use_response`
+STREAM_CONTENT_TYPES = {"json": "application/json", "ndjson": "application/x-ndjson"}
+
+
+def _stream_chunks(dump: Callable[[Any], Any], objs: Iterable, stream: str) -> Iterator[bytes]:
+    encode = encoding.get_json_encoder()
+    if stream == "ndjson":
+        for obj in objs: yield encode(dump(obj)) + b"\n"
+        return
+
+    separator = b"["
+    for obj in objs:
+        yield separator + encode(dump(obj))
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+
+def _response_maker(
+    response: Response, stream: Optional[str], backend_module: ModuleType = framework
+) -> Callable[[Any, HTTPStatus], Any]:
+    '''Produces a function that creates the framework response for view function/method return data'''
+    if stream:
+        make_streaming_response = backend_module.make_streaming_response
+        dump = response.schema.dump
+        content_type = STREAM_CONTENT_TYPES[stream]
+        return lambda data, status: make_streaming_response(_stream_chunks(dump, data, stream), status, content_type)
+
+    make_response = backend_module.make_response
+    dumper = _response_dumper(response.schema)
+    json_content_type = _json_content_type(response)
+    if not json_content_type: return lambda data, status: make_response(dumper(data), status)
+
+    def make_json_response(data: Any, status: HTTPStatus):
+        json_encoder = encoding.json_encoder
+        if json_encoder: return make_response(json_encoder(dumper(data)), status, json_content_type)
+        return make_response(dumper(data), status)
+
+    return make_json_response
 
 
 def use_response(
@@ -77,6 +261,9 @@ def use_response(
     *,
     status_code: Union[HTTPStatus, int] = HTTPStatus.OK,
     description: str = "",
+    stream: Optional[str] = None,
+    offload_threshold: Optional[int] = None,
+    backend: Optional[Union[framework.Framework, str]] = None,
     **headers: str
 ) -> Callable[..., Callable]:
     '''A decorator function used for registering a response to a view function/method
@@ -90,10 +277,22 @@ def use_response(
             as the status code for the decorated view function/method response. Defaults to `http.HTTPStatus.OK`
         description: The response description. Defaults to an empty string. Ignored if `response_or_argpoly` is an
             :class:`oas.Response` object
+        stream: If provided, the iterable returned by the decorated view function/method is serialized one item at a
+            time and sent as a streaming response as it's serialized. Either `"json"` for a JSON array or `"ndjson"`
+            for newline delimited JSON. Only supported for :class:`marshmallow.Schema` and :class:`~in_poly.InPoly`
+            responses
+        offload_threshold: If provided, data returned by a coroutine function that holds at least this many items
+            (a single object counts as one item) is serialized in the event loop's default executor rather than on the
+            event loop itself, so that large responses don't block other requests
+        backend: The framework of the view function/method, as a :class:`~specargs.framework.Framework` or its value
+            (e.g. `"flask"`). Defaults to the active framework
         **headers: Any keyword arguments not listed above are taken as response header names and values. Ignored if
             `response_or_argpoly` is an :class:`oas.Response` object
 
     Raises:
+        :exc:`ValueError`: If `stream` is not a supported format or is provided for a response without a
+            :class:`marshmallow.Schema` or :class:`~in_poly.InPoly`, or if `offload_threshold` is provided for a view
+            function/method that isn't a coroutine function
         :exc:`DuplicateResponseCodeError`: If a status code is registered to the same view function/method more than
             once
         :exc:`UnregisteredResponseCodeError`: If the status code of a :class:`~specargs.Response` returned by a view
@@ -101,8 +300,17 @@ def use_response(
     '''
     if isinstance(status_code, int): status_code = HTTPStatus(status_code)
     response = ensure_response(response_or_argpoly, description=description, headers=headers)
+    if stream is not None:
+        if stream not in STREAM_CONTENT_TYPES:
+            raise ValueError(f"Unsupported stream format '{stream}'! Must be one of {', '.join(STREAM_CONTENT_TYPES)}.")
+        if not isinstance(response.schema, (Schema, InPoly)):
+            raise ValueError("Only Schema and InPoly responses can be streamed!")
 
     def decorator(func):
+        backend_module = framework.get_backend(backend)
+        if offload_threshold is not None and not inspect.iscoroutinefunction(func):
+            raise ValueError(f"offload_threshold requires '{func.__qualname__}' to be a coroutine function!")
+
         func.responses = getattr(func, "responses", {})
         if status_code in func.responses:
             raise DuplicateResponseCodeError(
@@ -110,25 +318,65 @@ def use_response(
             )
 
         func.responses[status_code] = response
+        # Response makers are built once per status code so a response only requires a lookup and a call
+        makers = func.response_makers = getattr(func, "response_makers", {})
+        makers[status_code] = _response_maker(response, stream, backend_module)
 
         is_resp_wrapper = "is_resp_wrapper"
         if getattr(func, is_resp_wrapper, False): func = func.__wrapped__
+        route = _route_name(func)
+        dispatches = not getattr(func, IS_SPECARGS_WRAPPER, False)
+        send_response = backend_module.send_response
 
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            view_data = func(*args, **kwargs)
-            response_data, response_status = _get_response_data_and_status(view_data, status_code)
-
+        def make(response_data: Any, response_status: HTTPStatus, observed: bool) -> Any:
             try:
-                schema = func.responses[response_status].schema
+                maker = makers[response_status]
             except KeyError:
                 raise UnregisteredResponseCodeError(
                     f"Status code '{response_status}' has not been registered to '{func.__qualname__}'!"
                 )
 
-            return make_response(_dump_response_schema(response_data, schema), response_status)
+            if observed: return instrumentation.observe(instrumentation.DUMP, route, maker, response_data, response_status)
+            return maker(response_data, response_status)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                observed = bool(instrumentation.observers)
+                if observed and dispatches:
+                    view_data = await instrumentation.observe_async(
+                        instrumentation.DISPATCH, route, func(*args, **kwargs)
+                    )
+                else:
+                    view_data = await func(*args, **kwargs)
+
+                response_data, response_status = _get_response_data_and_status(view_data, status_code)
+                if offload_threshold is not None and _item_count(response_data) >= offload_threshold:
+                    # The context is copied so the framework's request and the instrumentation state are available
+                    loop = asyncio.get_running_loop()
+                    response = await loop.run_in_executor(
+                        None, contextvars.copy_context().run, make, response_data, response_status, observed
+                    )
+                else:
+                    response = make(response_data, response_status, observed)
+
+                sent = send_response(response, args)
+                return await sent if inspect.isawaitable(sent) else sent
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                observed = bool(instrumentation.observers)
+                if observed and dispatches:
+                    view_data = instrumentation.observe(instrumentation.DISPATCH, route, func, *args, **kwargs)
+                else:
+                    view_data = func(*args, **kwargs)
+
+                response_data, response_status = _get_response_data_and_status(view_data, status_code)
+                return send_response(make(response_data, response_status, observed), args)
 
         setattr(wrapper, is_resp_wrapper, True)
+        setattr(wrapper, IS_SPECARGS_WRAPPER, True)
+        wrapper.response_makers = makers
         return wrapper
 
     return decorator
@@ -0,0 +1,174 @@
+import dataclasses
+import datetime
+import decimal
+import email.utils
+import json
+import uuid
+from typing import Any, Callable, Optional, Union
+
+from webargs import core
+
+
+JSONEncoder = Callable[[Any], bytes]
+JSONDecoder = Callable[[Union[bytes, str]], Any]
+
+
+def _default(obj: Any) -> Any:
+    '''Converts objects that JSON libraries can't encode the way Flask's JSON encoder does'''
+    if isinstance(obj, datetime.date):
+        # Dates are formatted as HTTP dates, with naive datetimes taken as UTC
+        if not isinstance(obj, datetime.datetime): obj = datetime.datetime.combine(obj, datetime.time())
+        if obj.tzinfo is None: obj = obj.replace(tzinfo=datetime.timezone.utc)
+        return email.utils.format_datetime(obj.astimezone(datetime.timezone.utc), usegmt=True)
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)): return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type): return dataclasses.asdict(obj)
+    if hasattr(obj, "__html__"): return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_encoder() -> JSONEncoder:
+    encoder = json.JSONEncoder(separators=(",", ":"), default=_default)
+    return lambda obj: encoder.encode(obj).encode()
+
+
+def _orjson_encoder() -> JSONEncoder:
+    import orjson
+    # orjson formats datetimes itself unless they're passed through to `default`
+    return lambda obj: orjson.dumps(obj, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+
+
+def _ujson_encoder() -> JSONEncoder:
+    import ujson
+    return lambda obj: ujson.dumps(obj, escape_forward_slashes=False, default=_default).encode()
+
+
+# Listed from fastest to slowest for automatic selection
+_ENCODER_FACTORIES = {"orjson": _orjson_encoder, "ujson": _ujson_encoder, "json": _json_encoder}
+
+#: The function used to encode JSON response data into the response body. `None` leaves encoding to the framework
+json_encoder: Optional[JSONEncoder] = None
+
+_stdlib_json_encoder = _json_encoder()
+
+
+def get_json_encoder() -> JSONEncoder:
+    '''Returns :data:`json_encoder`, or an encoder based on the `json` module if it is not set'''
+    return json_encoder or _stdlib_json_encoder
+
+
+def set_json_encoder(encoder: Optional[Union[str, JSONEncoder]] = "auto"):
+    '''Sets the function used to encode JSON response data serialized by :func:`~specargs.use_response`
+
+    By default, serialized response data is handed to the framework to be encoded. Once an encoder is set, responses
+    with JSON content are encoded into bytes by **specargs** instead, using the content type of the corresponding
+    :class:`~specargs.Response`.
+
+    Args:
+        encoder: The name of a JSON library (`"orjson"`, `"ujson"`, or `"json"`), `"auto"` to use the fastest of these
+            libraries that is installed, a function that encodes an object into JSON bytes, or `None` to leave encoding
+            to the framework. Defaults to `"auto"`. The named libraries encode dates, UUIDs, decimals, and dataclasses
+            as Flask's JSON encoder does, except ujson, which encodes decimals as numbers
+
+    Raises:
+        :exc:`ValueError`: If `encoder` is not a supported library name
+        :exc:`ImportError`: If the named library is not installed
+    '''
+    global json_encoder
+    if encoder is None or callable(encoder):
+        json_encoder = encoder
+        return
+
+    if encoder == "auto":
+        for factory in _ENCODER_FACTORIES.values():
+            try: json_encoder = factory()
+            except ImportError: continue
+            return
+
+    try:
+        factory = _ENCODER_FACTORIES[encoder]
+    except KeyError:
+        raise ValueError(f"Unsupported JSON encoder '{encoder}'! Must be one of {', '.join(_ENCODER_FACTORIES)}.")
+    json_encoder = factory()
+
+
+def _orjson_decoder() -> JSONDecoder:
+    import orjson
+    return orjson.loads
+
+
+def _ujson_decoder() -> JSONDecoder:
+    import ujson
+    return ujson.loads
+
+
+# Listed from fastest to slowest for automatic selection. The `json` decoder is the one used by webargs
+_DECODER_FACTORIES = {"orjson": _orjson_decoder, "ujson": _ujson_decoder, "json": lambda: core.parse_json}
+
+#: The function used to decode JSON request bodies
+json_decoder: JSONDecoder = core.parse_json
+
+
+def set_json_decoder(decoder: Union[str, JSONDecoder] = "auto"):
+    '''Sets the function used to decode JSON request bodies
+
+    Request bodies are decoded once per request and shared between webargs and the schema selection of
+    :class:`~specargs.OneOf`, :class:`~specargs.AnyOf`, and :class:`~specargs.AllOf` objects.
+
+    Args:
+        decoder: The name of a JSON library (`"orjson"`, `"ujson"`, or `"json"`), `"auto"` to use the fastest of these
+            libraries that is installed, or a function that decodes JSON bytes into an object. Defaults to `"auto"`
+
+    Raises:
+        :exc:`ValueError`: If `decoder` is not a supported library name
+        :exc:`ImportError`: If the named library is not installed
+    '''
+    global json_decoder
+    if callable(decoder):
+        json_decoder = decoder
+        return
+
+    if decoder == "auto":
+        for factory in _DECODER_FACTORIES.values():
+            try: json_decoder = factory()
+            except ImportError: continue
+            return
+
+    try:
+        factory = _DECODER_FACTORIES[decoder]
+    except KeyError:
+        raise ValueError(f"Unsupported JSON decoder '{decoder}'! Must be one of {', '.join(_DECODER_FACTORIES)}.")
+    json_decoder = factory()
+
+
+#: The attribute of framework request objects that their decoded JSON body is cached in
+REQUEST_BODY_ATTRIBUTE = "_specargs_json_body"
+
+_uncached = object()
+
+
+def decode_request_body(request: Any, read_body: Callable[[], Union[bytes, str]]) -> Any:
+    '''Decodes the JSON body of a request with :data:`json_decoder`, caching it on the request object
+
+    Args:
+        request: The framework request object
+        read_body: A function that returns the raw body of `request`
+
+    Raises:
+        :exc:`json.JSONDecodeError`: If the body is not valid JSON. Errors raised by other JSON libraries are converted
+            so that webargs handles them as it would its own
+    '''
+    body = getattr(request, REQUEST_BODY_ATTRIBUTE, _uncached)
+    if body is not _uncached: return body
+
+    raw_body = read_body()
+    try:
+        body = json_decoder(raw_body)
+    except ValueError as e:
+        document = raw_body.decode(errors="replace") if isinstance(raw_body, bytes) else raw_body
+        # Errors are only passed on as is if they carry the body, as webargs treats errors for an empty document as a
+        # missing body. orjson, for one, gives an empty document for bodies that aren't valid UTF-8
+        if isinstance(e, json.JSONDecodeError) and e.doc == document: raise
+        raise json.JSONDecodeError(str(e), document, 0) from e
+
+    setattr(request, REQUEST_BODY_ATTRIBUTE, body)
+    return body
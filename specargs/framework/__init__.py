@@ -1,6 +1,10 @@
 from enum import Enum
+import importlib
+import importlib.util
 import os
-import pkgutil
+import sys
+from types import ModuleType
+from typing import Union
 
 import webargs
 
@@ -9,6 +13,7 @@ class Framework(Enum):
     DJANGO = "django"
     TORNADO = "tornado"
     BOTTLE = "bottle"
+    STARLETTE = "starlette"
 
 
 class MissingFrameworkError(Exception):
@@ -17,19 +22,45 @@ class MissingFrameworkError(Exception):
 
 
 class MultipleFrameworkError(Exception):
-    '''Raised when the project environment has installed multiple supported frameworks'''
+    '''Raised when the active framework is needed but the project environment has installed multiple supported
+    frameworks and none of them has been selected'''
     pass
 
 
-INSTALLED_MODULES = {module.name for module in pkgutil.iter_modules()}
+#: The environment variable that, when set to a :class:`Framework` value (e.g. `"flask"`), selects the active framework
+#: without probing the environment for installed frameworks
+FRAMEWORK_ENV_VAR = "SPECARGS_FRAMEWORK"
+
+#: The names provided by every framework module, which are imported from the active framework module on first access
+FRAMEWORK_ATTRIBUTES = (
+    "make_response", "make_streaming_response", "send_response", "get_request_body", "receive_request_body",
+    "get_content_length", "create_paths", "add_spec_route", "route_views", "WebargsPlugin", "parser"
+)
+
+
+def _is_installed(module_name: str) -> bool:
+    return importlib.util.find_spec(module_name) is not None
 
 
 def _determine_framework():
+    configured_framework = os.environ.get(FRAMEWORK_ENV_VAR)
+    if configured_framework:
+        try:
+            return Framework(configured_framework.lower())
+        except ValueError:
+            raise MissingFrameworkError(
+                f"'{configured_framework}' set by {FRAMEWORK_ENV_VAR} is not a supported framework! Must be one of "
+                f"{', '.join(framework.value for framework in Framework)}."
+            )
+
     active_framework = None
     for framework in Framework:
-        if framework.value in INSTALLED_MODULES:
+        if _is_installed(framework.value):
             if active_framework:
-                raise MultipleFrameworkError("Multiple frameworks in the environment is not currently supported!")
+                raise MultipleFrameworkError(
+                    f"Multiple frameworks are installed! Either set {FRAMEWORK_ENV_VAR} or select the backend of each "
+                    "WebargsAPISpec and decorator explicitly."
+                )
             active_framework = framework
 
     if not active_framework:
@@ -38,18 +69,55 @@ def _determine_framework():
     return active_framework
 
 
-FRAMEWORK = _determine_framework() if not os.environ.get("ASWA_DOCS", False) else None
-if not FRAMEWORK:
+def get_backend(framework: Union[Framework, str, None] = None) -> ModuleType:
+    '''Returns the module of a supported framework, which provides the names listed in :data:`FRAMEWORK_ATTRIBUTES`
+
+    Framework modules are only imported once they're requested, so a process can use any number of the installed
+    frameworks as long as each of them is selected explicitly.
+
+    Args:
+        framework: A :class:`Framework` or its value (e.g. `"flask"`). If `None`, this module is returned, which
+            provides the names of the active framework's module once they're first accessed
+
+    Raises:
+        :exc:`MissingFrameworkError`: If `framework` is not a supported framework
+    '''
+    if framework is None: return sys.modules[__name__]
+    try:
+        framework = Framework(framework.lower() if isinstance(framework, str) else framework)
+    except ValueError:
+        raise MissingFrameworkError(
+            f"'{framework}' is not a supported framework! Must be one of "
+            f"{', '.join(supported.value for supported in Framework)}."
+        )
+    return importlib.import_module(f".{framework.value}", __name__)
+
+
+def __getattr__(name: str):
+    # The active framework is only determined once it's needed, so processes that select every backend explicitly
+    # never require it
+    if name == "FRAMEWORK":
+        active_framework = globals()["FRAMEWORK"] = _determine_framework()
+        return active_framework
+
+    if name not in FRAMEWORK_ATTRIBUTES: raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    # The framework module, and by extension the framework itself, is only imported once one of its names is needed
+    framework_module = get_backend(__getattr__("FRAMEWORK"))
+    globals().update({attribute: getattr(framework_module, attribute) for attribute in FRAMEWORK_ATTRIBUTES})
+    return globals()[name]
+
+
+if os.environ.get("ASWA_DOCS", False):
+    FRAMEWORK = None
     parser = webargs.core.Parser()
     make_response = lambda: None
+    make_streaming_response = make_response
+    send_response = make_response
     get_request_body = make_response
+    get_content_length = make_response
+    receive_request_body = None
     create_paths = get_request_body
+    add_spec_route = create_paths
+    route_views = create_paths
     from ..plugin import WebargsPlugin
-elif FRAMEWORK == Framework.FLASK:
-    from .flask import make_response, get_request_body, create_paths, WebargsPlugin, parser
-elif FRAMEWORK == Framework.DJANGO:
-    from .django import make_response, get_request_body, create_paths, WebargsPlugin, parser
-elif FRAMEWORK == Framework.TORNADO:
-    from .tornado import make_response, get_request_body, create_paths, WebargsPlugin, parser
-elif FRAMEWORK == Framework.BOTTLE:
-    from .bottle import make_response, get_request_body, create_paths, WebargsPlugin, parser
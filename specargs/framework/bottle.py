@@ -1,30 +1,168 @@
+import re
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
 from apispec_webframeworks.bottle import BottlePlugin
-from webargs.bottleparser import parser
+import bottle
+from bottle import BaseRequest, Bottle, HTTPResponse, Route
+from webargs import bottleparser, core
 
+from .. import encoding, parallel
 from ..plugin import WebargsPlugin
 
 
-def get_request_body(request):
-    raise NotImplementedError("Bottle is not currently supported")
+# The HTTP methods that operations are documented for
+_OPERATION_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE")
+
+
+def get_request_body(request: BaseRequest):
+    # Attributes set on bottle requests are stored in the request's environ, so the body is cached per request
+    return encoding.decode_request_body(request, lambda: request.body.read())
+
+
+class BottleParser(bottleparser.BottleParser):
+    '''A webargs parser that shares the JSON body decoded by :func:`get_request_body`'''
+    def _raw_load_json(self, req: BaseRequest):
+        if not core.is_json(req.content_type): return core.missing
+        data = get_request_body(req)
+        # As with bottle's own JSON parsing, a body of "null" can't be told apart from an empty body
+        return core.missing if data is None else data
+
+
+parser = BottleParser()
+
+
+def get_content_length(request: BaseRequest) -> int:
+    return max(request.content_length, 0)
+
+
+# Request bodies can be read synchronously, so they don't have to be received before they're parsed
+receive_request_body = None
+
+
+def _walk_routes(app: Bottle, prefix: str = "") -> Iterator[Tuple[str, Route]]:
+    for route in app.routes:
+        mounted_app = route.config.get("mountpoint.target")
+        if isinstance(mounted_app, Bottle):
+            # Each mounted application is registered under two rules, with and without a trailing slash
+            if route.rule.endswith("<:re:.*>"):
+                yield from _walk_routes(mounted_app, prefix + route.config["mountpoint.prefix"].rstrip("/"))
+        else:
+            yield prefix + route.rule, route
+
+
+def _routes(framework_obj: Bottle) -> Iterator[Tuple[str, Route]]:
+    '''Yields the full rule and route of each route of `framework_obj` that requests can be dispatched to'''
+    if not isinstance(framework_obj, Bottle):
+        raise TypeError("The provided object is not of type `bottle.Bottle`!")
+
+    # Bottle replaces the target of a rule and method that's registered again, so only the last route is reachable
+    routes: Dict[Tuple[str, str], Tuple[str, Route]] = {}
+    for rule, route in _walk_routes(framework_obj): routes[rule, route.method] = rule, route
+    yield from routes.values()
+
+
+def create_paths(self, framework_obj: Bottle, processes: Optional[int] = None):
+    routes = []
+    for rule, route in _routes(framework_obj):
+        if route.method not in _OPERATION_METHODS: continue
+        path_key = (framework_obj, rule, route.method)
+        if self.created_paths.get(path_key) is not route.callback: routes.append((path_key, rule, route))
+
+    def create_path(index: int):
+        _, rule, route = routes[index]
+        self.path(view=route.callback, app=framework_obj, route=route, rule=rule)
+
+    if processes and processes > 1 and len(routes) > 1 and parallel.is_supported():
+        self.clear_rendered()
+        parallel.create_paths(self, create_path, len(routes), processes)
+    else:
+        for index in range(len(routes)): create_path(index)
+
+    for path_key, _, route in routes: self.created_paths[path_key] = route.callback
+
+
+def route_views(framework_obj: Bottle) -> Iterator[Tuple[str, Callable]]:
+    for rule, route in _routes(framework_obj): yield f"{route.method} {rule}", route.callback
+
+
+def add_spec_route(self, framework_obj: Bottle, rule: str, format: str):
+    if not isinstance(framework_obj, Bottle):
+        raise TypeError("The provided object is not of type `bottle.Bottle`!")
+
+    def spec_view():
+        rendered = self.render(format)
+        etag = f'"{rendered.etag}"'
+        if_none_match = bottle.request.get_header("If-None-Match", "")
+        if if_none_match == "*" or etag in (tag.strip() for tag in if_none_match.split(",")):
+            return HTTPResponse(status=304, headers={"ETag": etag})
+        return HTTPResponse(rendered.body, headers={"Content-Type": rendered.content_type, "ETag": etag})
+
+    framework_obj.route(rule, "GET", spec_view, name=f"specargs_{format}_spec")
+
+
+def make_response(data, status_code, content_type=None):
+    # Bottle only serializes dictionaries itself, so data that isn't already encoded is encoded as JSON here
+    if isinstance(data, (bytes, str)):
+        return HTTPResponse(data, status_code, {"Content-Type": content_type} if content_type else None)
+    body = encoding.get_json_encoder()(data)
+    return HTTPResponse(body, status_code, {"Content-Type": content_type or "application/json"})
+
+
+def make_streaming_response(chunks, status_code, content_type):
+    return HTTPResponse(chunks, status_code, {"Content-Type": content_type})
+
+
+def send_response(response, view_args):
+    return response
+
+
+# Matches the wildcards of bottle rules, e.g. "<user_id:int>" or "<name:re:[a-z]+>"
+_WILDCARD = re.compile(
+    r"<(?P<name>[a-zA-Z_][a-zA-Z_0-9]*)?(?::(?P<filter>[a-zA-Z_]*)(?::(?P<config>(?:\\.|[^\\>])+)?)?)?>"
+)
+
 
+def _schema_data_from_wildcard(wildcard: re.Match, route: Route) -> Dict[str, Union[str, int]]:
+    filter, config = wildcard["filter"], wildcard["config"]
+    if not filter: return {"type": "string", "minLength": 1}
+    if filter == "int": return {"type": "integer"}
+    if filter == "float": return {"type": "number"}
+    if filter == "path": return {"type": "string", "format": "url"}
+    if filter == "re": return {"type": "string", "pattern": f"^{config}$"}
+    # Custom filters can only be described by the regex they match
+    regex = route.app.router.filters[filter](config)[0]
+    return {"type": "string", "pattern": f"^{regex}$"}
 
-def create_paths(self, framework_obj):
-    raise NotImplementedError("Bottle is not currently supported")
 
+def _path_and_parameters_from_rule(rule: str, route: Route) -> Tuple[str, List[dict]]:
+    parameters: List[dict] = []
+    for wildcard in _WILDCARD.finditer(rule):
+        # Anonymous wildcards aren't passed to the view, so they aren't parameters
+        if not wildcard["name"]: continue
+        param_dict = {"name": wildcard["name"], "in": "path", "required": True}
+        param_dict["schema"] = _schema_data_from_wildcard(wildcard, route)
+        parameters.append(param_dict)
 
-def make_response(data, status_code):
-    raise NotImplementedError("Bottle is not currently supported")
+    return BottlePlugin.bottle_path_to_openapi(rule), parameters
 
 
 class BottleWebargsPlugin(WebargsPlugin, BottlePlugin):
     def __init__(self):
-        raise NotImplementedError("Bottle is not currently supported")
+        super().__init__()
+        self.route_by_view: Dict[Callable, Route] = {}
 
-    def path_helper(self, operations, parameters, *, view, app=None, **kwargs):
-        raise NotImplementedError("Bottle is not currently supported")
+    def path_helper(self, operations, parameters, *, view, app=None, route=None, rule=None, **kwargs):
+        # Searching the app for the view's route is only required when the route isn't provided
+        if route is None: route = self._route_for_view(app or bottle.default_app(), view)
+        self.route_by_view[view] = route
+        path, path_parameters = _path_and_parameters_from_rule(rule or route.rule, route)
+        parameters.extend(path_parameters)
+        return path
 
-    def operation_helper(self, operations, *, view, **kwargs):
-        raise NotImplementedError("Bottle is not currently supported")
+    def operation_helper(self, operations, *, view, route=None, **kwargs):
+        if route is None: route = self.route_by_view[view]
+        if route.method in _OPERATION_METHODS:
+            self._update_operations(operations, view=view, method_name=route.method.lower())
 
 
 WebargsPlugin = BottleWebargsPlugin
@@ -1,33 +1,227 @@
-# TODO: Add support for Django
-import json
+import re
+from types import ModuleType
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
-from django.http import HttpRequest
-from webargs.djangoparser import parser
+from apispec.exceptions import APISpecError
+from django import urls
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.urls import converters
+from django.urls.resolvers import RegexPattern, RoutePattern, URLPattern, URLResolver
+from django.views.decorators.http import condition, require_GET
+from webargs import core, djangoparser
 
+from .. import encoding, parallel
 from ..plugin import WebargsPlugin
 
 
+#: The patterns leading from the root URL resolver to a view, i.e. the nested resolvers followed by the view's pattern
+Patterns = Tuple[Union[URLResolver, URLPattern], ...]
+
+# The HTTP methods that operations are documented for
+_OPERATION_METHODS = ("get", "post", "put", "patch", "delete")
+
+# The webargs locations that are parsed from the request body
+_BODY_LOCATIONS = ("json", "json_or_form", "form", "files")
+
+
 def get_request_body(request: HttpRequest):
-    return json.loads(request.body)
+    return encoding.decode_request_body(request, lambda: request.body)
+
+
+class DjangoParser(djangoparser.DjangoParser):
+    '''A webargs parser that shares the JSON body decoded by :func:`get_request_body`'''
+    def _raw_load_json(self, req: HttpRequest):
+        if not djangoparser.is_json_request(req): return core.missing
+        return get_request_body(req)
+
+
+parser = DjangoParser()
+
+
+def get_content_length(request: HttpRequest) -> int:
+    return int(request.META.get("CONTENT_LENGTH") or 0)
+
+
+# Request bodies can be read synchronously, so they don't have to be received before they're parsed
+receive_request_body = None
+
+
+def _resolver(framework_obj: Union[URLResolver, ModuleType, str]) -> URLResolver:
+    if isinstance(framework_obj, URLResolver): return framework_obj
+    if isinstance(framework_obj, (ModuleType, str)): return urls.get_resolver(framework_obj)
+    raise TypeError("The provided object is not of type `django.urls.URLResolver` or a URLconf module!")
+
+
+def _walk_patterns(url_patterns: Sequence, prefix: Patterns = ()) -> Iterator[Tuple[Patterns, Callable]]:
+    for pattern in url_patterns:
+        if isinstance(pattern, URLResolver): yield from _walk_patterns(pattern.url_patterns, (*prefix, pattern))
+        else: yield (*prefix, pattern), pattern.callback
+
+
+def _route(patterns: Patterns) -> str:
+    return "".join(str(pattern.pattern) for pattern in patterns)
+
+
+def _routes(resolver: URLResolver) -> Iterator[Tuple[str, Patterns, Callable]]:
+    '''Yields the route, patterns and view of each URL pattern of `resolver` that requests can be dispatched to'''
+    seen = set()
+    for patterns, view in _walk_patterns(resolver.url_patterns):
+        route = _route(patterns)
+        # Django dispatches to the first matching pattern, so any later pattern with the same route is unreachable
+        if route in seen: continue
+        seen.add(route)
+        yield route, patterns, view
+
+
+def create_paths(self, framework_obj: Union[URLResolver, ModuleType, str], processes: Optional[int] = None):
+    resolver = _resolver(framework_obj)
+
+    routes = []
+    for route, patterns, view in _routes(resolver):
+        path_key = (resolver, route)
+        if self.created_paths.get(path_key) is not view: routes.append((path_key, view, patterns))
+
+    def create_path(index: int):
+        _, view, patterns = routes[index]
+        self.path(view=view, app=resolver, patterns=patterns)
 
+    if processes and processes > 1 and len(routes) > 1 and parallel.is_supported():
+        self.clear_rendered()
+        parallel.create_paths(self, create_path, len(routes), processes)
+    else:
+        for index in range(len(routes)): create_path(index)
 
-def create_paths(self, framework_obj):
-    raise NotImplementedError("Django is currently not supported!")
+    for path_key, view, _ in routes: self.created_paths[path_key] = view
 
 
-def make_response(data, status_code):
-    raise NotImplementedError("Django is currently not supported!")
+def route_views(framework_obj: Union[URLResolver, ModuleType, str]) -> Iterator[Tuple[str, Callable]]:
+    for route, _, view in _routes(_resolver(framework_obj)): yield route, view
+
+
+def add_spec_route(self, framework_obj: Union[URLResolver, ModuleType, str], rule: str, format: str):
+    resolver = _resolver(framework_obj)
+
+    @require_GET
+    @condition(etag_func=lambda request: self.render(format).etag)
+    def spec_view(request: HttpRequest):
+        rendered = self.render(format)
+        return HttpResponse(rendered.body, content_type=rendered.content_type)
+
+    # The URLconf's list of patterns is extended in place so that it's also used by resolvers created after this one
+    resolver.url_patterns.append(urls.path(rule.lstrip("/"), spec_view, name=f"specargs_{format}_spec"))
+    urls.clear_url_caches()
+
+
+def make_response(data, status_code, content_type=None):
+    # Django doesn't serialize response data itself, so data that isn't already encoded is encoded as JSON here
+    if isinstance(data, (bytes, str)): return HttpResponse(data, status=status_code, content_type=content_type)
+    body = encoding.get_json_encoder()(data)
+    return HttpResponse(body, status=status_code, content_type=content_type or "application/json")
+
+
+def make_streaming_response(chunks, status_code, content_type):
+    return StreamingHttpResponse(chunks, status=status_code, content_type=content_type)
+
+
+def send_response(response, view_args):
+    return response
+
+
+# Matches the parameters of `django.urls.path` routes, e.g. "<int:user_id>"
+_ROUTE_PARAMETER = re.compile(r"<(?:[^>:]+:)?(?P<parameter>[^>]+)>")
+# Matches the named groups of `django.urls.re_path` regexes, allowing for one level of nested groups
+_REGEX_GROUP = re.compile(r"\(\?P<(?P<parameter>\w+)>(?P<regex>(?:[^()]|\([^()]*\))*)\)")
+
+
+def _schema_data_from_converter(converter) -> Dict[str, Union[str, int]]:
+    if isinstance(converter, converters.IntConverter): return {"type": "integer", "minimum": 0}
+    if isinstance(converter, converters.UUIDConverter): return {"type": "string", "format": "uuid"}
+    if isinstance(converter, converters.PathConverter): return {"type": "string", "format": "url"}
+    if isinstance(converter, converters.SlugConverter): return {"type": "string", "pattern": f"^{converter.regex}$"}
+    if isinstance(converter, converters.StringConverter): return {"type": "string", "minLength": 1}
+    # Custom converters can only be described by the regex they match
+    return {"type": "string", "pattern": f"^{converter.regex}$"}
+
+
+def _path_parameter(name: str, schema: dict) -> dict:
+    return {"name": name, "in": "path", "required": True, "schema": schema}
+
+
+def _path_and_parameters_from_patterns(patterns: Patterns) -> Tuple[str, List[dict]]:
+    path = ""
+    parameters: List[dict] = []
+    for url_pattern in patterns:
+        pattern = url_pattern.pattern
+        if isinstance(pattern, RoutePattern):
+            path += _ROUTE_PARAMETER.sub(r"{\g<parameter>}", str(pattern))
+            parameters += [
+                _path_parameter(name, _schema_data_from_converter(converter))
+                for name, converter in pattern.converters.items()
+            ]
+        elif isinstance(pattern, RegexPattern):
+            regex = str(pattern)
+            parameters += [
+                _path_parameter(match["parameter"], {"type": "string", "pattern": f"^{match['regex']}$"})
+                for match in _REGEX_GROUP.finditer(regex)
+            ]
+            regex = _REGEX_GROUP.sub(r"{\g<parameter>}", regex).lstrip("^")
+            if regex.endswith("\\Z"): regex = regex[:-2]
+            path += re.sub(r"\\(.)", r"\1", regex.rstrip("$"))
+        else:
+            path += str(pattern)
+
+    return f"/{path}", parameters
+
+
+def _function_view_methods(view: Callable) -> List[str]:
+    '''The methods of a function view, given by its `http_method_names` attribute like those of class-based views
+
+    Without that attribute, views that parse a request body are taken to handle POST, and other views GET.
+    '''
+    http_method_names = getattr(view, "http_method_names", None)
+    if http_method_names is not None:
+        return [method.lower() for method in http_method_names if method.lower() in _OPERATION_METHODS]
+    if any(webargs.location in _BODY_LOCATIONS for webargs in getattr(view, "webargs", ())): return ["post"]
+    return ["get"]
 
 
 class DjangoWebargsPlugin(WebargsPlugin):
     def __init__(self):
-        raise NotImplementedError("Django is not currently supported")
+        super().__init__()
+        self.patterns_by_view: Dict[Callable, Patterns] = {}
+        # The patterns of the views of each URL resolver, which is only built when a path's patterns aren't provided
+        self._view_patterns_index: Dict[URLResolver, Dict[Callable, Patterns]] = {}
+
+    def _patterns_for_view(self, view: Callable, app: Union[URLResolver, ModuleType, str, None]) -> Patterns:
+        resolver = _resolver(app if app is not None else urls.get_resolver())
+        index = self._view_patterns_index.get(resolver)
+        if index is None:
+            index = self._view_patterns_index[resolver] = {}
+            for _, patterns, route_view in _routes(resolver): index.setdefault(route_view, patterns)
+
+        try:
+            return index[view]
+        except KeyError:
+            raise APISpecError(f"Could not find a URL pattern for view '{view.__qualname__}'!")
 
-    def path_helper(self, operations, parameters, *, view, app=None, **kwargs):
-        raise NotImplementedError("Django is not currently supported")
+    def path_helper(self, operations, parameters, *, view, app=None, patterns=None, **kwargs):
+        # Searching the URL resolver for the view's patterns is only required when the patterns aren't provided
+        if patterns is None: patterns = self._patterns_for_view(view, app)
+        self.patterns_by_view[view] = patterns
+        path, path_parameters = _path_and_parameters_from_patterns(patterns)
+        parameters.extend(path_parameters)
+        return path
 
     def operation_helper(self, operations, *, view, **kwargs):
-        raise NotImplementedError("Django is not currently supported")
+        view_class = getattr(view, "view_class", None)
+        if view_class is not None:
+            for method_name in view_class.http_method_names:
+                # Only the handler methods that the class-based view defines are documented
+                if method_name not in _OPERATION_METHODS or not hasattr(view_class, method_name): continue
+                self._update_operations(operations, view=getattr(view_class, method_name), method_name=method_name)
+        else:
+            for method_name in _function_view_methods(view):
+                self._update_operations(operations, view=view, method_name=method_name)
 
 
 WebargsPlugin = DjangoWebargsPlugin
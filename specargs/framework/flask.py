@@ -1,31 +1,101 @@
-from typing import Dict, List, Union
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from apispec_webframeworks.flask import FlaskPlugin
 from werkzeug import routing
-from webargs.flaskparser import parser
+from webargs import core, flaskparser
 
-from flask import Request, Flask
+from flask import Request, Flask, request, stream_with_context
+from flask import Response as FlaskResponse
 from flask.views import MethodView
 
+from .. import encoding, parallel
 from ..plugin import WebargsPlugin
 
 
 def get_request_body(request: Request):
-    return request.json
+    return encoding.decode_request_body(request, lambda: request.get_data(cache=True))
 
 
-def create_paths(self, framework_obj: Flask):
+class FlaskParser(flaskparser.FlaskParser):
+    '''A webargs parser that shares the JSON body decoded by :func:`get_request_body`'''
+    def _raw_load_json(self, req: Request):
+        if not flaskparser.is_json_request(req): return core.missing
+        return get_request_body(req)
+
+
+parser = FlaskParser()
+
+
+def get_content_length(request: Request) -> int:
+    return request.content_length or 0
+
+
+# Request bodies can be read synchronously, so they don't have to be received before they're parsed
+receive_request_body = None
+
+
+def create_paths(self, framework_obj: Flask, processes: Optional[int] = None):
+    if not isinstance(framework_obj, Flask):
+        raise TypeError("The provided object is not of type `flask.Flask`!")
+
+    # The url map is indexed once rather than searched for each view function
+    rules_by_endpoint: Dict[str, List[routing.Rule]] = {}
+    for rule in framework_obj.url_map.iter_rules(): rules_by_endpoint.setdefault(rule.endpoint, []).append(rule)
+
+    routes = []
+    for endpoint, view_func in framework_obj.view_functions.items():
+        for rule in rules_by_endpoint.get(endpoint, ()):
+            path_key = (framework_obj, endpoint, rule.rule, frozenset(rule.methods or ()))
+            if self.created_paths.get(path_key) is not view_func: routes.append((path_key, view_func, rule))
+
+    def create_path(index: int):
+        _, view_func, rule = routes[index]
+        self.path(view=view_func, app=framework_obj, rule=rule)
+
+    if processes and processes > 1 and len(routes) > 1 and parallel.is_supported():
+        self.clear_rendered()
+        parallel.create_paths(self, create_path, len(routes), processes)
+    else:
+        for index in range(len(routes)): create_path(index)
+
+    for path_key, view_func, _ in routes: self.created_paths[path_key] = view_func
+
+
+def route_views(framework_obj: Flask) -> Iterator[Tuple[str, Callable]]:
+    if not isinstance(framework_obj, Flask):
+        raise TypeError("The provided object is not of type `flask.Flask`!")
+
+    for rule in framework_obj.url_map.iter_rules():
+        view_func = framework_obj.view_functions.get(rule.endpoint)
+        if view_func is not None: yield f"{','.join(sorted(rule.methods or ()))} {rule.rule}", view_func
+
+
+def add_spec_route(self, framework_obj: Flask, rule: str, format: str):
     if not isinstance(framework_obj, Flask):
         raise TypeError("The provided object is not of type `flask.Flask`!")
 
-    for view_func in framework_obj.view_functions.values():
-        self.path(view=view_func, app=framework_obj)
+    def spec_view():
+        rendered = self.render(format)
+        response = FlaskResponse(rendered.body, content_type=rendered.content_type)
+        response.set_etag(rendered.etag)
+        return response.make_conditional(request)
 
+    framework_obj.add_url_rule(rule, endpoint=f"specargs_{format}_spec", view_func=spec_view, methods=["GET"])
 
-def make_response(data, status_code):
+
+def make_response(data, status_code, content_type=None):
+    if content_type: return data, status_code, {"Content-Type": content_type}
     return data, status_code
 
 
+def make_streaming_response(chunks, status_code, content_type):
+    return FlaskResponse(stream_with_context(chunks), status=status_code, content_type=content_type)
+
+
+def send_response(response, view_args):
+    return response
+
+
 def _schema_data_from_converter(converter: routing.BaseConverter) -> Dict[str, Union[str, int, List[str]]]:
     if isinstance(converter, routing.UnicodeConverter):
         param_type = "string"
@@ -74,15 +144,17 @@ class FlaskWebargsPlugin(WebargsPlugin, FlaskPlugin):
         super().__init__()
         self.rule_by_view = {}
 
-    def path_helper(self, operations, parameters, *, view, app=None, **kwargs):
-        rule = self.rule_by_view[view] = self._rule_for_view(view, app=app)
+    def path_helper(self, operations, parameters, *, view, app=None, rule=None, **kwargs):
+        # Searching the app for the view's rule is only required when the rule isn't provided
+        if rule is None: rule = self._rule_for_view(view, app=app)
+        self.rule_by_view[view] = rule
         parameters.extend(_parameters_data_from_rule(rule))
-        # An empty dict is passed into the operations argument to circumvent FlaskPlugin's operations changes
-        return super().path_helper(operations={}, view=view, app=app, **kwargs)
+        # FlaskPlugin's path helper is bypassed as it searches the app for the rule again and changes operations
+        return self.flaskpath2openapi(rule.rule)
 
-    def operation_helper(self, operations, *, view, **kwargs):
+    def operation_helper(self, operations, *, view, rule=None, **kwargs):
         """Path helper that allows passing a view function."""
-        rule = self.rule_by_view[view]
+        if rule is None: rule = self.rule_by_view[view]
         if hasattr(view, "view_class") and issubclass(view.view_class, MethodView):
             for method in view.methods:
                 # Check if method was registered in view but not in rule
@@ -0,0 +1,236 @@
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from apispec.exceptions import APISpecError
+from starlette.applications import Starlette
+from starlette.convertors import (
+    Convertor, FloatConvertor, IntegerConvertor, PathConvertor, StringConvertor, UUIDConvertor
+)
+from starlette.endpoints import HTTPEndpoint
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import BaseRoute, Host, Mount, Route, Router
+from webargs import core
+
+from .. import encoding, parallel
+from ..plugin import WebargsPlugin
+
+
+# The HTTP methods that operations are documented for
+_OPERATION_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE")
+
+# The attribute of requests that their raw body is stored in by :func:`receive_request_body`
+_RAW_BODY_ATTRIBUTE = "_specargs_raw_body"
+
+
+def _raw_body(request: Request) -> bytes:
+    try:
+        return getattr(request, _RAW_BODY_ATTRIBUTE)
+    except AttributeError:
+        raise RuntimeError(
+            "Starlette request bodies can only be read asynchronously, so they can only be parsed for async endpoints!"
+        )
+
+
+def get_request_body(request: Request):
+    return encoding.decode_request_body(request, lambda: _raw_body(request))
+
+
+async def receive_request_body(request: Request):
+    # Starlette requests are read asynchronously, while webargs and InPoly objects parse them synchronously. The body is
+    # therefore received before parsing, after which it's decoded once by `get_request_body`
+    if not hasattr(request, _RAW_BODY_ATTRIBUTE): setattr(request, _RAW_BODY_ATTRIBUTE, await request.body())
+
+
+class StarletteParser(core.Parser):
+    '''A webargs parser for Starlette requests, whose JSON body is the one decoded by :func:`get_request_body`'''
+    __location_map__ = dict(path_params="load_path_params", **core.Parser.__location_map__)
+
+    def _raw_load_json(self, req: Request):
+        content_type = req.headers.get("Content-Type")
+        if content_type is None or not core.is_json(content_type): return core.missing
+        return get_request_body(req)
+
+    def load_querystring(self, req: Request, schema):
+        return self._makeproxy(req.query_params, schema)
+
+    def load_headers(self, req: Request, schema):
+        return self._makeproxy(req.headers, schema)
+
+    def load_cookies(self, req: Request, schema):
+        return req.cookies
+
+    def load_path_params(self, req: Request, schema):
+        return req.path_params
+
+    def handle_error(self, error, req, schema, *, error_status_code, error_headers):
+        # Starlette responds with the detail of HTTP exceptions as text, so the messages are encoded as JSON text
+        detail = encoding.get_json_encoder()(error.messages).decode()
+        raise HTTPException(error_status_code or self.DEFAULT_VALIDATION_STATUS, detail=detail, headers=error_headers)
+
+    def get_request_from_view_args(self, view, args, kwargs):
+        # Endpoint functions are given the request first, while the methods of endpoint classes are given it after self
+        return args[0] if isinstance(args[0], Request) else args[1]
+
+
+parser = StarletteParser()
+
+
+def get_content_length(request: Request) -> int:
+    return int(request.headers.get("Content-Length") or 0)
+
+
+def _router(framework_obj: Union[Starlette, Router]) -> Router:
+    if isinstance(framework_obj, Starlette): return framework_obj.router
+    if isinstance(framework_obj, Router): return framework_obj
+    raise TypeError(
+        "The provided object is not of type `starlette.applications.Starlette` or `starlette.routing.Router`!"
+    )
+
+
+#: The path format and parameter convertors of the mounts leading to a route
+Prefix = Tuple[str, Dict[str, Convertor]]
+
+
+def _walk_routes(routes: List[BaseRoute], prefix: Prefix = ("", {})) -> Iterator[Tuple[Prefix, Route]]:
+    for route in routes:
+        if isinstance(route, Route):
+            yield prefix, route
+        elif isinstance(route, Mount):
+            # Mounts match the rest of the path with a "path" parameter, which is part of the mounted routes' paths
+            convertors = {name: convertor for name, convertor in route.param_convertors.items() if name != "path"}
+            mount_prefix = (prefix[0] + route.path_format[:-len("/{path}")], {**prefix[1], **convertors})
+            yield from _walk_routes(route.routes, mount_prefix)
+        elif isinstance(route, Host):
+            yield from _walk_routes(route.routes, prefix)
+
+
+def _route_methods(route: Route) -> List[str]:
+    if route.methods is not None: return [method for method in _OPERATION_METHODS if method in route.methods]
+    # Endpoint classes handle each method that they implement
+    endpoint = route.endpoint
+    if isinstance(endpoint, type) and issubclass(endpoint, HTTPEndpoint):
+        return [method for method in _OPERATION_METHODS if hasattr(endpoint, method.lower())]
+    return list(_OPERATION_METHODS)
+
+
+def _routes(framework_obj: Union[Starlette, Router]) -> Iterator[Tuple[str, Prefix, Route]]:
+    '''Yields the path, mount prefix and route of each route of `framework_obj` that requests can be dispatched to'''
+    seen = set()
+    for prefix, route in _walk_routes(_router(framework_obj).routes):
+        path = prefix[0] + route.path_format
+        # Starlette dispatches to the first matching route, so any later route with the same path and methods is
+        # unreachable
+        key = (path, frozenset(route.methods or ()))
+        if key in seen: continue
+        seen.add(key)
+        yield path, prefix, route
+
+
+def create_paths(self, framework_obj: Union[Starlette, Router], processes: Optional[int] = None):
+    routes = []
+    for path, prefix, route in _routes(framework_obj):
+        # Routers compare by their routes, so they aren't hashable and are identified by their id instead
+        path_key = (id(framework_obj), path, frozenset(route.methods or ()))
+        if self.created_paths.get(path_key) is not route.endpoint: routes.append((path_key, prefix, route))
+
+    def create_path(index: int):
+        _, prefix, route = routes[index]
+        self.path(view=route.endpoint, app=framework_obj, route=route, prefix=prefix)
+
+    if processes and processes > 1 and len(routes) > 1 and parallel.is_supported():
+        self.clear_rendered()
+        parallel.create_paths(self, create_path, len(routes), processes)
+    else:
+        for index in range(len(routes)): create_path(index)
+
+    for path_key, _, route in routes: self.created_paths[path_key] = route.endpoint
+
+
+def route_views(framework_obj: Union[Starlette, Router]) -> Iterator[Tuple[str, Callable]]:
+    for path, _, route in _routes(framework_obj):
+        endpoint = route.endpoint
+        is_endpoint_class = isinstance(endpoint, type) and issubclass(endpoint, HTTPEndpoint)
+        for method in _route_methods(route):
+            yield f"{method} {path}", getattr(endpoint, method.lower()) if is_endpoint_class else endpoint
+
+
+def add_spec_route(self, framework_obj: Union[Starlette, Router], rule: str, format: str):
+    router = _router(framework_obj)
+
+    async def spec_endpoint(request: Request) -> Response:
+        rendered = self.render(format)
+        etag = f'"{rendered.etag}"'
+        if_none_match = request.headers.get("If-None-Match", "")
+        if if_none_match == "*" or etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(rendered.body, media_type=rendered.content_type, headers={"ETag": etag})
+
+    router.routes.append(Route(rule, spec_endpoint, methods=["GET"], name=f"specargs_{format}_spec"))
+
+
+def make_response(data, status_code, content_type=None):
+    # Starlette doesn't serialize response data itself, so data that isn't already encoded is encoded as JSON here
+    if isinstance(data, (bytes, str)): return Response(data, status_code, media_type=content_type)
+    return Response(encoding.get_json_encoder()(data), status_code, media_type=content_type or "application/json")
+
+
+def make_streaming_response(chunks, status_code, content_type):
+    return StreamingResponse(chunks, status_code, media_type=content_type)
+
+
+def send_response(response, view_args):
+    return response
+
+
+def _schema_data_from_convertor(convertor: Convertor) -> Dict[str, Union[str, int]]:
+    if isinstance(convertor, IntegerConvertor): return {"type": "integer", "minimum": 0}
+    if isinstance(convertor, FloatConvertor): return {"type": "number", "minimum": 0}
+    if isinstance(convertor, UUIDConvertor): return {"type": "string", "format": "uuid"}
+    if isinstance(convertor, PathConvertor): return {"type": "string", "format": "url"}
+    if isinstance(convertor, StringConvertor): return {"type": "string", "minLength": 1}
+    # Custom convertors can only be described by the regex they match
+    return {"type": "string", "pattern": f"^{convertor.regex}$"}
+
+
+def _parameters_data_from_convertors(convertors: Dict[str, Convertor]) -> List[dict]:
+    parameters: List[dict] = []
+    for name, convertor in convertors.items():
+        param_dict = {"name": name, "in": "path", "required": True}
+        param_dict["schema"] = _schema_data_from_convertor(convertor)
+        parameters.append(param_dict)
+
+    return parameters
+
+
+class StarletteWebargsPlugin(WebargsPlugin):
+    def __init__(self):
+        super().__init__()
+        self.route_by_view: Dict[Callable, Route] = {}
+
+    @staticmethod
+    def _route_for_view(view: Callable, app: Union[Starlette, Router, None]) -> Tuple[Prefix, Route]:
+        if app is None: raise APISpecError(f"The application of endpoint '{view.__qualname__}' must be provided!")
+        for _, prefix, route in _routes(app):
+            if route.endpoint is view: return prefix, route
+        raise APISpecError(f"Could not find a route for endpoint '{view.__qualname__}'!")
+
+    def path_helper(self, operations, parameters, *, view, app=None, route=None, prefix=None, **kwargs):
+        # Searching the app for the endpoint's route is only required when the route isn't provided
+        if route is None: prefix, route = self._route_for_view(view, app)
+        prefix_format, prefix_convertors = prefix or ("", {})
+        self.route_by_view[view] = route
+        parameters.extend(_parameters_data_from_convertors({**prefix_convertors, **route.param_convertors}))
+        return prefix_format + route.path_format
+
+    def operation_helper(self, operations, *, view, route=None, **kwargs):
+        if route is None: route = self.route_by_view[view]
+        is_endpoint_class = isinstance(view, type) and issubclass(view, HTTPEndpoint)
+        for method in _route_methods(route):
+            method_name = method.lower()
+            self._update_operations(
+                operations, view=getattr(view, method_name) if is_endpoint_class else view, method_name=method_name
+            )
+
+
+WebargsPlugin = StarletteWebargsPlugin
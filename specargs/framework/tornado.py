@@ -1,30 +1,253 @@
+import inspect
+import re
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+from apispec.exceptions import APISpecError
 from apispec_webframeworks.tornado import TornadoPlugin
-from webargs.tornadoparser import parser
+from attrs import frozen
+from tornado.concurrent import Future
+from tornado.httputil import HTTPServerRequest
+from tornado.routing import PathMatches, Rule
+from tornado.web import Application, RequestHandler
+from webargs import core, tornadoparser
 
+from .. import encoding, parallel
 from ..plugin import WebargsPlugin
 
 
-def get_request_body(request):
-    raise NotImplementedError("Tornado is not currently supported")
+# The HTTP methods that operations are documented for
+_OPERATION_METHODS = ("get", "post", "put", "patch", "delete")
+
+
+def get_request_body(request: HTTPServerRequest):
+    return encoding.decode_request_body(request, lambda: request.body)
+
+
+class TornadoParser(tornadoparser.TornadoParser):
+    '''A webargs parser that shares the JSON body decoded by :func:`get_request_body`'''
+    def _raw_load_json(self, req: HTTPServerRequest):
+        # The body is a future on streaming requests, which can't be decoded
+        if not tornadoparser.is_json_request(req) or isinstance(req.body, Future): return core.missing
+        return get_request_body(req)
+
+
+parser = TornadoParser()
+
+
+def get_content_length(request: HTTPServerRequest) -> int:
+    return int(request.headers.get("Content-Length") or 0)
+
+
+# Request bodies can be read synchronously, so they don't have to be received before they're parsed
+receive_request_body = None
+
+
+def _handler_rules(router) -> Iterator[Tuple[Rule, Type[RequestHandler]]]:
+    for rule in getattr(router, "rules", ()):
+        target = rule.target
+        if isinstance(target, type) and issubclass(target, RequestHandler):
+            if isinstance(rule.matcher, PathMatches): yield rule, target
+        else:
+            yield from _handler_rules(target)
+
+
+def _routes(framework_obj: Application) -> Iterator[Tuple[str, Rule, Type[RequestHandler]]]:
+    '''Yields the route, rule and handler class of each rule of `framework_obj` that requests can be dispatched to'''
+    if not isinstance(framework_obj, Application):
+        raise TypeError("The provided object is not of type `tornado.web.Application`!")
+
+    seen = set()
+    for rule, handler_class in _handler_rules(framework_obj.wildcard_router):
+        route = rule.matcher.regex.pattern
+        # Tornado dispatches to the first matching rule, so any later rule with the same route is unreachable
+        if route in seen: continue
+        seen.add(route)
+        yield route, rule, handler_class
+
+
+def _handler_methods(handler_class: Type[RequestHandler]) -> Iterator[Tuple[str, Callable]]:
+    '''Yields the names and functions of the HTTP method handlers that `handler_class` implements'''
+    for method_name in _OPERATION_METHODS:
+        method = getattr(handler_class, method_name)
+        if method is not getattr(RequestHandler, method_name): yield method_name, method
+
+
+def create_paths(self, framework_obj: Application, processes: Optional[int] = None):
+    routes = []
+    for route, rule, handler_class in _routes(framework_obj):
+        path_key = (framework_obj, route)
+        if self.created_paths.get(path_key) is not handler_class: routes.append((path_key, handler_class, rule))
+
+    def create_path(index: int):
+        _, handler_class, rule = routes[index]
+        self.path(view=handler_class, app=framework_obj, rule=rule)
+
+    if processes and processes > 1 and len(routes) > 1 and parallel.is_supported():
+        self.clear_rendered()
+        parallel.create_paths(self, create_path, len(routes), processes)
+    else:
+        for index in range(len(routes)): create_path(index)
+
+    for path_key, handler_class, _ in routes: self.created_paths[path_key] = handler_class
+
+
+def route_views(framework_obj: Application) -> Iterator[Tuple[str, Callable]]:
+    for route, _, handler_class in _routes(framework_obj):
+        for method_name, method in _handler_methods(handler_class): yield f"{method_name.upper()} {route}", method
+
 
+class _SpecHandler(RequestHandler):
+    '''Serves the output of :meth:`~specargs.WebargsAPISpec.render`'''
+    def initialize(self, spec, format: str):
+        self.spec = spec
+        self.format = format
 
-def create_paths(self, framework_obj):
-    raise NotImplementedError("Tornado is not currently supported")
+    def compute_etag(self) -> str:
+        # Tornado responds with 304 Not Modified when this matches the request's entity tag
+        return f'"{self.spec.render(self.format).etag}"'
 
+    def get(self):
+        rendered = self.spec.render(self.format)
+        self.set_header("Content-Type", rendered.content_type)
+        self.write(rendered.body)
 
-def make_response(data, status_code):
-    raise NotImplementedError("Tornado is not currently supported")
+
+def add_spec_route(self, framework_obj: Application, rule: str, format: str):
+    if not isinstance(framework_obj, Application):
+        raise TypeError("The provided object is not of type `tornado.web.Application`!")
+
+    framework_obj.wildcard_router.add_rules(
+        [(re.escape(rule), _SpecHandler, {"spec": self, "format": format}, f"specargs_{format}_spec")]
+    )
+
+
+@frozen
+class TornadoResponse:
+    '''A response created by :func:`make_response`, which is written to the request handler by :func:`send_response`'''
+    body: Union[bytes, str]
+    status_code: int
+    content_type: Optional[str] = None
+
+
+@frozen
+class TornadoStreamingResponse:
+    '''A response created by :func:`make_streaming_response`, which is written to the request handler by
+    :func:`send_response`'''
+    chunks: Iterator[bytes]
+    status_code: int
+    content_type: str
+
+
+def make_response(data, status_code, content_type=None):
+    # Tornado only serializes dictionaries itself, so data that isn't already encoded is encoded as JSON here
+    if isinstance(data, (bytes, str)): return TornadoResponse(data, status_code, content_type)
+    return TornadoResponse(encoding.get_json_encoder()(data), status_code, content_type or "application/json")
+
+
+def make_streaming_response(chunks, status_code, content_type):
+    return TornadoStreamingResponse(chunks, status_code, content_type)
+
+
+async def _write_chunks(handler: RequestHandler, chunks: Iterator[bytes]):
+    for chunk in chunks:
+        handler.write(chunk)
+        # Each chunk is sent before the next is serialized, so slow clients don't cause chunks to build up in memory
+        await handler.flush()
+    await handler.finish()
+
+
+def send_response(response, view_args):
+    # Tornado ignores the data returned by handler methods, so the response is written to the handler instead. The
+    # returned future is awaited by Tornado, which ensures the response has been sent before the request ends
+    handler: RequestHandler = view_args[0]
+    handler.set_status(response.status_code)
+    if response.content_type: handler.set_header("Content-Type", response.content_type)
+    if isinstance(response, TornadoStreamingResponse): return _write_chunks(handler, response.chunks)
+    # Empty bodies aren't written as Tornado doesn't allow any body for some status codes (e.g. 204 No Content)
+    return handler.finish(response.body or None)
+
+
+_NAMED_GROUP = re.compile(r"\(\?P<(?P<name>\w+)>")
+
+
+def _regex_groups(pattern: str) -> List[Tuple[int, int, Optional[str], str]]:
+    '''Finds the outermost capturing groups of a regex as their start, end, name (if named), and regex'''
+    groups = []
+    # The start, whether it's capturing, name and regex start of each group that's currently open
+    open_groups: List[Tuple[int, bool, Optional[str], int]] = []
+    index, in_set = 0, False
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            index += 2
+            continue
+
+        if in_set:
+            in_set = char != "]"
+        elif char == "[":
+            in_set = True
+        elif char == "(":
+            named = _NAMED_GROUP.match(pattern, index)
+            if named: open_groups.append((index, True, named["name"], named.end()))
+            else: open_groups.append((index, not pattern.startswith("(?", index), None, index + 1))
+        elif char == ")" and open_groups:
+            start, capturing, name, regex_start = open_groups.pop()
+            if capturing and not any(group[1] for group in open_groups):
+                groups.append((start, index + 1, name, pattern[regex_start:index]))
+        index += 1
+
+    return groups
+
+
+def _path_and_parameters_from_rule(rule: Rule, handler_class: Type[RequestHandler]) -> Tuple[str, List[dict]]:
+    pattern = rule.matcher.regex.pattern
+    groups = _regex_groups(pattern)
+
+    names = [name for _, _, name, _ in groups]
+    if not rule.matcher.regex.groupindex:
+        # Unnamed groups are passed to the handler methods positionally, so they're named after their parameters
+        method = next((method for _, method in _handler_methods(handler_class)), None)
+        method_parameters = list(inspect.signature(method).parameters)[1:] if method else []
+        names = [method_parameters[i] if i < len(method_parameters) else f"arg{i}" for i in range(len(groups))]
+
+    path, end = "", 0
+    for (start, group_end, _, _), name in zip(groups, names):
+        # Tornado ignores unnamed groups when a rule has named groups, so they're left as they are
+        path += pattern[end:start] + (f"{{{name}}}" if name else pattern[start:group_end])
+        end = group_end
+    path = re.sub(r"\\(.)", r"\1", (path + pattern[end:]).lstrip("^").rstrip("$"))
+    if path.count("/") > 1: path = path.rstrip("/?*")
+
+    parameters = [
+        {"name": name, "in": "path", "required": True, "schema": {"type": "string", "pattern": f"^{regex}$"}}
+        for (_, _, _, regex), name in zip(groups, names) if name
+    ]
+    return path, parameters
 
 
 class TornadoWebargsPlugin(WebargsPlugin, TornadoPlugin):
     def __init__(self):
-        raise NotImplementedError("Tornado is not currently supported")
+        super().__init__()
+        self.rule_by_view: Dict[Type[RequestHandler], Rule] = {}
+
+    @staticmethod
+    def _rule_for_view(view: Type[RequestHandler], app: Optional[Application]) -> Rule:
+        if app is None: raise APISpecError(f"The application of handler '{view.__qualname__}' must be provided!")
+        for _, rule, handler_class in _routes(app):
+            if handler_class is view: return rule
+        raise APISpecError(f"Could not find a rule for handler '{view.__qualname__}'!")
 
-    def path_helper(self, operations, parameters, *, view, app=None, **kwargs):
-        raise NotImplementedError("Tornado is not currently supported")
+    def path_helper(self, operations, parameters, *, view, app=None, rule=None, **kwargs):
+        # Searching the application for the handler's rule is only required when the rule isn't provided
+        if rule is None: rule = self._rule_for_view(view, app)
+        self.rule_by_view[view] = rule
+        path, path_parameters = _path_and_parameters_from_rule(rule, view)
+        parameters.extend(path_parameters)
+        return path
 
     def operation_helper(self, operations, *, view, **kwargs):
-        raise NotImplementedError("Tornado is not currently supported")
+        for method_name, method in _handler_methods(view):
+            self._update_operations(operations, view=method, method_name=method_name)
 
 
 WebargsPlugin = TornadoWebargsPlugin
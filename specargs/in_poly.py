@@ -1,12 +1,184 @@
 from abc import ABC, abstractclassmethod, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+import decimal
 import json
-from typing import Any, ClassVar, Tuple
+import math
+import threading
+import uuid
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, Iterable, Optional, Set, Tuple, Type, Union
 
-from attrs import define, field
-from marshmallow import Schema, EXCLUDE, ValidationError
+from attrs import define, field, validators
+from marshmallow import Schema, EXCLUDE, INCLUDE, RAISE, ValidationError, fields, missing
+from marshmallow.decorators import PRE_DUMP, PRE_LOAD, VALIDATES, VALIDATES_SCHEMA
+from marshmallow.utils import get_value
 
-from .common import ensure_schema_or_inpoly, con, ArgMap
-from .framework import get_request_body
+from .common import default_schema_name, ensure_schema_or_inpoly, con, ArgMap
+from . import framework
+
+
+def _load_to_dict(load: Any) -> dict:
+    if isinstance(load, dict): return load
+    return vars(load) if hasattr(load, "__dict__") else {s: getattr(load, s, None) for s in load.__slots__}
+
+
+def _has_key(obj: Any, key: str) -> bool:
+    # Uses marshmallow's default attribute lookup, which tries item access before falling back to `getattr`
+    return get_value(obj, key, missing) is not missing
+
+
+#: The types of the serialized values of the fields whose values are type checked by :func:`_structural_dump_check`.
+#: Only exact field classes are included as subclasses may serialize values differently
+_DUMP_VALUE_TYPES: Dict[Type[fields.Field], Union[type, Tuple[type, ...]]] = {
+    fields.String: str,
+    fields.Email: str,
+    fields.Url: str,
+    fields.Boolean: bool,
+}
+#: The number fields keyed to the functions that parse their values when they're serialized as strings
+_NUMBER_FIELDS: Dict[Type[fields.Number], Callable[[str], Any]] = {
+    fields.Integer: int,
+    fields.Float: float,
+    fields.Decimal: decimal.Decimal,
+}
+#: The fields that load any value, whose serialized values are therefore left unchecked
+_UNCHECKED_FIELDS = (fields.Raw, fields.Constant)
+#: The fields whose serialized values don't come from the object's attributes
+_ATTRIBUTELESS_FIELDS = (fields.Function, fields.Method, fields.Constant)
+
+
+def _is_mapping(value: Any) -> bool:
+    return isinstance(value, Mapping)
+
+
+def _list_check(item_check: Optional[Callable[[Any], bool]]) -> Callable[[Any], bool]:
+    if item_check is None: return lambda value: isinstance(value, list)
+    return lambda value: isinstance(value, list) and all(map(item_check, value))
+
+
+def _is_finite(value: Any) -> bool:
+    if isinstance(value, int): return True
+    if isinstance(value, decimal.Decimal): return value.is_finite()
+    return math.isfinite(value)
+
+
+def _number_check(field: fields.Number) -> Callable[[Any], bool]:
+    parse, allow_nan = _NUMBER_FIELDS[type(field)], getattr(field, "allow_nan", False)
+
+    def check(value: Any) -> bool:
+        if field.as_string:
+            if not isinstance(value, str): return False
+            try: value = parse(value)
+            except (ValueError, ArithmeticError): return False
+        elif isinstance(value, bool) or not isinstance(value, (int, float, decimal.Decimal)):
+            return False
+        return allow_nan or _is_finite(value)
+
+    return check
+
+
+class _UncheckableField(Exception):
+    '''Raised by :func:`_value_check` for fields whose serialized values can't be checked structurally'''
+    pass
+
+
+def _is_uuid(value: Any) -> bool:
+    if not isinstance(value, str): return False
+    try: uuid.UUID(value)
+    except ValueError: return False
+    return True
+
+
+def _item_check(field: Optional[fields.Field], seen: FrozenSet[type]) -> Optional[Callable[[Any], bool]]:
+    '''Produces a function that checks a possibly null serialized value of a field nested in another field, e.g. the
+    items of a `List` or the values of a `Dict`, or `None` if any value is valid, including a missing inner field
+    '''
+    if field is None: return None
+    value_check, allow_none = _value_check(field, seen), field.allow_none
+    if value_check is None: return None if allow_none else (lambda value: value is not None)
+    return lambda value: value_check(value) if value is not None else allow_none
+
+
+def _value_check(field: fields.Field, seen: FrozenSet[type]) -> Optional[Callable[[Any], bool]]:
+    '''Produces a function that checks a non-null serialized field value, or `None` if any value is valid
+
+    Raises:
+        :exc:`_UncheckableField`: If the field validates values in ways the check doesn't cover, e.g. the formats of
+            `DateTime` fields, the values of custom fields or field validators
+    '''
+    field_type = type(field)
+    if field.validators: raise _UncheckableField(field_type.__name__)
+    if field_type is fields.Nested:
+        schema = field.schema
+        if type(schema) in seen: item_check = _is_mapping
+        else: item_check = _structural_dump_check(schema, seen) or (lambda value: not schema.validate(value))
+        return _list_check(lambda item: item is not None and item_check(item)) if field.many else item_check
+    if field_type is fields.List: return _list_check(_item_check(field.inner, seen))
+    if field_type in (fields.Dict, fields.Mapping):
+        key_check, item_check = _item_check(field.key_field, seen), _item_check(field.value_field, seen)
+        return lambda value: isinstance(value, Mapping) and all(
+            (key_check is None or key_check(key)) and (item_check is None or item_check(item))
+            for key, item in value.items()
+        )
+    if field_type is fields.Tuple:
+        item_checks = [_item_check(tuple_field, seen) for tuple_field in field.tuple_fields]
+        return lambda value: isinstance(value, (list, tuple)) and len(value) == len(item_checks) and all(
+            item_check is None or item_check(item) for item_check, item in zip(item_checks, value)
+        )
+    if field_type in _NUMBER_FIELDS: return _number_check(field)
+
+    if field_type is fields.UUID: return _is_uuid
+    if field_type in _UNCHECKED_FIELDS: return None
+
+    value_types = _DUMP_VALUE_TYPES.get(field_type)
+    if value_types is None: raise _UncheckableField(field_type.__name__)
+    return lambda value: isinstance(value, value_types)
+
+
+def _structural_dump_check(schema: Schema, seen: FrozenSet[type] = frozenset()) -> Optional[Callable[[Any], bool]]:
+    '''Produces a function that checks whether serialization output would pass validation by the given schema
+
+    The check is based on the schema's fields rather than deserializing the output. It covers required keys, null
+    values, unknown keys, the types of values and non-finite numbers, descending into nested schemas and the keys,
+    values and items of `Dict`, `Mapping`, `List` and `Tuple` fields. Values are expected to be of the types their
+    fields serialize to, e.g. `"1"` is not accepted for an `Integer` field even though it can be loaded.
+
+    Returns:
+        The check, or `None` if the schema validates data in ways the check doesn't cover (e.g. field validators,
+        `validates`/`validates_schema` methods, pre-load processors, or fields whose values aren't type checked)
+    '''
+    if schema._has_processors(PRE_LOAD) or schema._has_processors(VALIDATES_SCHEMA) or schema._hooks[VALIDATES]:
+        return None
+
+    seen = seen | {type(schema)}
+    required_keys, value_checks = [], {}
+    for name, field in schema.load_fields.items():
+        key = name if field.data_key is None else field.data_key
+        if field.required: required_keys.append(key)
+        try: value_checks[key] = (field.allow_none, _value_check(field, seen))
+        except _UncheckableField: return None
+
+    def check(data: Any) -> bool:
+        # The `unknown` behavior is looked up on each check as it may be changed after the check is built, e.g. by OneOf
+        if not isinstance(data, Mapping) or any(key not in data for key in required_keys): return False
+        for key, value in data.items():
+            value_check = value_checks.get(key)
+            if value_check is None:
+                if schema.unknown == RAISE: return False
+            elif value is None:
+                if not value_check[0]: return False
+            elif value_check[1] and not value_check[1](value):
+                return False
+        return True
+
+    return check
+
+
+#: The ways in which :class:`InPoly` checks that serialization output is valid for the schema that produced it
+DUMP_VALIDATIONS = ("structural", "full")
+
+#: The default number of types whose matching :attr:`InPoly.schemas` are cached for serialization, which disables it
+DEFAULT_DUMP_CACHE_SIZE = 0
 
 
 @define
@@ -19,24 +191,70 @@ class InPoly(ABC):
     '''
     #: The marshmallow `Schema` instances that will be converted into members of the keyword and determine serialization and deserialization behavior
     schemas: Tuple[Schema] = field(converter=lambda objs: tuple(map(ensure_schema_or_inpoly, objs)))
-
-    def __init__(self, *argmaps: ArgMap):
+    #: Combined `Schema` instances keyed by the set of :attr:`schemas` they were merged from
+    _merged_schemas: Dict[FrozenSet[Schema], Schema] = field(init=False, factory=dict, eq=False, repr=False)
+    #: The maximum number of object types whose matching :attr:`schemas` are remembered when serializing
+    dump_cache_size: int = field(default=DEFAULT_DUMP_CACHE_SIZE, kw_only=True)
+    #: The members of :attr:`schemas` that serialized the last object of each type, least recently used first
+    _dump_cache: "OrderedDict[type, Tuple[Schema]]" = field(init=False, factory=OrderedDict, eq=False, repr=False)
+    _dump_cache_lock: threading.Lock = field(init=False, factory=threading.Lock, eq=False, repr=False)
+    #: How serialization output is checked against the schema that produced it. See :meth:`InPoly.__init__`
+    dump_validation: str = field(default="structural", kw_only=True, validator=validators.in_(DUMP_VALIDATIONS))
+    #: Structural checks of serialization output keyed by the members of :attr:`schemas` they can be used for
+    _dump_checks: Dict[Schema, Callable[[Any], bool]] = field(init=False, factory=dict, eq=False, repr=False)
+    #: The keys of the data loaded by each member of :attr:`schemas`, determined when they're first needed
+    _load_keys: Dict[Schema, FrozenSet[str]] = field(init=False, factory=dict, eq=False, repr=False)
+
+    def __init__(
+        self,
+        *argmaps: ArgMap,
+        dump_cache_size: int = DEFAULT_DUMP_CACHE_SIZE,
+        dump_validation: str = "structural",
+    ):
         '''Initializes an :class:`InPoly` instance
 
         Args:
             *argmaps: Dictionaries of marshmallow `Field` instances or marshmallow `Schema` instances or classes
                 provided as positional arguments. Converted into `Schema` instances and stored in :attr:`~specargs.in_poly.InPoly.schemas`
+            dump_cache_size: The maximum number of object types whose matching :attr:`schemas` are remembered when
+                serializing. Objects of a remembered type are serialized by those schemas directly rather than being
+                tried against every schema. Defaults to `0`, which disables this. Only enable it when objects of the
+                same type always match the same schemas, which doesn't hold for e.g. duck-typed objects or objects
+                whose optional attributes determine the matching schemas. Mappings such as dictionaries are never
+                remembered
+            dump_validation: How serialization output is checked against the schema that produced it to determine
+                whether the object is valid for that schema. `"structural"` checks the output's keys and value types
+                against the schema's fields, and falls back to `"full"` for schemas with validators, pre-load
+                processors, or fields whose values it can't check (e.g. `DateTime`). `"full"` validates the output with
+                the schema's `validate` method, which deserializes it
 
         Raises:
             :exc:`TypeError`: If any of the provided `argmaps` are :class:`~specargs.in_poly.InPoly` objects
+            :exc:`ValueError`: If `dump_validation` is neither `"structural"` nor `"full"`
         '''
         # TODO: Add support for nested `InPoly` objects
         if any(isinstance(schema, InPoly) for schema in argmaps):
             raise TypeError("Nested `InPoly` objects are not currently supported!")
-        self.__attrs_init__(argmaps)
+        self.__attrs_init__(argmaps, dump_cache_size=dump_cache_size, dump_validation=dump_validation)
 
     def __attrs_post_init__(self):
-        pass
+        self._determine_required_keys_to_schemas()
+        if self.dump_validation == "structural":
+            # Checks are built once as they're used for every serialized object
+            for schema in self.schemas:
+                check = _structural_dump_check(schema)
+                if check: self._dump_checks[schema] = check
+
+    def _valid_dump(self, schema: Schema, dump: Any) -> bool:
+        '''Whether the serialization output is valid for the member of :attr:`schemas` that produced it'''
+        check = self._dump_checks.get(schema)
+        return check(dump) if check else len(schema.validate(dump)) == 0
+
+    def _invalid_dump_indices(self, schema: Schema, dumps: list) -> Set[int]:
+        '''Returns the indices of the serialization outputs that are invalid for the member that produced them'''
+        check = self._dump_checks.get(schema)
+        if check: return {index for index, dump in enumerate(dumps) if not check(dump)}
+        return set(schema.validate(dumps, many=True))
 
     def _determine_shared_keys_to_schemas(self):
         keys_to_schemas = {}
@@ -46,6 +264,218 @@ class InPoly(ABC):
 
         self.shared_keys_to_schemas = {key: schemas for key, schemas in keys_to_schemas.items() if len(schemas) > 1}
 
+    def _schema_load_keys(self, schema: Schema) -> FrozenSet[str]:
+        load_keys = self._load_keys.get(schema)
+        if load_keys is None:
+            load_keys = self._load_keys[schema] = frozenset(
+                name if field.data_key is None else field.data_key for name, field in schema.load_fields.items()
+            )
+        return load_keys
+
+    def _unknown_data(self, data: Any, schemas: Iterable[Schema], unknown: Optional[str]) -> dict:
+        '''Applies the `unknown` behavior to the keys of the data that none of the given members of :attr:`schemas` load
+
+        Members are loaded with `EXCLUDE` as each only knows its own keys, so the keys unknown to all of them are
+        handled here instead. Without an explicit `unknown`, the strictest `unknown` behavior of :attr:`schemas` is
+        used.
+
+        Returns:
+            The unknown keys and their values if they're included in the output, otherwise an empty dictionary
+
+        Raises:
+            :exc:`marshmallow.ValidationError`: If the data has unknown keys and the `unknown` behavior is `RAISE`
+        '''
+        if not isinstance(data, Mapping): return {}
+        if unknown is None:
+            unknowns = {schema.unknown for schema in self.schemas}
+            unknown = RAISE if RAISE in unknowns else INCLUDE if INCLUDE in unknowns else EXCLUDE
+        if unknown == EXCLUDE: return {}
+
+        known_keys = frozenset().union(*map(self._schema_load_keys, schemas))
+        unknown_data = {key: value for key, value in data.items() if key not in known_keys}
+        if unknown_data and unknown == RAISE: raise ValidationError({key: ["Unknown field."] for key in unknown_data})
+        return unknown_data
+
+    def _determine_required_keys_to_schemas(self):
+        # Schemas with pre-processors are left out of the corresponding index as the processors may supply the keys, as
+        # are partial schemas as they don't require their required keys when loading
+        load_keys_to_schemas, dump_keys_to_schemas = {}, {}
+        for schema in self.schemas:
+            if not schema._has_processors(PRE_LOAD) and not schema.partial:
+                for name, field in schema.load_fields.items():
+                    if not field.required: continue
+                    key = name if field.data_key is None else field.data_key
+                    load_keys_to_schemas[key] = (*load_keys_to_schemas.get(key, ()), schema)
+
+            # Schemas with their own attribute lookup may find attributes that the default lookup doesn't
+            if not schema._has_processors(PRE_DUMP) and type(schema).get_attribute is Schema.get_attribute:
+                for name, field in schema.dump_fields.items():
+                    # These fields produce their values without reading an attribute of the object, and fields with
+                    # their own value lookup may not read it with the default lookup either
+                    if isinstance(field, _ATTRIBUTELESS_FIELDS) or type(field).get_value is not fields.Field.get_value:
+                        continue
+                    key = field.attribute or name
+                    # Dotted attributes are nested lookups, and dump defaults fill in keys missing from the object
+                    if not field.required or field.dump_default is not missing or "." in key: continue
+                    dump_keys_to_schemas[key] = (*dump_keys_to_schemas.get(key, ()), schema)
+
+        self.required_load_keys_to_schemas = load_keys_to_schemas
+        self.required_dump_keys_to_schemas = dump_keys_to_schemas
+
+    def _load_candidates(self, data: Any) -> Tuple[Schema]:
+        '''Returns the members of :attr:`schemas` that are not ruled out by required keys missing from the data'''
+        if not isinstance(data, Mapping): return self.schemas
+        excluded_schemas = {
+            schema for key, schemas in self.required_load_keys_to_schemas.items() if key not in data
+            for schema in schemas
+        }
+        return tuple(schema for schema in self.schemas if schema not in excluded_schemas)
+
+    def _dump_candidates(self, obj: Any) -> Tuple[Schema]:
+        '''Returns the members of :attr:`schemas` that are not ruled out by required attributes missing from the obj'''
+        excluded_schemas = {
+            schema for key, schemas in self.required_dump_keys_to_schemas.items() if not _has_key(obj, key)
+            for schema in schemas
+        }
+        return tuple(schema for schema in self.schemas if schema not in excluded_schemas)
+
+    def _merged_schema(self, schemas: Iterable[Schema]) -> Schema:
+        '''Returns a `Schema` combining the fields of the given members of :attr:`schemas`
+
+        Combined schemas are cached by the set of members they were built from, so a given combination only results in
+        a single `Schema` class being created over the lifetime of the instance.
+        '''
+        key = frozenset(schemas)
+        merged_schema = self._merged_schemas.get(key)
+        if merged_schema is None:
+            merged_schema = self._merged_schemas[key] = Schema.from_dict(
+                {name: field for schema in self.schemas if schema in key for name, field in schema.fields.items()}
+            )()
+        return merged_schema
+
+    def _cached_dump_schemas(self, obj: Any) -> Optional[Tuple[Schema]]:
+        '''Returns the members of :attr:`schemas` remembered for the type of the object, if any'''
+        if not self.dump_cache_size or isinstance(obj, Mapping): return None
+        with self._dump_cache_lock:
+            schemas = self._dump_cache.get(type(obj))
+            if schemas is not None: self._dump_cache.move_to_end(type(obj))
+        return schemas
+
+    def _cache_dump_schemas(self, obj: Any, schemas: Tuple[Schema]):
+        if not self.dump_cache_size or isinstance(obj, Mapping): return
+        with self._dump_cache_lock:
+            self._dump_cache[type(obj)] = schemas
+            self._dump_cache.move_to_end(type(obj))
+            if len(self._dump_cache) > self.dump_cache_size: self._dump_cache.popitem(last=False)
+
+    def _selected_schema_dumps(self, obj: Any) -> Dict[Schema, dict]:
+        '''Returns the output of :meth:`_valid_schema_dumps`, going directly to the schemas cached for the object's type
+
+        If the cached schemas turn out to be invalid for the object, it's tried against every schema as usual.
+        '''
+        schemas = self._cached_dump_schemas(obj)
+        if schemas is not None:
+            schema_dumps = {}
+            for schema in schemas:
+                try: dump = schema.dump(obj)
+                except ValueError: break
+                if self._validates_dumps() and not self._valid_dump(schema, dump): break
+                schema_dumps[schema] = dump
+            else:
+                return schema_dumps
+
+        schema_dumps = self._valid_schema_dumps(obj)
+        self._cache_dump_schemas(obj, tuple(schema_dumps))
+        return schema_dumps
+
+    def _dump_classification(self, obj: Any) -> Optional[Tuple[Schema]]:
+        '''Returns the members of :attr:`schemas` that the object is serialized with when dumped with others
+
+        Returns `None` if the object has to be tried against the schemas that it may be valid for.
+        '''
+        return self._cached_dump_schemas(obj)
+
+    def _validates_dumps(self) -> bool:
+        '''Whether serialization output is validated by the members of :attr:`schemas` that produced it'''
+        return True
+
+    def _dump_group(self, schemas: Tuple[Schema], objs: list) -> list:
+        '''Serializes objects classified as the given members of :attr:`schemas` with one dump per member
+
+        Objects whose output turns out to be invalid for their classification are serialized individually instead.
+        '''
+        schema_dumps, invalid_indices = {}, set()
+        for schema in schemas:
+            try: dumps = schema.dump(objs, many=True)
+            except ValueError: return [self.dump(obj) for obj in objs]
+            if self._validates_dumps(): invalid_indices.update(self._invalid_dump_indices(schema, dumps))
+            schema_dumps[schema] = dumps
+
+        return [
+            self.dump(obj) if index in invalid_indices
+            else self._combine_dumps(obj, {schema: dumps[index] for schema, dumps in schema_dumps.items()})
+            for index, obj in enumerate(objs)
+        ]
+
+    def _dump_candidate_group(self, schemas: Tuple[Schema], objs: list) -> list:
+        '''Serializes objects that may be valid for the given members of :attr:`schemas` with one dump per member
+
+        The output of each object is then selected from the outputs that are valid for the member that produced them.
+        '''
+        schema_dumps, invalid_indices = {}, {}
+        for schema in schemas:
+            try: dumps = schema.dump(objs, many=True)
+            except ValueError: return [self.dump(obj) for obj in objs]
+            schema_dumps[schema], invalid_indices[schema] = dumps, self._invalid_dump_indices(schema, dumps)
+
+        return [
+            self._combine_dumps(obj, self._select_schema_dumps(obj, {
+                schema: dumps[index] for schema, dumps in schema_dumps.items() if index not in invalid_indices[schema]
+            }))
+            for index, obj in enumerate(objs)
+        ]
+
+    def _dump_many(self, objs: Iterable) -> list:
+        '''Serializes the objects in groups of objects serialized with the same members of :attr:`schemas`
+
+        Objects that aren't classified are grouped by the members that their required attributes don't rule out, unless
+        their type may be remembered, in which case they're serialized individually to remember it.
+        '''
+        objs = list(objs)
+        dumps = [None] * len(objs)
+        groups: Dict[Tuple[bool, Tuple[Schema]], list] = {}
+        for index, obj in enumerate(objs):
+            schemas = self._dump_classification(obj)
+            if schemas is not None: groups.setdefault((False, schemas), []).append(index)
+            elif self.dump_cache_size and not isinstance(obj, Mapping):
+                dumps[index] = self._combine_dumps(obj, self._selected_schema_dumps(obj))
+            else: groups.setdefault((True, self._dump_candidates(obj)), []).append(index)
+
+        for (candidates, schemas), indices in groups.items():
+            dump_group = self._dump_candidate_group if candidates else self._dump_group
+            for index, dump in zip(indices, dump_group(schemas, [objs[index] for index in indices])):
+                dumps[index] = dump
+        return dumps
+
+    @abstractmethod
+    def _valid_schema_dumps(self, obj: Any) -> Dict[Schema, dict]:
+        '''Returns the serialization output of each of the members of :attr:`schemas` that the object is valid for'''
+        ...  # pragma: no cover
+
+    @abstractmethod
+    def _select_schema_dumps(self, obj: Any, valid_schema_dumps: Dict[Schema, dict]) -> Dict[Schema, dict]:
+        '''Returns the serialization output of the object used from the output of the members it's valid for
+
+        Raises:
+            The validation or conflict error of the subclass if the object is invalid for the subclass
+        '''
+        ...  # pragma: no cover
+
+    @abstractmethod
+    def _combine_dumps(self, obj: Any, schema_dumps: Dict[Schema, dict]) -> dict:
+        '''Combines the serialization output of the object produced by the given members of :attr:`schemas`'''
+        ...  # pragma: no cover
+
     @property
     @abstractclassmethod
     def keyword(cls) -> str:
@@ -53,10 +483,22 @@ class InPoly(ABC):
         ...  # pragma: no cover
 
     @abstractmethod
-    def dump(self, obj: Any, *, many: bool = False) -> dict:
-        '''Serializes the given object into a dictionary
+    def dump(self, obj: Any, *, many: bool = False) -> Union[dict, list]:
+        '''Serializes the given object into a dictionary, or each of the given objects if `many` is `True`
+
+        This method mimics the behavior of the :meth:`marshmallow.Schema.dump` method. Objects serialized together are
+        grouped by the :attr:`schemas` they're serialized with, or that they may be valid for, so that each group is
+        dumped by each schema at once
+        '''
+        ...  # pragma: no cover
+
+    @abstractmethod
+    def load(self, data: Any, *, unknown: Optional[str] = None) -> Any:
+        '''Deserializes the given data using the matching :attr:`schemas`
 
-        This method mimics the behavior of the :meth:`marshmallow.Schema.dump` method
+        This method mimics the behavior of the :meth:`marshmallow.Schema.load` method. It allows an :class:`InPoly`
+        to be handed to webargs in place of a `Schema` so that the data loaded while selecting :attr:`schemas` is
+        returned directly instead of being loaded a second time
         '''
         ...  # pragma: no cover
 
@@ -92,7 +534,15 @@ class OneOf(InPoly):
     '''A representation of the 'oneOf' OpenAPI Specification keyword'''
     keyword: ClassVar[str] = "oneOf"
 
-    def __init__(self, *argmaps: ArgMap, unknown: str = EXCLUDE):
+    def __init__(
+        self,
+        *argmaps: ArgMap,
+        unknown: str = EXCLUDE,
+        discriminator: Optional[str] = None,
+        mapping: Optional[Dict[str, Union[Schema, Type[Schema]]]] = None,
+        dump_cache_size: int = DEFAULT_DUMP_CACHE_SIZE,
+        dump_validation: str = "structural",
+    ):
         '''Initializes a :class:`OneOf` instance
 
         Args:
@@ -101,14 +551,66 @@ class OneOf(InPoly):
                 :attr:`in_poly.InPoly.schemas`
             unknown: Determines the behavior of unknown fields when serializing/deserializing. Defaults to
                 :const:`marshmallow.utils.EXCLUDE`
+            discriminator: The name of the property whose value determines which of :attr:`OneOf.schemas` is used
+                when serializing/deserializing. If provided, data is passed directly to the corresponding schema rather
+                than being tried against every schema
+            mapping: A dictionary of `discriminator` property values to :class:`marshmallow.Schema` instances or classes
+                in :attr:`OneOf.schemas`. Defaults to mapping the default OpenAPI schema name of each schema (e.g.
+                'Spoon' for `SpoonSchema`). Only mapped schemas registered using :meth:`~specargs.WebargsAPISpec.schema`
+                are included in the `mapping` of the generated OpenAPI `discriminator` object
+            dump_cache_size: The same as the `dump_cache_size` argument of :meth:`in_poly.InPoly.__init__`. Objects
+                whose type is remembered aren't checked against the other schemas for conflicts
+            dump_validation: The same as the `dump_validation` argument of :meth:`in_poly.InPoly.__init__`
 
         Raises:
+            :exc:`ValueError`: If `mapping` is provided without `discriminator`, if a `mapping` value is not one of
+                :attr:`OneOf.schemas`, or if multiple schemas share a default name when `mapping` is not provided
             :The same exceptions as :meth:`in_poly.InPoly.__init__` for the same reasons
         '''
-        super().__init__(*argmaps)
+        super().__init__(*argmaps, dump_cache_size=dump_cache_size, dump_validation=dump_validation)
         for schema in self.schemas:
             schema.unknown = unknown
 
+        if mapping and not discriminator:
+            raise ValueError("'mapping' cannot be provided to OneOf without 'discriminator'!")
+
+        #: The name of the property that determines which of :attr:`OneOf.schemas` handles the data
+        self.discriminator = discriminator
+        #: The explicitly provided dictionary of discriminator values to members of :attr:`OneOf.schemas`
+        self.mapping: Dict[str, Schema] = {
+            value: self._member_schema(schema) for value, schema in (mapping or {}).items()
+        }
+        self._discriminated_schemas: Dict[str, Schema] = {}
+        if discriminator: self._discriminated_schemas = self.mapping or self._default_mapping()
+
+    def _member_schema(self, schema_or_class: Union[Schema, Type[Schema]]) -> Schema:
+        for schema in self.schemas:
+            if schema is schema_or_class or type(schema) is schema_or_class: return schema
+        raise ValueError(f"'{schema_or_class}' is not a Schema in this OneOf!")
+
+    def _default_mapping(self) -> Dict[str, Schema]:
+        mapping = {}
+        for schema in self.schemas:
+            name = default_schema_name(type(schema))
+            if name in mapping:
+                raise ValueError(
+                    f"Multiple Schemas in OneOf share the name '{name}'! A 'mapping' must be provided to OneOf."
+                )
+            mapping[name] = schema
+
+        return mapping
+
+    def _discriminated_schema(self, data: Any) -> Schema:
+        value = data.get(self.discriminator) if isinstance(data, Mapping) else getattr(data, self.discriminator, None)
+        schema = self._discriminated_schemas.get(value) if isinstance(value, str) else None
+        if schema is None:
+            raise OneOfValidationError(
+                f"'{self.discriminator}' value {value!r} does not correspond to a Schema in "
+                f"OneOf({', '.join(type(schema).__name__ for schema in self.schemas)})!"
+            )
+
+        return schema
+
     def __call__(self, request: Any) -> Schema:
         '''Generates a :class:`marshmallow.Schema` based on the given request object
 
@@ -124,7 +626,10 @@ class OneOf(InPoly):
             :exc:`OneOfValidationError`: If none of :attr:`OneOf.schemas` succesfully validate the request data
         '''
         # TODO: Determine Request type based on framework
-        valid_schemas = tuple(schema for schema in self.schemas if len(schema.validate(get_request_body(request))) == 0)
+        if self.discriminator: return self._discriminated_schema(framework.get_request_body(request))
+
+        data = framework.get_request_body(request)
+        valid_schemas = tuple(schema for schema in self._load_candidates(data) if len(schema.validate(data)) == 0)
         if len(valid_schemas) > 1:
             raise OneOfConflictError(
                 f"Request data is valid for multiple Schemas in "
@@ -139,42 +644,125 @@ class OneOf(InPoly):
 
         return valid_schemas[0]
 
-    # TODO: Add argument entry for `many` kwarg
-    def dump(self, obj: Any, *, many: bool = False) -> dict:
-        '''Serializes the given object into a dictionary
-
-        This method mimics the behavior of marshmallow's `Schema.dump` method
+    def load(self, data: Any, *, unknown: Optional[str] = None) -> Any:
+        '''Deserializes the given data using the single matching schema
 
         Args:
-            obj: The object to serialize
+            data: The data to deserialize
+            unknown: Overrides the `unknown` behavior of :attr:`OneOf.schemas` if provided
 
         Returns:
-            The object serialization output of one of the :attr:`OneOf.schemas`
+            The output of the single :attr:`OneOf.schemas` that successfully loads the data
 
         Raises:
-            :exc:`OneOfConflictError`: If more than one of :attr:`OneOf.schemas` succesfully validates the object
-            :exc:`OneOfValidationError`: If none of :attr:`OneOf.schemas` succesfully validate the object
+            :exc:`OneOfConflictError`: If more than one of :attr:`OneOf.schemas` succesfully loads the data
+            :exc:`OneOfValidationError`: If none of :attr:`OneOf.schemas` succesfully load the data
         '''
-        valid_dumps = []
-        for schema in self.schemas:
+        if self.discriminator:
+            schema = self._discriminated_schema(data)
+            try: return schema.load(data, unknown=unknown)
+            except ValidationError as e:
+                raise OneOfValidationError(
+                    f"Request data is invalid for Schema '{type(schema).__name__}' in OneOf!"
+                ) from e
+
+        valid_loads = []
+        for schema in self._load_candidates(data):
+            try: valid_loads.append(schema.load(data, unknown=unknown))
+            except ValidationError: continue
+
+        if len(valid_loads) > 1:
+            raise OneOfConflictError(
+                f"Request data is valid for multiple Schemas in "
+                f"OneOf({', '.join(type(schema).__name__ for schema in self.schemas)})!"
+            )
+
+        if len(valid_loads) == 0:
+            raise OneOfValidationError(
+                f"Request data is invalid for all Schemas in "
+                f"OneOf({', '.join(type(schema).__name__ for schema in self.schemas)})!"
+            )
+
+        return valid_loads[0]
+
+    def _cached_dump_schemas(self, obj: Any) -> Optional[Tuple[Schema]]:
+        # The discriminator already determines the schema without trying every schema
+        if self.discriminator: return None
+        return super()._cached_dump_schemas(obj)
+
+    def _dump_classification(self, obj: Any) -> Optional[Tuple[Schema]]:
+        if self.discriminator: return (self._discriminated_schema(obj),)
+        return super()._dump_classification(obj)
+
+    def _validates_dumps(self) -> bool:
+        return not self.discriminator
+
+    def _valid_schema_dumps(self, obj: Any) -> Dict[Schema, dict]:
+        if self.discriminator:
+            schema = self._discriminated_schema(obj)
+            try: return {schema: schema.dump(obj)}
+            except ValueError as e:
+                raise OneOfValidationError(
+                    f"'{type(obj).__name__}' is invalid for Schema '{type(schema).__name__}' in OneOf!"
+                ) from e
+
+        valid_schema_dumps = {}
+        for schema in self._dump_candidates(obj):
             try: dump = schema.dump(obj)
             except ValueError: continue
-            if len(schema.validate(dump)) > 0: continue
-            valid_dumps.append(dump)
+            if not self._valid_dump(schema, dump): continue
+            valid_schema_dumps[schema] = dump
+
+        return self._select_schema_dumps(obj, valid_schema_dumps)
 
-        if len(valid_dumps) > 1:
+    def _select_schema_dumps(self, obj: Any, valid_schema_dumps: Dict[Schema, dict]) -> Dict[Schema, dict]:
+        if len(valid_schema_dumps) > 1:
             raise OneOfConflictError(
                 f"'{type(obj).__name__}' is valid for multiple Schemas in "
                 f"OneOf({', '.join(type(schema).__name__ for schema in self.schemas)})!"
             )
 
-        if len(valid_dumps) == 0:
+        if len(valid_schema_dumps) == 0:
             raise OneOfValidationError(
                 f"'{type(obj).__name__}' is invalid for all Schemas in "
                 f"OneOf({', '.join(type(schema).__name__ for schema in self.schemas)})!"
             )
 
-        return valid_dumps[0]
+        return valid_schema_dumps
+
+    def _combine_dumps(self, obj: Any, schema_dumps: Dict[Schema, dict]) -> dict:
+        return next(iter(schema_dumps.values()))
+
+    def dump(self, obj: Any, *, many: bool = False) -> Union[dict, list]:
+        '''Serializes the given object into a dictionary
+
+        This method mimics the behavior of marshmallow's `Schema.dump` method
+
+        Args:
+            obj: The object to serialize
+            many: Whether `obj` is an iterable of objects to serialize individually
+
+        Returns:
+            The object serialization output of one of the :attr:`OneOf.schemas`, or a list of the outputs of each
+            object if `many` is `True`
+
+        Raises:
+            :exc:`OneOfConflictError`: If more than one of :attr:`OneOf.schemas` succesfully validates the object
+            :exc:`OneOfValidationError`: If none of :attr:`OneOf.schemas` succesfully validate the object
+        '''
+        if many: return self._dump_many(obj)
+        return self._combine_dumps(obj, self._selected_schema_dumps(obj))
+
+
+def _unstructure_oneof(oneof: OneOf) -> dict:
+    out_dict = {oneof.keyword: oneof.schemas}
+    if oneof.discriminator:
+        out_dict["discriminator"] = {"propertyName": oneof.discriminator}
+        # Mapped schemas are replaced by references when the schema dictionary is resolved by `WebargsPlugin`
+        if oneof.mapping: out_dict["discriminator"]["mapping"] = dict(oneof.mapping)
+    return out_dict
+
+con.register_unstructure_hook(OneOf, _unstructure_oneof)
 
 
 # TODO: Improve initialization of AnyOfValidationError (args to generate message)
@@ -202,30 +790,15 @@ class AnyOf(InPoly):
     keyword: ClassVar[str] = "anyOf"
 
     def __attrs_post_init__(self):
+        super().__attrs_post_init__()
         self._determine_shared_keys_to_schemas()
 
-    def __call__(self, request: Any) -> Schema:
-        '''Generates a marshmallow `Schema` based on the given request object
-
-        Args:
-            request: The request object which holds the data used to produce the `Schema`
-
-        Returns:
-            A `Schema` that's a combination of all :attr:`AnyOf.schemas` that successfully validate the request data
-
-        Raises:
-            :exc:`AnyOfConflictError`: If the :attr:`AnyOf.schemas` that succesfully validate the request data produce
-                differing values for a given key
-            :exc:`AnyOfValidationError`: If none of :attr:`AnyOf.schemas` succesfully validate the request data
-        '''
+    def _valid_schema_loads(self, data: Any) -> Dict[Schema, dict]:
         valid_schema_loads = {}
-        for schema in self.schemas:
-            try: load = schema.load(get_request_body(request), unknown=EXCLUDE)
+        for schema in self._load_candidates(data):
+            try: load = schema.load(data, unknown=EXCLUDE)
             except ValidationError: continue
-            if not isinstance(load, dict):
-                load = vars(load) if hasattr(load, "__dict__") else {s: getattr(load, s, None) for s in load.__slots__}
-
-            valid_schema_loads[schema] = load
+            valid_schema_loads[schema] = _load_to_dict(load)
 
         if len(valid_schema_loads) == 0:
             raise AnyOfValidationError(
@@ -243,48 +816,98 @@ class AnyOf(InPoly):
                 f"Schemas in AnyOf({', '.join(type(schema).__name__ for schema in self.schemas)}) have conflicting keys!"
             )
 
-        return Schema.from_dict({name: field for schema in valid_schema_loads for name, field in schema.fields.items()})()
-
-    def dump(self, obj: Any, *, many: bool = False) -> dict:
-        '''Serializes the given object into a dictionary
+        return valid_schema_loads
 
-        This method mimics the behavior of marshmallow's `Schema.dump` method
+    def __call__(self, request: Any) -> Schema:
+        '''Generates a marshmallow `Schema` based on the given request object
 
         Args:
-            obj: The object to serialize
+            request: The request object which holds the data used to produce the `Schema`
 
         Returns:
-            The object serialization output of all of the :attr:`AnyOf.schemas` that successfully validate the object
+            A `Schema` that's a combination of all :attr:`AnyOf.schemas` that successfully validate the request data
 
         Raises:
-            :exc:`AnyOfConflictError`: If the :attr:`AnyOf.schemas` that succesfully validate the object produce
+            :exc:`AnyOfConflictError`: If the :attr:`AnyOf.schemas` that succesfully validate the request data produce
                 differing values for a given key
-            :exc:`AnyOfValidationError`: If none of :attr:`AnyOf.schemas` succesfully validate the object
+            :exc:`AnyOfValidationError`: If none of :attr:`AnyOf.schemas` succesfully validate the request data
+        '''
+        return self._merged_schema(self._valid_schema_loads(framework.get_request_body(request)))
+
+    def load(self, data: Any, *, unknown: Optional[str] = None) -> dict:
+        '''Deserializes the given data using all matching schemas
+
+        Args:
+            data: The data to deserialize
+            unknown: The behavior for keys that none of the matching :attr:`AnyOf.schemas` load. Defaults to the
+                strictest `unknown` behavior of :attr:`AnyOf.schemas`
+
+        Returns:
+            The combined output of all :attr:`AnyOf.schemas` that successfully load the data
+
+        Raises:
+            :exc:`marshmallow.ValidationError`: If the data has keys unknown to the matching :attr:`AnyOf.schemas` and
+                the `unknown` behavior is :const:`marshmallow.utils.RAISE`
+            :exc:`AnyOfConflictError`: If the :attr:`AnyOf.schemas` that succesfully load the data produce differing
+                values for a given key
+            :exc:`AnyOfValidationError`: If none of :attr:`AnyOf.schemas` succesfully load the data
         '''
+        valid_schema_loads = self._valid_schema_loads(data)
+        unknown_data = self._unknown_data(data, valid_schema_loads, unknown)
+        return {k: v for load in (unknown_data, *valid_schema_loads.values()) for k, v in load.items()}
+
+    def _valid_schema_dumps(self, obj: Any) -> Dict[Schema, dict]:
         valid_schema_dumps = {}
-        for schema in self.schemas:
+        for schema in self._dump_candidates(obj):
             try: dump = schema.dump(obj)
             except ValueError: continue
-            if len(schema.validate(dump)) > 0: continue
+            if not self._valid_dump(schema, dump): continue
             valid_schema_dumps[schema] = dump
 
+        return self._select_schema_dumps(obj, valid_schema_dumps)
+
+    def _select_schema_dumps(self, obj: Any, valid_schema_dumps: Dict[Schema, dict]) -> Dict[Schema, dict]:
         if len(valid_schema_dumps) == 0:
             raise AnyOfValidationError(
                 f"'{type(obj).__name__}' is invalid for all Schemas in "
                 f"AnyOf({', '.join(type(schema).__name__ for schema in self.schemas)})!"
             )
 
+        return valid_schema_dumps
+
+    def _combine_dumps(self, obj: Any, schema_dumps: Dict[Schema, dict]) -> dict:
         conflicting_keys = any(
-            valid_schema_dumps[schema][shared_key] != valid_schema_dumps[schemas[0]][shared_key]
+            schema_dumps[schema][shared_key] != schema_dumps[schemas[0]][shared_key]
             for shared_key, schemas in self.shared_keys_to_schemas.items()
-            for schema in schemas if schema in valid_schema_dumps
+            for schema in schemas if schema in schema_dumps
         )
         if conflicting_keys:
             raise AnyOfConflictError(
                 f"Schemas in AnyOf({', '.join(type(schema).__name__ for schema in self.schemas)}) have conflicting keys!"
             )
 
-        return {k:v for dump in valid_schema_dumps.values() for k,v in dump.items()}
+        return {k:v for dump in schema_dumps.values() for k,v in dump.items()}
+
+    def dump(self, obj: Any, *, many: bool = False) -> Union[dict, list]:
+        '''Serializes the given object into a dictionary
+
+        This method mimics the behavior of marshmallow's `Schema.dump` method
+
+        Args:
+            obj: The object to serialize
+            many: Whether `obj` is an iterable of objects to serialize individually
+
+        Returns:
+            The object serialization output of all of the :attr:`AnyOf.schemas` that successfully validate the object,
+            or a list of the outputs of each object if `many` is `True`
+
+        Raises:
+            :exc:`AnyOfConflictError`: If the :attr:`AnyOf.schemas` that succesfully validate the object produce
+                differing values for a given key
+            :exc:`AnyOfValidationError`: If none of :attr:`AnyOf.schemas` succesfully validate the object
+        '''
+        if many: return self._dump_many(obj)
+        return self._combine_dumps(obj, self._selected_schema_dumps(obj))
 
 
 # TODO: Improve initialization of AllOfConflictError (args to generate message)
@@ -312,31 +935,14 @@ class AllOf(InPoly):
     keyword: ClassVar[str] = "allOf"
 
     def __attrs_post_init__(self):
+        super().__attrs_post_init__()
         self._determine_shared_keys_to_schemas()
+        # Every member takes part in each load, so the combined schema only ever needs to be built once
+        self._merged_schema(self.schemas)
 
-    def __call__(self, request: Any) -> Schema:
-        '''Generates a marshmallow `Schema` based on the given request object
-
-        Args:
-            request: The request object which holds the data used to produce the `Schema`
-
-        Returns:
-            A `Schema` that's a combination of all :attr:`AllOf.schemas`
-
-        Raises:
-            :exc:`AllOfConflictError`: If the :attr:`AllOf.schemas` produce differing values for a given key
-            :exc:`AllOfValidationError`: If any of :attr:`AllOf.schemas` don't succesfully validate the request data
-        '''
+    def _schema_loads(self, data: Any) -> Dict[Schema, dict]:
         try:
-            schema_loads = {}
-            for schema in self.schemas:
-                load = schema.load(get_request_body(request), unknown=EXCLUDE)
-                if not isinstance(load, dict):
-                    load = (
-                        vars(load) if hasattr(load, "__dict__") else
-                        {s: getattr(load, s, None) for s in load.__slots__}
-                    )
-                schema_loads[schema] = load
+            schema_loads = {schema: _load_to_dict(schema.load(data, unknown=EXCLUDE)) for schema in self.schemas}
         except ValidationError as e:
             raise AllOfValidationError(
                 f"Request data is invalid for a Schema in "
@@ -353,24 +959,50 @@ class AllOf(InPoly):
                 f"Schemas in AllOf({', '.join(type(schema).__name__ for schema in self.schemas)}) have conflicting keys!"
             )
 
-        return Schema.from_dict({name: field for schema in self.schemas for name, field in schema.fields.items()})()
+        return schema_loads
 
-    def dump(self, obj: Any, *, many: bool = False) -> dict:
-        '''Serializes the given object into a dictionary
+    def __call__(self, request: Any) -> Schema:
+        '''Generates a marshmallow `Schema` based on the given request object
 
-        This method mimics the behavior of marshmallow's `Schema.dump` method
+        Args:
+            request: The request object which holds the data used to produce the `Schema`
+
+        Returns:
+            A `Schema` that's a combination of all :attr:`AllOf.schemas`
+
+        Raises:
+            :exc:`AllOfConflictError`: If the :attr:`AllOf.schemas` produce differing values for a given key
+            :exc:`AllOfValidationError`: If any of :attr:`AllOf.schemas` don't succesfully validate the request data
+        '''
+        self._schema_loads(framework.get_request_body(request))
+        return self._merged_schema(self.schemas)
+
+    def load(self, data: Any, *, unknown: Optional[str] = None) -> dict:
+        '''Deserializes the given data using all schemas
 
         Args:
-            obj: The object to serialize
+            data: The data to deserialize
+            unknown: The behavior for keys that none of :attr:`AllOf.schemas` load. Defaults to the strictest `unknown`
+                behavior of :attr:`AllOf.schemas`
 
         Returns:
-            The combined object serialization output of all of the :attr:`AllOf.schemas`
+            The combined output of all :attr:`AllOf.schemas`
 
         Raises:
-            :exc:`AllOfConflictError`: If the :attr:`AllOf.schemas` that succesfully validate the object produce
-                differing values for a given key
-            :exc:`AllOfValidationError`: If none of :attr:`AllOf.schemas` succesfully validate the object
+            :exc:`marshmallow.ValidationError`: If the data has keys unknown to all :attr:`AllOf.schemas` and the
+                `unknown` behavior is :const:`marshmallow.utils.RAISE`
+            :exc:`AllOfConflictError`: If the :attr:`AllOf.schemas` produce differing values for a given key
+            :exc:`AllOfValidationError`: If any of :attr:`AllOf.schemas` don't succesfully load the data
         '''
+        schema_loads = self._schema_loads(data)
+        unknown_data = self._unknown_data(data, self.schemas, unknown)
+        return {k: v for load in (unknown_data, *schema_loads.values()) for k, v in load.items()}
+
+    def _dump_classification(self, obj: Any) -> Optional[Tuple[Schema]]:
+        # Every member serializes every object, and invalid objects are caught when their group is validated
+        return self.schemas
+
+    def _valid_schema_dumps(self, obj: Any) -> Dict[Schema, dict]:
         try:
             schema_dumps = {schema: schema.dump(obj, many=False) for schema in self.schemas}
         except ValueError as e:
@@ -379,13 +1011,20 @@ class AllOf(InPoly):
                 f"AllOf({', '.join(type(schema).__name__ for schema in self.schemas)})!"
             ) from e
 
+        return self._select_schema_dumps(obj, {
+            schema: dump for schema, dump in schema_dumps.items() if self._valid_dump(schema, dump)
+        })
+
+    def _select_schema_dumps(self, obj: Any, valid_schema_dumps: Dict[Schema, dict]) -> Dict[Schema, dict]:
         for schema in self.schemas:
-            validation_errors = schema.validate(schema_dumps[schema])
-            if validation_errors:
+            if schema not in valid_schema_dumps:
                 raise AllOfValidationError(
                     f"'{type(obj).__name__}' is invalid for Schema '{type(schema).__name__}' in AllOf!"
                 )
 
+        return valid_schema_dumps
+
+    def _combine_dumps(self, obj: Any, schema_dumps: Dict[Schema, dict]) -> dict:
         conflicting_keys = any(
             schema_dumps[schema][shared_key] != schema_dumps[schemas[0]][shared_key]
             for shared_key, schemas in self.shared_keys_to_schemas.items()
@@ -397,3 +1036,24 @@ class AllOf(InPoly):
             )
 
         return {k:v for dump in schema_dumps.values() for k,v in dump.items()}
+
+    def dump(self, obj: Any, *, many: bool = False) -> Union[dict, list]:
+        '''Serializes the given object into a dictionary
+
+        This method mimics the behavior of marshmallow's `Schema.dump` method
+
+        Args:
+            obj: The object to serialize
+            many: Whether `obj` is an iterable of objects to serialize individually
+
+        Returns:
+            The combined object serialization output of all of the :attr:`AllOf.schemas`, or a list of the outputs of
+            each object if `many` is `True`
+
+        Raises:
+            :exc:`AllOfConflictError`: If the :attr:`AllOf.schemas` that succesfully validate the object produce
+                differing values for a given key
+            :exc:`AllOfValidationError`: If none of :attr:`AllOf.schemas` succesfully validate the object
+        '''
+        if many: return self._dump_many(obj)
+        return self._combine_dumps(obj, self._valid_schema_dumps(obj))
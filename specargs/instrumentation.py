@@ -0,0 +1,168 @@
+import bisect
+from contextvars import ContextVar
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+#: The phase in which a request is parsed by a view function/method decorated with :func:`~specargs.use_args`
+PARSE = "parse"
+#: The phase in which an :class:`~specargs.in_poly.InPoly` selects the schemas that request data is valid for. This
+#: happens during :data:`PARSE`
+VALIDATE = "validate"
+#: The phase in which the decorated view function/method itself is called
+DISPATCH = "dispatch"
+#: The phase in which the data returned by a view function/method decorated with :func:`~specargs.use_response` is
+#: serialized into a response. For streamed responses, this only covers creating the response
+DUMP = "dump"
+
+#: A function called with the phase, the route (the qualified name of the view function/method), the start and end
+#: times as given by :func:`time.perf_counter_ns`, and the exception raised during the phase, if any
+Observer = Callable[[str, str, int, int, Optional[BaseException]], None]
+
+#: The observers called after each phase. Phases aren't timed when this is empty
+observers: Tuple[Observer, ...] = ()
+
+# The start time of the request parsing of the current context, which ends when the view function/method is called
+parse_start: ContextVar[Optional[int]] = ContextVar("parse_start", default=None)
+
+
+def add_observer(observer: Observer):
+    '''Registers a function to be called after each instrumented phase of handling a request
+
+    Args:
+        observer: The function to register. See :data:`Observer`
+    '''
+    global observers
+    observers += (observer,)
+
+
+def remove_observer(observer: Observer):
+    '''Unregisters a function registered with :func:`add_observer`
+
+    Raises:
+        :exc:`ValueError`: If `observer` is not registered
+    '''
+    global observers
+    if observer not in observers: raise ValueError(f"{observer} is not a registered observer!")
+    observers = tuple(registered for registered in observers if registered != observer)
+
+
+def record(phase: str, route: str, start: int, end: int, error: Optional[BaseException] = None):
+    for observer in observers: observer(phase, route, start, end, error)
+
+
+def observe(phase: str, route: str, func: Callable, *args, **kwargs) -> Any:
+    '''Calls the function with the given arguments and records the call as the given phase'''
+    start = time.perf_counter_ns()
+    try:
+        result = func(*args, **kwargs)
+    except BaseException as error:
+        record(phase, route, start, time.perf_counter_ns(), error)
+        raise
+    record(phase, route, start, time.perf_counter_ns())
+    return result
+
+
+async def observe_async(phase: str, route: str, awaitable: Awaitable) -> Any:
+    '''Awaits the awaitable and records the time it took as the given phase'''
+    start = time.perf_counter_ns()
+    try:
+        result = await awaitable
+    except BaseException as error:
+        record(phase, route, start, time.perf_counter_ns(), error)
+        raise
+    record(phase, route, start, time.perf_counter_ns())
+    return result
+
+
+#: The default upper bounds, in seconds, of the buckets of :class:`PrometheusHistogram`
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class PrometheusHistogram:
+    '''An observer that aggregates phase durations into histograms labelled by phase and route
+
+    The histograms are output in the Prometheus text exposition format by :meth:`render`, which can be served from a
+    metrics route. For example::
+
+        histogram = PrometheusHistogram()
+        specargs.add_observer(histogram)
+
+        @app.get("/metrics")
+        def metrics():
+            return histogram.render(), 200, {"Content-Type": PrometheusHistogram.CONTENT_TYPE}
+    '''
+    #: The media type of the output of :meth:`render`
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, name: str = "specargs_phase_duration_seconds", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        '''Initializes a :class:`PrometheusHistogram` object
+
+        Args:
+            name: The metric name
+            buckets: The upper bounds of the histogram buckets in seconds
+        '''
+        self.name = name
+        self.buckets = tuple(sorted(buckets))
+        # Bucket counts are stored non-cumulatively with a final count for durations outside of every bucket
+        self._series: Dict[Tuple[str, str, bool], List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, phase: str, route: str, start: int, end: int, error: Optional[BaseException]):
+        duration = (end - start) / 1e9
+        key = (phase, route, error is not None)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None: series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][bisect.bisect_left(self.buckets, duration)] += 1
+            series[1] += duration
+
+    def render(self) -> str:
+        '''Outputs the histograms in the Prometheus text exposition format'''
+        with self._lock: series = {key: (list(counts), total) for key, (counts, total) in self._series.items()}
+
+        lines = [f"# HELP {self.name} Time spent in each phase of handling a request", f"# TYPE {self.name} histogram"]
+        for (phase, route, error), (counts, total) in sorted(series.items()):
+            labels = f'phase="{phase}",route="{route}",error="{str(error).lower()}"'
+            cumulative = 0
+            for bound, count in zip((*map(repr, self.buckets), "+Inf"), counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{labels}}} {total!r}")
+            lines.append(f"{self.name}_count{{{labels}}} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetrySpans:
+    '''An observer that records each phase as an OpenTelemetry span
+
+    Spans are named `specargs.<phase>` and have `specargs.phase` and `specargs.route` attributes. As spans are created
+    once a phase has ended, they're children of the span that's current at that time (e.g. the request span) rather
+    than of each other. Requires the `opentelemetry-api` package.
+    '''
+    def __init__(self, tracer: Any = None):
+        '''Initializes an :class:`OpenTelemetrySpans` object
+
+        Args:
+            tracer: The OpenTelemetry `Tracer` to create spans with. Defaults to the tracer of the global tracer provider
+
+        Raises:
+            :exc:`ImportError`: If `opentelemetry-api` is not installed
+        '''
+        from opentelemetry import trace
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("specargs")
+        # Spans require epoch timestamps while phases are timed with the more precise performance counter
+        self._epoch_offset = time.time_ns() - time.perf_counter_ns()
+
+    def __call__(self, phase: str, route: str, start: int, end: int, error: Optional[BaseException]):
+        span = self.tracer.start_span(
+            f"specargs.{phase}",
+            start_time=start + self._epoch_offset,
+            attributes={"specargs.phase": phase, "specargs.route": route},
+        )
+        if error is not None:
+            span.record_exception(error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(error)))
+        span.end(end_time=end + self._epoch_offset)
@@ -70,14 +70,18 @@ class Response:
         return {content_type: {"schema": self.schema}}
 
 
+# Generated once as cattrs creates and compiles a new function on every call to `make_dict_unstructure_fn`
+_unstructure_response_fields = make_dict_unstructure_fn(
+    Response,
+    converter=con,
+    headers=override(omit_if_default=True),
+    schema=override(omit=True),
+)
+
+
 # Omit `schema` and default attributes and include `content` property if `schema` is trueish when converting to a dict
 def _add_content_hook(response: Response) -> dict:
-    out_dict = make_dict_unstructure_fn(
-        Response,
-        converter=con,
-        headers=override(omit_if_default=True),
-        schema=override(omit=True),
-    )(response)
+    out_dict = _unstructure_response_fields(response)
     if response.schema: out_dict["content"] = con.unstructure(response.content)
     return out_dict
 
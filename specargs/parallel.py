@@ -0,0 +1,52 @@
+import math
+import multiprocessing
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .apispec import WebargsAPISpec
+
+
+# The spec and path creation function of the current job. Worker processes are forked so that they inherit these, as
+# view functions/methods and schemas generally can't be pickled
+_job: Optional[Tuple["WebargsAPISpec", Callable[[int], None]]] = None
+
+
+def is_supported() -> bool:
+    '''Whether paths can be created in parallel on this platform, which requires the "fork" start method'''
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _create_partition(bounds: Tuple[int, int]) -> List[Tuple[str, Any]]:
+    spec, create_path = _job
+    # Only the paths created by this partition are returned to the parent process
+    spec._paths = {}
+    for index in range(*bounds): create_path(index)
+    return list(spec._paths.items())
+
+
+def create_paths(spec: "WebargsAPISpec", create_path: Callable[[int], None], count: int, processes: int):
+    '''Calls `create_path` with each index from 0 to `count` across a pool of forked processes
+
+    The range of indices is split into contiguous partitions, one per process, and the paths each process adds to
+    `spec` are merged into `spec` in partition order. The resulting paths are therefore the same, and in the same order,
+    as those produced by calling `create_path` with each index in order in the current process.
+
+    Args:
+        spec: The spec that `create_path` adds paths to
+        create_path: A function that adds the path of the route at the given index to `spec`
+        count: The number of routes
+        processes: The maximum number of processes to use
+    '''
+    global _job
+    partition_size = math.ceil(count / processes)
+    partitions = [(start, min(start + partition_size, count)) for start in range(0, count, partition_size)]
+
+    _job = spec, create_path
+    try:
+        with multiprocessing.get_context("fork").Pool(len(partitions)) as pool:
+            results = pool.map(_create_partition, partitions)
+    finally:
+        _job = None
+
+    for partition_paths in results:
+        for path, operations in partition_paths: spec._paths.setdefault(path, operations).update(operations)
@@ -45,7 +45,8 @@ class WebargsScehamResolver(SchemaResolver):
         '''The same as the superclass method but with a check for marshmallow Fields
         
         The marshmallow Field check enables conversion of marhsmallow Field objects to corresponding OpenAPI Spec
-        structures within response sections
+        structures within response sections. Schemas in the `mapping` of a `discriminator` object are also converted
+        into references
 
         Args:
             schema: The object to be resolved/converted into an OAS structure
@@ -55,8 +56,18 @@ class WebargsScehamResolver(SchemaResolver):
         '''
         if isinstance(schema, fields.Field):
             return self.converter.field2property(schema)
+        if isinstance(schema, dict) and "mapping" in schema.get("discriminator", {}):
+            self._resolve_discriminator_mapping(schema["discriminator"])
         return super().resolve_schema_dict(schema)
 
+    def _resolve_discriminator_mapping(self, discriminator: dict):
+        # OAS discriminator mappings can only point to schema references, so unregistered schemas are left out
+        mapping = {}
+        for value, schema in discriminator["mapping"].items():
+            ref = self.resolve_schema_dict(schema).get("$ref")
+            if ref: mapping[value] = ref
+        discriminator["mapping"] = mapping
+
 
 class WebargsPlugin(MarshmallowPlugin, ABC):
     '''Generates OpenAPI specification components from decorated view functions/methods
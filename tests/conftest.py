@@ -1,7 +1,19 @@
+import os
+
 import pytest
 from _pytest.fixtures import SubRequest
 from pytest_mock import MockerFixture
 
+from specargs import framework
+
+
+@pytest.fixture(autouse=True)
+def default_framework(mocker: MockerFixture):
+    # Tests that don't select a backend run against Flask unless SPECARGS_FRAMEWORK is set, so framework detection
+    # doesn't fail when multiple frameworks are installed
+    if not os.environ.get(framework.FRAMEWORK_ENV_VAR):
+        mocker.patch.dict(os.environ, {framework.FRAMEWORK_ENV_VAR: "flask"})
+
 
 def _create_mock(mocker: MockerFixture, request: SubRequest, name: str):
     return mocker.patch.object(
@@ -25,11 +37,3 @@ def ensure_schema_or_inpoly_error(ensure_schema_or_inpoly):
     ensure_schema_or_inpoly.side_effect = TypeError
     return ensure_schema_or_inpoly
 
-
-@pytest.fixture
-def make_response(mocker: MockerFixture, request: SubRequest):
-    return _create_mock(
-        mocker,
-        request, 
-        "make_response",
-    )
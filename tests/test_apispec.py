@@ -0,0 +1,110 @@
+import hashlib
+import json
+
+from marshmallow import Schema
+import pytest
+from unittest.mock import MagicMock
+from pytest_mock import MockerFixture
+
+from specargs import apispec
+
+
+@pytest.fixture
+def spec():
+    return apispec.WebargsAPISpec("Test", "1.0.0", "3.0.2")
+
+
+def test_rendered_spec_etag():
+    body = b"body"
+
+    rendered = apispec.RenderedSpec(body, "application/json")
+
+    assert rendered.etag == hashlib.sha256(body).hexdigest()
+
+
+class TestRender:
+    @staticmethod
+    def test_render_json(spec: apispec.WebargsAPISpec):
+        result = spec.render()
+
+        assert json.loads(result.body) == spec.to_dict()
+        assert result.content_type == "application/json"
+
+    @staticmethod
+    def test_render_yaml(spec: apispec.WebargsAPISpec):
+        result = spec.render("yaml")
+
+        assert result.body == spec.to_yaml().encode()
+        assert result.content_type == "application/yaml"
+
+    @staticmethod
+    def test_render_invalid_format(spec: apispec.WebargsAPISpec):
+        with pytest.raises(ValueError):
+            spec.render("xml")
+
+    @staticmethod
+    def test_render_reuses_output(mocker: MockerFixture, spec: apispec.WebargsAPISpec):
+        to_dict = mocker.spy(spec, "to_dict")
+
+        first_result = spec.render()
+        second_result = spec.render()
+
+        to_dict.assert_called_once()
+        assert first_result is second_result
+
+    @staticmethod
+    @pytest.mark.parametrize("register", (
+        pytest.param(lambda spec: spec.path("/test"), id="path"),
+        pytest.param(lambda spec: spec.tag({"name": "test"}), id="tag"),
+        pytest.param(lambda spec: spec.schema(type("TestSchema", (Schema,), {})), id="schema"),
+        pytest.param(lambda spec: spec.schema("Test")(type("TestSchema", (Schema,), {})), id="schema decorator"),
+        pytest.param(lambda spec: spec.response("Test", None), id="response"),
+        pytest.param(lambda spec: spec.clear_rendered(), id="clear_rendered"),
+    ))
+    def test_render_after_registration(spec: apispec.WebargsAPISpec, register):
+        first_result = spec.render()
+
+        register(spec)
+        second_result = spec.render()
+
+        assert first_result is not second_result
+        assert json.loads(second_result.body) == spec.to_dict()
+
+
+def test_add_spec_route_invalid_format(spec: apispec.WebargsAPISpec):
+    with pytest.raises(ValueError):
+        spec.add_spec_route(MagicMock(), format="xml")
+
+
+def test_add_spec_route(mocker: MockerFixture, spec: apispec.WebargsAPISpec):
+    from specargs import framework
+    add_spec_route = mocker.MagicMock()
+    mocker.patch.dict(framework.__dict__, {"add_spec_route": add_spec_route})
+    framework_obj = MagicMock()
+
+    spec.add_spec_route(framework_obj, "/spec.yaml", format="yaml")
+
+    add_spec_route.assert_called_once_with(spec, framework_obj, "/spec.yaml", "yaml")
+
+
+def test_backend(mocker: MockerFixture):
+    get_backend = mocker.patch.object(apispec, "get_backend", autospec=True)
+    backend_module = get_backend.return_value
+    spec = apispec.WebargsAPISpec("Test", "1.0.0", "3.0.2", backend="django")
+    framework_obj = MagicMock()
+
+    spec.create_paths(framework_obj, processes=2)
+    spec.add_spec_route(framework_obj)
+
+    get_backend.assert_called_with("django")
+    backend_module.create_paths.assert_called_once_with(spec, framework_obj, 2)
+    backend_module.add_spec_route.assert_called_once_with(spec, framework_obj, "/openapi.json", "json")
+
+
+def test_to_dict_options_unchanged():
+    spec = apispec.WebargsAPISpec("Test", "1.0.0", "3.0.2", info={"description": "A description"})
+
+    result = spec.to_dict()
+
+    assert result["info"] == {"title": "Test", "version": "1.0.0", "description": "A description"}
+    assert spec.options == {"info": {"description": "A description"}}
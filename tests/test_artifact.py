@@ -0,0 +1,157 @@
+from http import HTTPStatus
+import json
+
+from flask import Flask
+from marshmallow import Schema, fields
+import pytest
+from pytest_mock import MockerFixture
+
+from specargs import WebargsAPISpec, artifact, use_args, use_response
+from specargs.framework import flask
+
+
+class PetSchema(Schema):
+    name = fields.String(required=True)
+    owner = fields.Nested(lambda: PetSchema(only=("name",)))
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__, static_folder=None)
+
+    @app.post("/pets/<int:pet_id>")
+    @use_args({"name": fields.String(validate=lambda name: bool(name))})
+    @use_response(PetSchema, description="The pet")
+    def post_pet(args, pet_id):
+        ...  # pragma: no cover
+
+    return app
+
+
+def create_spec():
+    return WebargsAPISpec("Test", "1.0.0", "3.0.2", plugins=[flask.FlaskWebargsPlugin()])
+
+
+@pytest.fixture
+def artifact_path(app: Flask, tmp_path):
+    path = tmp_path / "artifact.json"
+    artifact.write_artifact(create_spec(), app, str(path))
+    return path
+
+
+def test_fingerprint_stable(app: Flask):
+    assert artifact.fingerprint(create_spec(), app) == artifact.fingerprint(create_spec(), app)
+
+
+def test_fingerprint_changes(app: Flask):
+    original = artifact.fingerprint(create_spec(), app)
+
+    app.view_functions["post_pet"].responses[HTTPStatus.OK].schema.fields["name"].required = False
+
+    assert artifact.fingerprint(create_spec(), app) != original
+
+
+@pytest.mark.parametrize("register", (
+    pytest.param(lambda spec: spec.tag({"name": "pets"}), id="tag"),
+    pytest.param(lambda spec: spec.schema("Pet")(PetSchema), id="schema"),
+    pytest.param(lambda spec: spec.response("Pet", PetSchema), id="response"),
+))
+def test_fingerprint_registration_changes(app: Flask, register):
+    spec = create_spec()
+    original = artifact.fingerprint(spec, app)
+
+    register(spec)
+
+    assert artifact.fingerprint(spec, app) != original
+
+
+def test_fingerprint_component_changes(app: Flask):
+    def registered_spec(pet_schema: type):
+        spec = create_spec()
+        spec.schema("Pet")(pet_schema)
+        return spec
+
+    original = artifact.fingerprint(registered_spec(PetSchema), app)
+    changed_schema = Schema.from_dict({"name": fields.String(required=True), "age": fields.Integer()})
+
+    assert artifact.fingerprint(registered_spec(changed_schema), app) != original
+
+
+def test_write_artifact(app: Flask, artifact_path):
+    spec = create_spec()
+    spec.create_paths(app)
+
+    header, body = artifact_path.read_bytes().split(b"\n", 1)
+
+    assert json.loads(header) == {
+        "artifact_version": artifact.ARTIFACT_VERSION,
+        "fingerprint": artifact.fingerprint(spec, app),
+        "spec_sha256": spec.render().etag,
+    }
+    assert json.loads(body) == spec.to_dict()
+
+
+def test_read_artifact(app: Flask, artifact_path):
+    rendered = artifact.read_artifact(create_spec(), app, str(artifact_path))
+
+    assert rendered.body == artifact_path.read_bytes().split(b"\n", 1)[1]
+    assert rendered.content_type == "application/json"
+
+
+def test_read_artifact_outdated(app: Flask, artifact_path):
+    @app.get("/other")
+    def other():
+        ...  # pragma: no cover
+
+    assert artifact.read_artifact(create_spec(), app, str(artifact_path)) is None
+
+
+def test_read_artifact_modified(app: Flask, artifact_path):
+    artifact_path.write_bytes(artifact_path.read_bytes().replace(b"The pet", b"The cat"))
+
+    assert artifact.read_artifact(create_spec(), app, str(artifact_path)) is None
+
+
+@pytest.mark.parametrize("content", (
+    pytest.param(None, id="Missing"),
+    pytest.param(b"not json", id="Invalid"),
+    pytest.param(b'{"artifact_version": 0}\n{}', id="Other version"),
+))
+def test_read_artifact_invalid(app: Flask, tmp_path, content):
+    path = tmp_path / "artifact.json"
+    if content is not None: path.write_bytes(content)
+
+    assert artifact.read_artifact(create_spec(), app, str(path)) is None
+
+
+def test_create_paths_artifact(mocker: MockerFixture, app: Flask, artifact_path):
+    spec = create_spec()
+    create_paths = mocker.patch.object(flask, "create_paths", autospec=True)
+    mocker.patch.dict("specargs.framework.__dict__", create_paths=create_paths)
+
+    spec.create_paths(app, artifact=str(artifact_path))
+
+    create_paths.assert_not_called()
+    assert spec.render().body == artifact_path.read_bytes().split(b"\n", 1)[1]
+    assert spec.to_dict() == json.loads(spec.render().body)
+
+
+def test_create_paths_outdated_artifact(app: Flask, tmp_path):
+    spec = create_spec()
+
+    spec.create_paths(app, artifact=str(tmp_path / "missing.json"))
+
+    assert spec.artifact_spec is None
+    assert spec.to_dict()["paths"].keys() == {"/pets/{pet_id}"}
+
+
+def test_create_paths_artifact_registration(app: Flask, artifact_path):
+    spec = create_spec()
+    spec.create_paths(app, artifact=str(artifact_path))
+
+    spec.tag({"name": "pets"})
+
+    assert spec.artifact_spec is None
+    assert spec.to_dict()["tags"] == [{"name": "pets"}]
+    assert spec.to_dict()["paths"].keys() == {"/pets/{pet_id}"}
+    assert json.loads(spec.render().body) == spec.to_dict()
@@ -0,0 +1,213 @@
+import io
+import json
+from typing import Optional
+
+from marshmallow import Schema, fields
+import pytest
+from pytest_mock import MockerFixture
+
+bottle = pytest.importorskip("bottle")
+
+from bottle import Bottle, HTTPResponse, BaseRequest
+from webargs import core
+
+from specargs import OneOf, WebargsAPISpec, encoding, framework, use_args, use_response
+from specargs.framework import bottle as bottle_framework
+
+
+class ValueSchema(Schema):
+    value = fields.Integer(required=True)
+
+
+@pytest.fixture(autouse=True)
+def active_framework(mocker: MockerFixture):
+    # Bottle is made the active framework even if other frameworks are installed
+    # The module's dictionary is patched directly so the originals aren't looked up through framework detection
+    mocker.patch.dict(framework.__dict__, {
+        attribute: getattr(bottle_framework, attribute) for attribute in framework.FRAMEWORK_ATTRIBUTES
+    })
+
+
+@pytest.fixture
+def app():
+    return Bottle()
+
+
+@pytest.fixture
+def spec():
+    return WebargsAPISpec("Test", "1.0.0", "3.0.2", plugins=[bottle_framework.BottleWebargsPlugin()])
+
+
+def call(app: Bottle, method: str, path: str, body: bytes = b"", **environ) -> dict:
+    '''Calls the WSGI application and returns the status, headers and body of its response'''
+    response = {}
+
+    def start_response(status, headers, exc_info=None):
+        response.update(status=int(status.split()[0]), headers=dict(headers))
+
+    environ = {
+        "REQUEST_METHOD": method,
+        "PATH_INFO": path,
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+        **environ,
+    }
+    response["body"] = b"".join(app(environ, start_response))
+    return response
+
+
+def test_create_paths_type_error(spec: WebargsAPISpec):
+    with pytest.raises(TypeError):
+        bottle_framework.create_paths(spec, "not an app")
+
+
+def test_create_paths(app: Bottle, spec: WebargsAPISpec):
+    @app.get("/users")
+    @use_response({})
+    def users():
+        ...  # pragma: no cover
+
+    @app.put("/users/<user_id:int>")
+    @use_args(ValueSchema(), location="json")
+    def user(args, user_id):
+        ...  # pragma: no cover
+
+    @app.put("/users/<user_id:int>")
+    def replaced_user(user_id):
+        ...  # pragma: no cover
+
+    @app.get("/pages/<name>/<version:re:v[0-9]+>/<path:path>")
+    def page(name, version, path):
+        ...  # pragma: no cover
+
+    admin = Bottle()
+    # Bottle 0.13 adds the routes of mounted applications to the parent's router as well, so both need the filter
+    for router in (app.router, admin.router): router.add_filter("hex", lambda config: (r"[0-9a-f]+", int, str))
+
+    @admin.delete("/items/<item_id:hex>")
+    def item(item_id):
+        ...  # pragma: no cover
+
+    app.mount("/admin/", admin)
+
+    bottle_framework.create_paths(spec, app)
+
+    paths = spec.to_dict()["paths"]
+    assert paths.keys() == {"/users", "/users/{user_id}", "/pages/{name}/{version}/{path}", "/admin/items/{item_id}"}
+    assert paths["/users"].keys() == {"get"}
+    assert paths["/users/{user_id}"].keys() == {"parameters", "put"}
+    assert "requestBody" not in paths["/users/{user_id}"]["put"]
+    assert paths["/users/{user_id}"]["parameters"] == [
+        {"name": "user_id", "in": "path", "required": True, "schema": {"type": "integer"}}
+    ]
+    assert [parameter["schema"] for parameter in paths["/pages/{name}/{version}/{path}"]["parameters"]] == [
+        {"type": "string", "minLength": 1},
+        {"type": "string", "pattern": "^v[0-9]+$"},
+        {"type": "string", "format": "url"},
+    ]
+    assert paths["/admin/items/{item_id}"].keys() == {"parameters", "delete"}
+    assert paths["/admin/items/{item_id}"]["parameters"][0]["schema"] == {"type": "string", "pattern": "^[0-9a-f]+$"}
+
+
+def test_create_paths_incremental(mocker: MockerFixture, app: Bottle, spec: WebargsAPISpec):
+    @app.get("/first")
+    def first():
+        ...  # pragma: no cover
+
+    bottle_framework.create_paths(spec, app)
+
+    @app.post("/first")
+    def second():
+        ...  # pragma: no cover
+
+    path = mocker.spy(spec, "path")
+    bottle_framework.create_paths(spec, app)
+
+    path.assert_called_once()
+    assert path.call_args.kwargs["view"] is second
+    assert spec.to_dict()["paths"]["/first"].keys() == {"get", "post"}
+
+
+def test_path_without_route(app: Bottle, spec: WebargsAPISpec):
+    @app.get("/users/<user_id:int>")
+    def user(user_id):
+        ...  # pragma: no cover
+
+    spec.path(view=user, app=app)
+
+    assert spec.to_dict()["paths"]["/users/{user_id}"].keys() == {"parameters", "get"}
+
+
+def test_route_views(app: Bottle):
+    @app.route("/users", ["GET", "POST"])
+    def users():
+        ...  # pragma: no cover
+
+    assert list(bottle_framework.route_views(app)) == [("GET /users", users), ("POST /users", users)]
+
+
+def test_add_spec_route(app: Bottle, spec: WebargsAPISpec):
+    spec.add_spec_route(app)
+
+    response = call(app, "GET", "/openapi.json")
+    assert json.loads(response["body"])["info"]["title"] == "Test"
+    assert response["headers"]["Content-Type"] == "application/json"
+
+    not_modified = call(app, "GET", "/openapi.json", HTTP_IF_NONE_MATCH=response["headers"]["Etag"])
+    assert not_modified["status"] == 304
+
+
+@pytest.mark.parametrize("data,content_type,expected_body,expected_content_type", (
+    pytest.param({"value": 1}, None, b'{"value":1}', "application/json", id="Unencoded"),
+    pytest.param(b'{"value":1}', "application/json", b'{"value":1}', "application/json", id="Encoded"),
+    pytest.param("", None, "", None, id="Empty"),
+))
+def test_make_response(data, content_type, expected_body, expected_content_type: Optional[str]):
+    response = bottle_framework.make_response(data, 201, content_type)
+
+    assert isinstance(response, HTTPResponse)
+    assert response.status_code == 201
+    assert response.body == expected_body
+    assert response.get_header("Content-Type") == expected_content_type
+
+
+def test_view(app: Bottle):
+    @app.post("/")
+    @use_args(OneOf(ValueSchema), location="json")
+    @use_response(ValueSchema, status_code=201)
+    def create(args):
+        return {**args, "other": 1}
+
+    @app.get("/")
+    @use_response(ValueSchema, stream="json")
+    def stream():
+        return ({"value": i} for i in range(2))
+
+    created = call(app, "POST", "/", b'{"value": 1}', CONTENT_TYPE="application/json")
+    assert created["status"] == 201
+    assert created["headers"]["Content-Type"] == "application/json"
+    assert json.loads(created["body"]) == {"value": 1}
+
+    streamed = call(app, "GET", "/")
+    assert json.loads(streamed["body"]) == [{"value": 0}, {"value": 1}]
+
+
+def test_get_request_body_cached(mocker: MockerFixture):
+    decoder = mocker.patch.object(encoding, "json_decoder", mocker.Mock(side_effect=encoding.json_decoder))
+    body = b'{"value": 1}'
+    request = BaseRequest({
+        "REQUEST_METHOD": "POST",
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+    })
+
+    assert bottle_framework.parser.load_json(request, ValueSchema()) == {"value": 1}
+    assert bottle_framework.get_request_body(request) == {"value": 1}
+    decoder.assert_called_once()
+
+
+def test_parser_non_json_request():
+    request = BaseRequest({"REQUEST_METHOD": "POST", "CONTENT_LENGTH": "7", "wsgi.input": io.BytesIO(b"value=1")})
+
+    assert bottle_framework.parser.load_json(request, ValueSchema()) is core.missing
@@ -1,5 +1,8 @@
+import asyncio
 from collections.abc import Iterable
 from http import HTTPStatus
+import inspect
+import threading
 from typing import Any, Optional, Union
 
 from marshmallow import Schema
@@ -16,8 +19,8 @@ MODULE_TO_TEST = decorators # Needed for shared pytest mock fixtures in conftest
 
 @pytest.fixture
 def parser(mocker: MockerFixture):
-    default_location = decorators.parser.DEFAULT_LOCATION
-    mock = mocker.patch.object(decorators, "parser")
+    default_location = decorators.core.Parser.DEFAULT_LOCATION
+    mock = mocker.patch.object(decorators.framework, "parser")
 
     def decorate(f):
         f.decorated = True
@@ -29,6 +32,16 @@ def parser(mocker: MockerFixture):
     return mock
 
 
+@pytest.fixture
+def make_response(mocker: MockerFixture):
+    return mocker.patch.object(decorators.framework, "make_response", autospec=True)
+
+
+@pytest.fixture
+def make_streaming_response(mocker: MockerFixture):
+    return mocker.patch.object(decorators.framework, "make_streaming_response", autospec=True)
+
+
 def test_use_args_inpoly_invalid_location():
     with pytest.raises(ValueError):
         decorators.use_args(OneOf(), location="not json")
@@ -43,10 +56,14 @@ def test_use_args(mocker: MockerFixture, parser: MagicMock, with_location: bool)
     args = ("these", "don't", "matter")
     kwargs = {"also": "really", "don't": "matter"}
     if with_location: kwargs["location"] = "location"
-    func = lambda: "WRAP ME!"
+    func = MagicMock()
+    del func.webargs
+    del func.is_specargs_wrapper
     Webargs = mocker.patch.object(decorators, "Webargs", autospec=True)
+    parse = parser.use_args.return_value
+    parse.side_effect = lambda parsed: parsed
 
-    func = decorators.use_args(argpoly, *args, **kwargs)(func)
+    wrapped_func = decorators.use_args(argpoly, *args, **kwargs)(func)
 
     expected_location = kwargs.pop("location", parser.DEFAULT_LOCATION)
     Webargs.assert_called_once_with(argpoly, expected_location)
@@ -56,9 +73,108 @@ def test_use_args(mocker: MockerFixture, parser: MagicMock, with_location: bool)
         location=expected_location,
         **kwargs
     )
-    parser.use_args.return_value.assert_called_once_with(func)
-    assert func.decorated
+    parse.assert_called_once()
+    assert parse.call_args.args[0].__wrapped__ is func
+    assert wrapped_func.__wrapped__.__wrapped__ is func
+    assert wrapped_func.is_specargs_wrapper
     assert func.webargs == [Webargs.return_value]
+    assert wrapped_func.webargs == func.webargs
+
+    assert wrapped_func("request args") == func.return_value
+    func.assert_called_once_with("request args")
+
+
+def test_use_args_offload_threshold_not_async(parser: MagicMock):
+    with pytest.raises(ValueError):
+        decorators.use_args({}, offload_threshold=0)(lambda: None)
+
+
+@pytest.mark.parametrize("offload_threshold,content_length,offloaded", (
+    pytest.param(None, 10, False, id="Without offload_threshold"),
+    pytest.param(100, 10, False, id="Below offload_threshold"),
+    pytest.param(100, 100, True, id="At offload_threshold"),
+))
+def test_use_args_async(
+    mocker: MockerFixture,
+    parser: MagicMock,
+    offload_threshold: Optional[int],
+    content_length: int,
+    offloaded: bool,
+):
+    mocker.patch.object(decorators, "_content_length", return_value=content_length)
+    threads = []
+
+    def webargs_decorator(parsed):
+        def parse(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return parsed(*args, **kwargs)
+        return parse
+
+    async def view(args):
+        threads.append(threading.get_ident())
+        return args
+
+    parser.use_args.return_value.side_effect = webargs_decorator
+    wrapped_func = decorators.use_args({}, offload_threshold=offload_threshold)(view)
+
+    assert inspect.iscoroutinefunction(wrapped_func)
+    assert asyncio.run(wrapped_func("request args")) == "request args"
+    assert (threads[0] != threads[1]) == offloaded
+    assert threads[1] == threading.get_ident()
+
+
+@pytest.mark.parametrize("location,received", (
+    pytest.param("json", True, id="Body location"),
+    pytest.param("query", False, id="Other location"),
+))
+def test_use_args_async_receive_request_body(mocker: MockerFixture, parser: MagicMock, location: str, received: bool):
+    receive_request_body = mocker.patch.object(
+        decorators.framework, "receive_request_body", mocker.AsyncMock(), create=True
+    )
+    parser.get_default_request.return_value = "request"
+
+    async def view(args):
+        return args
+
+    parser.use_args.return_value.side_effect = lambda parsed: parsed
+    wrapped_func = decorators.use_args({}, location=location)(view)
+
+    assert asyncio.run(wrapped_func("request args")) == "request args"
+    if received: receive_request_body.assert_awaited_once_with("request")
+    else: receive_request_body.assert_not_called()
+
+
+def test_use_args_backend(mocker: MockerFixture, parser: MagicMock):
+    get_backend = mocker.patch.object(decorators.framework, "get_backend", autospec=True)
+    backend_parser = get_backend.return_value.parser
+    backend_parser.use_args.return_value.side_effect = lambda parsed: parsed
+
+    decorators.use_args({}, backend="starlette")(lambda: None)
+
+    get_backend.assert_called_once_with("starlette")
+    backend_parser.use_args.assert_called_once()
+    parser.use_args.assert_not_called()
+
+
+@pytest.mark.parametrize("with_unknown", (
+    pytest.param(True, id="With unknown"),
+    pytest.param(False, id="Without unknown"),
+))
+def test_use_args_inpoly(mocker: MockerFixture, parser: MagicMock, with_unknown: bool):
+    argpoly = OneOf()
+    kwargs = {"location": "json"}
+    if with_unknown: kwargs["unknown"] = "unknown"
+    func = lambda: "WRAP ME!"
+    Webargs = mocker.patch.object(decorators, "Webargs", autospec=True)
+
+    func = decorators.use_args(argpoly, **kwargs)(func)
+
+    Webargs.assert_called_once_with(argpoly, "json")
+    parser.use_args.assert_called_once()
+    argmap = parser.use_args.call_args.args[0]
+    assert argmap("request") is argpoly
+    assert parser.use_args.call_args.kwargs == {"location": "json", "unknown": kwargs.get("unknown")}
+    assert func.decorated
 
 
 def test_use_kwargs(mocker: MockerFixture):
@@ -90,35 +206,125 @@ def test_get_response_data_and_status(data: Any):
     pytest.param(set(), True, id="Set"),
 ))
 @pytest.mark.parametrize("schema_type", (decorators.Schema, decorators.InPoly))
-def test_dump_response_schema_schema_or_inpoly(obj: Any, many: bool, schema_type: type):
+def test_response_dumper_schema_or_inpoly(obj: Any, many: bool, schema_type: type):
     schema = MagicMock(spec=schema_type)
 
-    result = decorators._dump_response_schema(obj, schema)
+    result = decorators._response_dumper(schema)(obj)
 
     schema.dump.assert_called_once_with(obj, many=many)
     assert result == schema.dump.return_value
 
 
-def test_dump_response_schema_field():
+def test_response_dumper_field():
     obj = "obj"
     schema = MagicMock(spec=decorators.fields.Field)
 
-    result = decorators._dump_response_schema(obj, schema)
+    result = decorators._response_dumper(schema)(obj)
 
     schema.serialize.assert_called_once()
     assert schema.serialize.call_args.args[:2] == ("unused", obj)
     assert result == schema.serialize.return_value
 
 
-def test_dump_response_schema_none():
+def test_response_dumper_none():
     obj = "obj"
     schema = None
 
-    result = decorators._dump_response_schema(obj, schema)
+    result = decorators._response_dumper(schema)(obj)
 
     assert result == ""
 
 
+@pytest.mark.parametrize("schema,expected_content_type", (
+    pytest.param(Schema(), "application/json", id="Schema"),
+    pytest.param(OneOf(), "application/json", id="InPoly"),
+    pytest.param(decorators.fields.String(), None, id="Field"),
+    pytest.param(None, None, id="None"),
+))
+def test_json_content_type(schema: Any, expected_content_type: Optional[str]):
+    result = decorators._json_content_type(decorators.Response(schema))
+
+    assert result == expected_content_type
+
+
+@pytest.mark.parametrize("stream,objs,expected_chunks", (
+    pytest.param("json", [1, 2, 3], [b'[{"value":1}', b',{"value":2}', b',{"value":3}', b"]"], id="JSON"),
+    pytest.param("json", [], [b"[]"], id="Empty JSON"),
+    pytest.param("ndjson", [1, 2], [b'{"value":1}\n', b'{"value":2}\n'], id="NDJSON"),
+    pytest.param("ndjson", [], [], id="Empty NDJSON"),
+))
+def test_stream_chunks(mocker: MockerFixture, stream: str, objs: list, expected_chunks: list):
+    mocker.patch.object(decorators.encoding, "json_encoder", None)
+    dump = MagicMock(side_effect=lambda obj: {"value": obj})
+
+    chunks = decorators._stream_chunks(dump, iter(objs), stream)
+
+    dump.assert_not_called()
+    assert list(chunks) == expected_chunks
+    assert dump.call_count == len(objs)
+
+
+def test_stream_chunks_json_encoder(mocker: MockerFixture):
+    json_encoder = mocker.patch.object(decorators.encoding, "json_encoder", MagicMock(return_value=b"encoded"))
+    dump = MagicMock()
+
+    chunks = list(decorators._stream_chunks(dump, ["obj"], "json"))
+
+    dump.assert_called_once_with("obj")
+    json_encoder.assert_called_once_with(dump.return_value)
+    assert chunks == [b"[encoded", b"]"]
+
+
+@pytest.mark.parametrize("stream", ("json", "ndjson"))
+def test_response_maker_stream(mocker: MockerFixture, make_streaming_response: MagicMock, stream: str):
+    response = MagicMock()
+    _stream_chunks = mocker.patch.object(decorators, "_stream_chunks")
+
+    result = decorators._response_maker(response, stream)("data", HTTPStatus.OK)
+
+    _stream_chunks.assert_called_once_with(response.schema.dump, "data", stream)
+    make_streaming_response.assert_called_once_with(
+        _stream_chunks.return_value, HTTPStatus.OK, decorators.STREAM_CONTENT_TYPES[stream]
+    )
+    assert result == make_streaming_response.return_value
+
+
+@pytest.mark.parametrize("json_content_type", (
+    pytest.param("application/json", id="JSON content"),
+    pytest.param(None, id="Other content"),
+))
+@pytest.mark.parametrize("with_encoder", (
+    pytest.param(True, id="With JSON encoder"),
+    pytest.param(False, id="Without JSON encoder"),
+))
+def test_response_maker(
+    mocker: MockerFixture,
+    make_response: MagicMock,
+    json_content_type: Optional[str],
+    with_encoder: bool,
+):
+    response = MagicMock()
+    _response_dumper = mocker.patch.object(decorators, "_response_dumper")
+    _json_content_type = mocker.patch.object(decorators, "_json_content_type", return_value=json_content_type)
+    json_encoder = mocker.patch.object(decorators.encoding, "json_encoder", MagicMock() if with_encoder else None)
+
+    maker = decorators._response_maker(response, None)
+
+    _response_dumper.assert_called_once_with(response.schema)
+    _json_content_type.assert_called_once_with(response)
+
+    result = maker("data", HTTPStatus.OK)
+
+    dumper = _response_dumper.return_value
+    dumper.assert_called_once_with("data")
+    if with_encoder and json_content_type:
+        json_encoder.assert_called_once_with(dumper.return_value)
+        make_response.assert_called_once_with(json_encoder.return_value, HTTPStatus.OK, json_content_type)
+    else:
+        make_response.assert_called_once_with(dumper.return_value, HTTPStatus.OK)
+    assert result == make_response.return_value
+
+
 @pytest.fixture
 def ensure_response(mocker: MockerFixture):
     return mocker.patch.object(decorators, "ensure_response", autospec=True)
@@ -178,14 +384,18 @@ def test_use_response_unregistered_status_code(
     pytest.param(True, id="Previously wrapped"),
     pytest.param(False, id="Not previously wrapped"),
 ))
+@pytest.mark.parametrize("stream", (
+    pytest.param(None, id="Not streamed"),
+    pytest.param("ndjson", id="Streamed"),
+))
 def test_use_response(
     mocker: MockerFixture,
     ensure_response: MagicMock,
-    make_response: MagicMock,
     _get_response_data_and_status: MagicMock,
     status_code: Optional[Union[HTTPStatus, int]],
     with_description: bool,
     already_wrapped: bool,
+    stream: Optional[str],
 ):
     response_or_argpoly = "response_or_argpoly"
     headers = {"first": "first header", "second": "second header", "third": "third header"}
@@ -195,20 +405,24 @@ def test_use_response(
         func.__wrapped__ = MagicMock()
         func.__wrapped__.responses = {}
         func.responses = func.__wrapped__.responses
+        func.__wrapped__.response_makers = {}
+        func.response_makers = func.__wrapped__.response_makers
     else:
         del func.is_resp_wrapper
         del func.responses
+        del func.response_makers
     args = ("these", "don't", "matter")
     kwargs = {"also": "really", "don't": "matter"}
     response: MagicMock = ensure_response.return_value
+    response.schema = Schema()
     use_response_kwargs = {}
     if status_code: use_response_kwargs["status_code"] = status_code
     if with_description: use_response_kwargs["description"] = "a description"
     expected_status_code = HTTPStatus(use_response_kwargs.get("status_code", HTTPStatus.OK))
-    response_data, response_status = _get_response_data_and_status.return_value
-    _dump_response_schema = mocker.patch.object(decorators, "_dump_response_schema")
+    response_data, response_status = _get_response_data_and_status.return_value = ("response_data", HTTPStatus.CREATED)
+    _response_maker = mocker.patch.object(decorators, "_response_maker")
 
-    decorator = decorators.use_response(response_or_argpoly, **use_response_kwargs, **headers)
+    decorator = decorators.use_response(response_or_argpoly, **use_response_kwargs, stream=stream, **headers)
 
     ensure_response.assert_called_once_with(
         response_or_argpoly,
@@ -224,15 +438,120 @@ def test_use_response(
     assert wrapped_func.is_resp_wrapper
     assert wrapped_func.responses[expected_status_code] == response
 
-    func.responses[response_status] = response
+    _response_maker.assert_called_once_with(response, stream, decorators.framework)
+    maker = _response_maker.return_value
+    assert wrapped_func.response_makers[expected_status_code] == maker
+
+    wrapped_func.response_makers[response_status] = maker
 
     output = wrapped_func(*args, **kwargs)
 
     func.assert_called_once_with(*args, **kwargs)
     _get_response_data_and_status.assert_called_once_with(func.return_value, expected_status_code)
-    _dump_response_schema(response_data, response.schema)
-    make_response.assert_called_once_with(_dump_response_schema.return_value, response_status)
-    assert output == make_response.return_value
+    maker.assert_called_once_with(response_data, response_status)
+    assert output == maker.return_value
+
+
+@pytest.mark.parametrize("schema,stream", (
+    pytest.param(Schema(), "csv", id="Unsupported format"),
+    pytest.param(decorators.fields.String(), "json", id="Field"),
+    pytest.param(None, "ndjson", id="Empty"),
+))
+def test_use_response_stream_error(ensure_response: MagicMock, schema: Any, stream: str):
+    ensure_response.return_value.schema = schema
+
+    with pytest.raises(ValueError):
+        decorators.use_response("response_or_argpoly", stream=stream)
+
+
+@pytest.mark.parametrize("view_data,expected_output", (
+    pytest.param("data", ({"value": "data"}, HTTPStatus.OK), id="Default status code"),
+    pytest.param(
+        decorators.ViewResponse("data", HTTPStatus.NOT_FOUND), ("data", HTTPStatus.NOT_FOUND), id="Other status code"
+    ),
+))
+def test_use_response_stacked(make_response: MagicMock, view_data: Any, expected_output: tuple):
+    make_response.side_effect = lambda data, status: (data, status)
+
+    @decorators.use_response({"value": decorators.fields.Function(lambda obj: obj)})
+    @decorators.use_response(decorators.fields.String(), status_code=HTTPStatus.NOT_FOUND)
+    def view():
+        return view_data
+
+    assert view.response_makers.keys() == {HTTPStatus.OK, HTTPStatus.NOT_FOUND}
+    assert view() == expected_output
+
+
+@pytest.mark.parametrize("view_data,expected_output", (
+    pytest.param("data", ({"value": "data"}, HTTPStatus.OK), id="Default status code"),
+    pytest.param(
+        decorators.ViewResponse("data", HTTPStatus.NOT_FOUND), ("data", HTTPStatus.NOT_FOUND), id="Other status code"
+    ),
+))
+def test_use_response_async(make_response: MagicMock, view_data: Any, expected_output: tuple):
+    make_response.side_effect = lambda data, status: (data, status)
+
+    @decorators.use_response({"value": decorators.fields.Function(lambda obj: obj)})
+    @decorators.use_response(decorators.fields.String(), status_code=HTTPStatus.NOT_FOUND)
+    async def view():
+        return view_data
+
+    assert inspect.iscoroutinefunction(view)
+    assert asyncio.run(view()) == expected_output
+
+
+def test_use_response_offload_threshold_not_async():
+    with pytest.raises(ValueError):
+        decorators.use_response(None, offload_threshold=0)(lambda: None)
+
+
+@pytest.mark.parametrize("offload_threshold,view_data,offloaded", (
+    pytest.param(None, [1, 2], False, id="Without offload_threshold"),
+    pytest.param(3, [1, 2], False, id="Below offload_threshold"),
+    pytest.param(2, [1, 2], True, id="At offload_threshold"),
+    pytest.param(1, 1, True, id="Single object"),
+))
+def test_use_response_async_offload(
+    mocker: MockerFixture, make_response: MagicMock, offload_threshold: Optional[int], view_data: Any, offloaded: bool
+):
+    threads = []
+    make_response.side_effect = lambda data, status: threads.append(threading.get_ident())
+    send_response = mocker.patch.object(decorators.framework, "send_response", autospec=True)
+
+    @decorators.use_response(decorators.fields.Raw(), offload_threshold=offload_threshold)
+    async def view(*args):
+        return view_data
+
+    assert asyncio.run(view("handler")) == send_response.return_value
+    assert (threads[0] != threading.get_ident()) == offloaded
+    send_response.assert_called_once_with(None, ("handler",))
+
+
+def test_use_response_send_response_awaited(mocker: MockerFixture, make_response: MagicMock):
+    async def send(response, view_args):
+        return "sent"
+
+    mocker.patch.object(decorators.framework, "send_response", side_effect=send)
+
+    @decorators.use_response(None)
+    async def view():
+        ...
+
+    assert asyncio.run(view()) == "sent"
+
+
+def test_use_response_backend(mocker: MockerFixture, make_response: MagicMock):
+    get_backend = mocker.patch.object(decorators.framework, "get_backend", autospec=True)
+    backend_module = get_backend.return_value
+    backend_module.send_response.side_effect = lambda response, view_args: response
+
+    @decorators.use_response(None, backend="starlette")
+    def view():
+        ...
+
+    assert view() == backend_module.make_response.return_value
+    get_backend.assert_called_once_with("starlette")
+    make_response.assert_not_called()
 
 
 def test_use_empty_response(mocker: MockerFixture):
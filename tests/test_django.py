@@ -0,0 +1,259 @@
+import json
+from types import ModuleType
+
+from marshmallow import Schema, fields
+import pytest
+from pytest_mock import MockerFixture
+
+django = pytest.importorskip("django")
+
+from django.conf import settings
+
+if not settings.configured: settings.configure(ALLOWED_HOSTS=["testserver"], DEFAULT_CHARSET="utf-8")
+
+from django import urls
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.views import View
+from django.views.decorators.http import require_POST
+from webargs import core
+
+from specargs import OneOf, WebargsAPISpec, encoding, framework, use_args, use_response
+from specargs.framework import django as django_framework
+
+
+class ValueSchema(Schema):
+    value = fields.Integer(required=True)
+
+
+@pytest.fixture(autouse=True)
+def active_framework(mocker: MockerFixture):
+    # Django is made the active framework even if other frameworks are installed
+    # The module's dictionary is patched directly so the originals aren't looked up through framework detection
+    mocker.patch.dict(framework.__dict__, {
+        attribute: getattr(django_framework, attribute) for attribute in framework.FRAMEWORK_ATTRIBUTES
+    })
+
+
+@pytest.fixture
+def urlconf(mocker: MockerFixture):
+    module = ModuleType("test_urlconf")
+    module.urlpatterns = []
+    mocker.patch.dict("sys.modules", {module.__name__: module})
+    yield module
+    urls.clear_url_caches()
+
+
+@pytest.fixture
+def resolver(urlconf: ModuleType):
+    return urls.get_resolver(urlconf.__name__)
+
+
+@pytest.fixture
+def spec():
+    return WebargsAPISpec("Test", "1.0.0", "3.0.2", plugins=[django_framework.DjangoWebargsPlugin()])
+
+
+def test_create_paths_type_error(spec: WebargsAPISpec):
+    with pytest.raises(TypeError):
+        django_framework.create_paths(spec, 1)
+
+
+def test_create_paths(urlconf: ModuleType, resolver: urls.URLResolver, spec: WebargsAPISpec):
+    @use_response({})
+    def users(request):
+        ...  # pragma: no cover
+
+    @require_POST
+    @use_args(ValueSchema(), location="json")
+    def user(request, args, user_id):
+        ...  # pragma: no cover
+
+    class ItemView(View):
+        @use_response({})
+        def get(self, request, item_id):
+            ...  # pragma: no cover
+
+        def delete(self, request, item_id):
+            ...  # pragma: no cover
+
+    def unreachable(request):
+        ...  # pragma: no cover
+
+    urlconf.urlpatterns += [
+        urls.path("users", users),
+        urls.path("users/<int:user_id>", user),
+        urls.path("users", unreachable),
+        urls.path("api/", urls.include([urls.re_path(r"^items/(?P<item_id>[0-9a-f]{8})\.json$", ItemView.as_view())])),
+    ]
+
+    django_framework.create_paths(spec, resolver)
+
+    paths = spec.to_dict()["paths"]
+    assert paths.keys() == {"/users", "/users/{user_id}", "/api/items/{item_id}.json"}
+    assert paths["/users"].keys() == {"get"}
+    assert paths["/users/{user_id}"].keys() == {"parameters", "post"}
+    assert "requestBody" in paths["/users/{user_id}"]["post"]
+    assert paths["/users/{user_id}"]["parameters"] == [
+        {"name": "user_id", "in": "path", "required": True, "schema": {"type": "integer", "minimum": 0}}
+    ]
+    assert paths["/api/items/{item_id}.json"].keys() == {"parameters", "get", "delete"}
+    assert paths["/api/items/{item_id}.json"]["parameters"] == [
+        {"name": "item_id", "in": "path", "required": True, "schema": {"type": "string", "pattern": "^[0-9a-f]{8}$"}}
+    ]
+
+
+def test_create_paths_function_view_methods(urlconf: ModuleType, resolver: urls.URLResolver, spec: WebargsAPISpec):
+    @use_args({"value": fields.Integer()}, location="query")
+    def listed(request, args):
+        ...  # pragma: no cover
+
+    listed.http_method_names = ["get", "put", "options"]
+
+    @use_args({"value": fields.Integer()}, location="form")
+    def form(request, args):
+        ...  # pragma: no cover
+
+    @use_args({"value": fields.Integer()}, location="query")
+    def query(request, args):
+        ...  # pragma: no cover
+
+    urlconf.urlpatterns += [urls.path("listed", listed), urls.path("form", form), urls.path("query", query)]
+
+    django_framework.create_paths(spec, resolver)
+
+    paths = spec.to_dict()["paths"]
+    assert paths["/listed"].keys() == {"get", "put"}
+    assert paths["/form"].keys() == {"post"}
+    assert paths["/query"].keys() == {"get"}
+
+
+def test_create_paths_incremental(
+    mocker: MockerFixture, urlconf: ModuleType, resolver: urls.URLResolver, spec: WebargsAPISpec
+):
+    def first(request):
+        ...  # pragma: no cover
+
+    def second(request):
+        ...  # pragma: no cover
+
+    urlconf.urlpatterns.append(urls.path("first", first))
+    django_framework.create_paths(spec, resolver)
+
+    urlconf.urlpatterns.append(urls.path("second", second))
+    path = mocker.spy(spec, "path")
+    django_framework.create_paths(spec, urlconf.__name__)
+
+    path.assert_called_once()
+    assert path.call_args.kwargs["view"] is second
+    assert spec.to_dict()["paths"].keys() == {"/first", "/second"}
+
+
+def test_path_without_patterns(urlconf: ModuleType, resolver: urls.URLResolver, spec: WebargsAPISpec):
+    def view(request, slug):
+        ...  # pragma: no cover
+
+    urlconf.urlpatterns.append(urls.path("pages/<slug:slug>", view))
+
+    spec.path(view=view, app=resolver)
+
+    assert spec.to_dict()["paths"]["/pages/{slug}"]["parameters"][0]["schema"] == {
+        "type": "string", "pattern": "^[-a-zA-Z0-9_]+$"
+    }
+
+
+def test_route_views(urlconf: ModuleType, resolver: urls.URLResolver):
+    def view(request, user_id):
+        ...  # pragma: no cover
+
+    urlconf.urlpatterns.append(urls.path("users/", urls.include([urls.path("<uuid:user_id>", view)])))
+
+    assert list(django_framework.route_views(resolver)) == [("users/<uuid:user_id>", view)]
+
+
+def test_add_spec_route(urlconf: ModuleType, resolver: urls.URLResolver, spec: WebargsAPISpec):
+    spec.add_spec_route(resolver)
+
+    view = urls.resolve("/openapi.json", urlconf.__name__).func
+    response = view(RequestFactory().get("/openapi.json"))
+    assert json.loads(response.content)["info"]["title"] == "Test"
+
+    not_modified = view(RequestFactory().get("/openapi.json", HTTP_IF_NONE_MATCH=response["ETag"]))
+    assert not_modified.status_code == 304
+    assert view(RequestFactory().post("/openapi.json")).status_code == 405
+
+
+@pytest.mark.parametrize("data,content_type,expected_body,expected_content_type", (
+    pytest.param({"value": 1}, None, b'{"value":1}', "application/json", id="Unencoded"),
+    pytest.param(b'{"value":1}', "application/json", b'{"value":1}', "application/json", id="Encoded"),
+    pytest.param("", None, b"", "text/html; charset=utf-8", id="Empty"),
+))
+def test_make_response(data, content_type, expected_body: bytes, expected_content_type: str):
+    response = django_framework.make_response(data, 201, content_type)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == 201
+    assert response.content == expected_body
+    assert response["Content-Type"] == expected_content_type
+
+
+def test_use_response():
+    @use_response(ValueSchema, status_code=201)
+    def view(request):
+        return {"value": 1, "other": 2}
+
+    response = view(RequestFactory().get("/"))
+
+    assert response.status_code == 201
+    assert json.loads(response.content) == {"value": 1}
+
+
+def test_get_request_body_cached(mocker: MockerFixture):
+    decoder = mocker.patch.object(encoding, "json_decoder", mocker.Mock(side_effect=encoding.json_decoder))
+
+    @use_args(OneOf(ValueSchema), location="json")
+    def view(request, args):
+        return args
+
+    request = RequestFactory().post("/", data={"value": 1}, content_type="application/json")
+
+    assert view(request) == {"value": 1}
+    assert django_framework.get_request_body(request) == {"value": 1}
+    decoder.assert_called_once()
+
+
+def test_parser_non_json_request():
+    request = RequestFactory().post("/", data={"value": "1"})
+
+    assert django_framework.parser.load_json(request, ValueSchema()) is core.missing
+
+
+def test_artifact_fingerprint(urlconf: ModuleType, resolver: urls.URLResolver, spec: WebargsAPISpec):
+    from specargs.artifact import fingerprint
+
+    class ItemView(View):
+        def get(self, request):
+            ...  # pragma: no cover
+
+    urlconf.urlpatterns.append(urls.path("items", ItemView.as_view()))
+    original = fingerprint(spec, resolver)
+
+    ItemView.get = use_response({})(ItemView.get)
+
+    assert fingerprint(spec, resolver) != original
+
+
+def test_artifact_fingerprint_function_view_methods(
+    urlconf: ModuleType, resolver: urls.URLResolver, spec: WebargsAPISpec
+):
+    from specargs.artifact import fingerprint
+
+    def items(request):
+        ...  # pragma: no cover
+
+    urlconf.urlpatterns.append(urls.path("items", items))
+    original = fingerprint(spec, resolver)
+
+    items.http_method_names = ["post"]
+
+    assert fingerprint(spec, resolver) != original
@@ -0,0 +1,189 @@
+import dataclasses
+import datetime
+import decimal
+import json
+from types import SimpleNamespace
+import uuid
+
+import pytest
+from pytest_mock import MockerFixture
+
+from specargs import encoding
+
+
+@pytest.fixture(autouse=True)
+def json_encoder(mocker: MockerFixture):
+    return mocker.patch.object(encoding, "json_encoder", None)
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+
+DATA = {"list": [1, 2.5, None, True], "text": "a/b", "nested": {"key": "value"}}
+
+
+@pytest.mark.parametrize("name", ("json", "orjson", "ujson"))
+def test_set_json_encoder_name(name: str):
+    pytest.importorskip(name)
+
+    encoding.set_json_encoder(name)
+
+    result = encoding.json_encoder(DATA)
+
+    assert isinstance(result, bytes)
+    assert json.loads(result) == DATA
+
+
+@pytest.mark.parametrize("name", ("json", "orjson", "ujson"))
+@pytest.mark.parametrize("value", (
+    pytest.param(decimal.Decimal("1.50"), id="Decimal"),
+    pytest.param(uuid.UUID("8c2f4a3e-5b7d-4e1f-9a6c-0d3b2e1f4a5c"), id="UUID"),
+    pytest.param(datetime.datetime(2020, 1, 2, 3, 4, 5), id="Naive datetime"),
+    pytest.param(
+        datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=2))),
+        id="Aware datetime",
+    ),
+    pytest.param(datetime.date(2020, 1, 2), id="Date"),
+    pytest.param(Point(1, 2), id="Dataclass"),
+))
+def test_set_json_encoder_flask_types(name: str, value):
+    pytest.importorskip(name)
+    flask_json = pytest.importorskip("flask.json")
+    if name == "ujson" and isinstance(value, decimal.Decimal): pytest.skip("ujson encodes decimals as numbers")
+
+    encoding.set_json_encoder(name)
+
+    assert json.loads(encoding.json_encoder({"value": value})) == json.loads(flask_json.dumps({"value": value}))
+
+
+def test_set_json_encoder_unsupported_type():
+    encoding.set_json_encoder("json")
+
+    with pytest.raises(TypeError):
+        encoding.json_encoder(object())
+
+
+def test_set_json_encoder_auto(mocker: MockerFixture):
+    def missing():
+        raise ImportError
+
+    factories = {"first": missing, "second": mocker.Mock(), "third": mocker.Mock()}
+    mocker.patch.object(encoding, "_ENCODER_FACTORIES", factories)
+
+    encoding.set_json_encoder()
+
+    factories["third"].assert_not_called()
+    assert encoding.json_encoder == factories["second"].return_value
+
+
+@pytest.mark.parametrize("encoder", (
+    pytest.param(lambda obj: b"", id="Callable"),
+    pytest.param(None, id="None"),
+))
+def test_set_json_encoder_callable_or_none(encoder):
+    encoding.set_json_encoder(encoder)
+
+    assert encoding.json_encoder is encoder
+
+
+def test_set_json_encoder_invalid():
+    with pytest.raises(ValueError):
+        encoding.set_json_encoder("invalid")
+
+
+@pytest.fixture
+def json_decoder(mocker: MockerFixture):
+    return mocker.patch.object(encoding, "json_decoder", encoding.json_decoder)
+
+
+@pytest.mark.parametrize("name", ("json", "orjson", "ujson"))
+def test_set_json_decoder_name(json_decoder, name: str):
+    pytest.importorskip(name)
+
+    encoding.set_json_decoder(name)
+
+    assert encoding.json_decoder(json.dumps(DATA).encode()) == DATA
+
+
+def test_set_json_decoder_auto(mocker: MockerFixture, json_decoder):
+    def missing():
+        raise ImportError
+
+    factories = {"first": missing, "second": mocker.Mock(), "third": mocker.Mock()}
+    mocker.patch.object(encoding, "_DECODER_FACTORIES", factories)
+
+    encoding.set_json_decoder()
+
+    factories["third"].assert_not_called()
+    assert encoding.json_decoder == factories["second"].return_value
+
+
+def test_set_json_decoder_callable(json_decoder):
+    decoder = lambda body: {}
+
+    encoding.set_json_decoder(decoder)
+
+    assert encoding.json_decoder is decoder
+
+
+def test_set_json_decoder_invalid(json_decoder):
+    with pytest.raises(ValueError):
+        encoding.set_json_decoder("invalid")
+
+
+def test_decode_request_body(mocker: MockerFixture, json_decoder):
+    request = SimpleNamespace()
+    read_body = mocker.Mock(return_value=json.dumps(DATA).encode())
+
+    assert encoding.decode_request_body(request, read_body) == DATA
+    assert encoding.decode_request_body(request, read_body) == DATA
+
+    read_body.assert_called_once_with()
+
+
+@pytest.mark.parametrize("body,error_document", (
+    pytest.param(b"{", "{", id="Invalid"),
+    pytest.param(b"", "", id="Empty"),
+))
+def test_decode_request_body_error(json_decoder, body: bytes, error_document: str):
+    def decode(body):
+        raise ValueError("Invalid JSON")
+
+    encoding.set_json_decoder(decode)
+    request = SimpleNamespace()
+
+    with pytest.raises(json.JSONDecodeError) as error_info:
+        encoding.decode_request_body(request, lambda: body)
+
+    # webargs treats errors for empty documents as a missing body
+    assert error_info.value.doc == error_document
+    assert not hasattr(request, encoding.REQUEST_BODY_ATTRIBUTE)
+
+
+@pytest.mark.parametrize("body,error_document", (
+    pytest.param(b"\xff{", "\ufffd{", id="Invalid UTF-8"),
+    pytest.param(b"", "", id="Empty"),
+))
+def test_decode_request_body_json_error_document(json_decoder, body: bytes, error_document: str):
+    def decode(body):
+        raise json.JSONDecodeError("Invalid JSON", "", 0)
+
+    encoding.set_json_decoder(decode)
+
+    with pytest.raises(json.JSONDecodeError) as error_info:
+        encoding.decode_request_body(SimpleNamespace(), lambda: body)
+
+    assert error_info.value.doc == error_document
+
+
+def test_decode_request_body_orjson_invalid_utf8(json_decoder):
+    pytest.importorskip("orjson")
+    encoding.set_json_decoder("orjson")
+
+    with pytest.raises(json.JSONDecodeError) as error_info:
+        encoding.decode_request_body(SimpleNamespace(), lambda: b"\xff{")
+
+    assert error_info.value.doc
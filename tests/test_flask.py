@@ -0,0 +1,133 @@
+from flask import Flask
+from marshmallow import Schema, fields
+from webargs import core
+import pytest
+from pytest_mock import MockerFixture
+
+from specargs import OneOf, WebargsAPISpec, encoding, use_args, use_response
+from specargs.framework import flask
+
+
+@pytest.fixture
+def app():
+    return Flask(__name__, static_folder=None)
+
+
+@pytest.fixture
+def spec():
+    return WebargsAPISpec("Test", "1.0.0", "3.0.2", plugins=[flask.FlaskWebargsPlugin()])
+
+
+def test_create_paths_type_error(spec: WebargsAPISpec):
+    with pytest.raises(TypeError):
+        flask.create_paths(spec, "not an app")
+
+
+def test_create_paths_multiple_rules(app: Flask, spec: WebargsAPISpec):
+    @app.get("/users")
+    @app.post("/users/<int:user_id>")
+    @use_response({})
+    def users(user_id=None):
+        ...  # pragma: no cover
+
+    flask.create_paths(spec, app)
+
+    paths = spec.to_dict()["paths"]
+    assert paths.keys() == {"/users", "/users/{user_id}"}
+    assert paths["/users"].keys() == {"get"}
+    assert paths["/users/{user_id}"].keys() == {"parameters", "post"}
+
+
+def test_create_paths_incremental(mocker: MockerFixture, app: Flask, spec: WebargsAPISpec):
+    @app.get("/first")
+    @use_response({})
+    def first():
+        ...  # pragma: no cover
+
+    flask.create_paths(spec, app)
+    path = mocker.spy(spec, "path")
+
+    @app.get("/second")
+    @use_response({})
+    def second():
+        ...  # pragma: no cover
+
+    flask.create_paths(spec, app)
+
+    path.assert_called_once_with(view=second, app=app, rule=app.url_map._rules_by_endpoint["second"][0])
+    assert spec.to_dict()["paths"].keys() == {"/first", "/second"}
+
+
+def test_create_paths_changed_view(mocker: MockerFixture, app: Flask, spec: WebargsAPISpec):
+    @app.get("/first")
+    @use_response({})
+    def first():
+        ...  # pragma: no cover
+
+    flask.create_paths(spec, app)
+    path = mocker.spy(spec, "path")
+
+    @use_response({}, status_code=201)
+    def replacement():
+        ...  # pragma: no cover
+    app.view_functions["first"] = replacement
+
+    flask.create_paths(spec, app)
+
+    path.assert_called_once()
+    assert "201" in spec.to_dict()["paths"]["/first"]["get"]["responses"]
+
+
+def test_route_views(app: Flask):
+    @app.route("/users", methods=["GET", "POST"])
+    def users():
+        ...  # pragma: no cover
+
+    result = list(flask.route_views(app))
+
+    assert result == [("GET,HEAD,OPTIONS,POST /users", users)]
+
+
+def test_route_views_type_error():
+    with pytest.raises(TypeError):
+        list(flask.route_views("not an app"))
+
+
+@pytest.mark.skipif(not flask.parallel.is_supported(), reason="Forking processes is not supported")
+def test_create_paths_processes(app: Flask):
+    for i in range(5):
+        @use_response({}, description=f"Item {i}")
+        def item(item_id):
+            ...  # pragma: no cover
+        app.add_url_rule(f"/items{i}/<int:item_id>", endpoint=f"item{i}", view_func=item, methods=["GET", "DELETE"])
+    serial_spec = WebargsAPISpec("Test", "1.0.0", "3.0.2", plugins=[flask.FlaskWebargsPlugin()])
+    flask.create_paths(serial_spec, app)
+    spec = WebargsAPISpec("Test", "1.0.0", "3.0.2", plugins=[flask.FlaskWebargsPlugin()])
+
+    flask.create_paths(spec, app, processes=2)
+
+    assert spec.render().body == serial_spec.render().body
+    assert spec.created_paths.keys() == serial_spec.created_paths.keys()
+
+
+class ValueSchema(Schema):
+    value = fields.Integer(required=True)
+
+
+def test_get_request_body_cached(mocker: MockerFixture, app: Flask):
+    decoder = mocker.patch.object(encoding, "json_decoder", mocker.Mock(side_effect=encoding.json_decoder))
+
+    @use_args(OneOf(ValueSchema), location="json")
+    def view(args):
+        return args
+
+    with app.test_request_context("/", method="POST", json={"value": 1}):
+        assert view() == {"value": 1}
+        assert flask.get_request_body(flask.request) == {"value": 1}
+
+    decoder.assert_called_once()
+
+
+def test_parser_non_json_request(app: Flask):
+    with app.test_request_context("/", method="POST", data="value=1", content_type="application/x-www-form-urlencoded"):
+        assert flask.parser.load_json(flask.request, ValueSchema()) is core.missing
@@ -0,0 +1,95 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from specargs import framework
+
+
+@pytest.mark.parametrize("installed,expected_framework", (
+    pytest.param({"flask"}, framework.Framework.FLASK, id="Flask"),
+    pytest.param({"bottle", "requests"}, framework.Framework.BOTTLE, id="Bottle"),
+    pytest.param({"starlette", "anyio"}, framework.Framework.STARLETTE, id="Starlette"),
+))
+def test_determine_framework(mocker: MockerFixture, installed: set, expected_framework: framework.Framework):
+    mocker.patch.dict(framework.os.environ, clear=True)
+    mocker.patch.object(framework, "_is_installed", side_effect=installed.__contains__)
+
+    assert framework._determine_framework() == expected_framework
+
+
+@pytest.mark.parametrize("installed,expected_error", (
+    pytest.param(set(), framework.MissingFrameworkError, id="Missing"),
+    pytest.param({"flask", "django"}, framework.MultipleFrameworkError, id="Multiple"),
+))
+def test_determine_framework_error(mocker: MockerFixture, installed: set, expected_error: type):
+    mocker.patch.dict(framework.os.environ, clear=True)
+    mocker.patch.object(framework, "_is_installed", side_effect=installed.__contains__)
+
+    with pytest.raises(expected_error):
+        framework._determine_framework()
+
+
+def test_determine_framework_env_var(mocker: MockerFixture):
+    mocker.patch.dict(framework.os.environ, {framework.FRAMEWORK_ENV_VAR: "Tornado"})
+    _is_installed = mocker.patch.object(framework, "_is_installed")
+
+    assert framework._determine_framework() == framework.Framework.TORNADO
+    _is_installed.assert_not_called()
+
+
+def test_determine_framework_env_var_error(mocker: MockerFixture):
+    mocker.patch.dict(framework.os.environ, {framework.FRAMEWORK_ENV_VAR: "pyramid"})
+
+    with pytest.raises(framework.MissingFrameworkError):
+        framework._determine_framework()
+
+
+def test_is_installed():
+    assert framework._is_installed("pytest")
+    assert not framework._is_installed("not_a_real_module_name")
+
+
+def test_lazy_attribute(mocker: MockerFixture):
+    framework_module = mocker.Mock()
+    import_module = mocker.patch.object(framework.importlib, "import_module", return_value=framework_module)
+    mocker.patch.dict(framework.__dict__)
+    for attribute in framework.FRAMEWORK_ATTRIBUTES: framework.__dict__.pop(attribute, None)
+
+    assert framework.parser == framework_module.parser
+    assert framework.make_response == framework_module.make_response
+
+    import_module.assert_called_once_with(f".{framework.FRAMEWORK.value}", framework.__name__)
+
+
+def test_lazy_attribute_error():
+    with pytest.raises(AttributeError):
+        framework.not_a_framework_attribute
+
+
+@pytest.mark.parametrize("backend", ("flask", "Flask", framework.Framework.FLASK))
+def test_get_backend(mocker: MockerFixture, backend):
+    framework_module = mocker.Mock()
+    import_module = mocker.patch.object(framework.importlib, "import_module", return_value=framework_module)
+
+    assert framework.get_backend(backend) is framework_module
+    import_module.assert_called_once_with(".flask", framework.__name__)
+
+
+def test_get_backend_default():
+    assert framework.get_backend() is framework
+
+
+def test_get_backend_error():
+    with pytest.raises(framework.MissingFrameworkError):
+        framework.get_backend("pyramid")
+
+
+def test_lazy_framework(mocker: MockerFixture):
+    mocker.patch.dict(framework.__dict__)
+    framework.__dict__.pop("FRAMEWORK", None)
+    _determine_framework = mocker.patch.object(
+        framework, "_determine_framework", return_value=framework.Framework.DJANGO
+    )
+
+    assert framework.FRAMEWORK == framework.Framework.DJANGO
+    assert framework.FRAMEWORK == framework.Framework.DJANGO
+    _determine_framework.assert_called_once()
@@ -1,8 +1,12 @@
+import decimal
+import sqlite3
+from types import SimpleNamespace
 from typing import ClassVar, Tuple
 
 from unittest.mock import call, MagicMock
-from marshmallow import Schema, fields, EXCLUDE, ValidationError
+from marshmallow import Schema, fields, EXCLUDE, INCLUDE, RAISE, ValidationError, pre_dump, pre_load, validates, validates_schema
 import pytest
+from _pytest.fixtures import SubRequest
 from pytest_mock import MockerFixture
 
 from specargs import in_poly
@@ -14,12 +18,30 @@ from flask import Request
 MODULE_TO_TEST = in_poly
 
 
+@pytest.fixture(autouse=True)
+def get_request_body(mocker: MockerFixture):
+    # Request bodies are decoded by the framework module, which is tested separately
+    return mocker.patch.object(in_poly.framework, "get_request_body", side_effect=lambda request: request.json)
+
+
 class InPolyTestSubclass(in_poly.InPoly):
     keyword: ClassVar[str] = "test"
 
+    def _valid_schema_dumps(self):
+        pass
+
+    def _select_schema_dumps(self):
+        pass
+
+    def _combine_dumps(self):
+        pass
+
     def dump(self):
         pass
 
+    def load(self):
+        pass
+
     def __call__(self):
         pass
 
@@ -87,6 +109,104 @@ class TestInPoly:
 
         assert inpoly.shared_keys_to_schemas == expected_shared_keys_to_schemas
 
+    def test_determine_required_keys_to_schemas(self, ensure_schema_or_inpoly: MagicMock):
+        class First(Schema):
+            one = fields.Integer(required=True, data_key="One")
+            two = fields.Integer(required=True, attribute="second", load_only=True)
+            three = fields.Integer()
+
+        class Second(Schema):
+            one = fields.Integer(required=True)
+            two = fields.Integer(required=True, dump_only=True)
+            three = fields.Integer(required=True, attribute="nested.three")
+            four = fields.Integer(required=True, dump_default=4)
+            five = fields.Function(lambda obj: 5, required=True)
+            six = fields.Constant(6, required=True)
+
+        class Partial(Schema):
+            one = fields.Integer(required=True)
+
+        class WithPreProcessors(Schema):
+            one = fields.Integer(required=True)
+
+            @pre_load
+            def pre_load(self, data, **kwargs):
+                return data
+
+            @pre_dump
+            def pre_dump(self, data, **kwargs):
+                return data
+
+        schemas = (First(), Second(), WithPreProcessors(), Partial(partial=True))
+        ensure_schema_or_inpoly.side_effect = schemas
+
+        inpoly = self.test_class(*schemas)
+
+        assert inpoly.required_load_keys_to_schemas == {
+            "One": (schemas[0],),
+            "two": (schemas[0],),
+            "one": (schemas[1],),
+            "three": (schemas[1],),
+            "four": (schemas[1],),
+            "six": (schemas[1],),
+        }
+        assert inpoly.required_dump_keys_to_schemas == {
+            "one": (schemas[0], schemas[1], schemas[3]),
+            "two": (schemas[1],),
+        }
+
+    @pytest.mark.parametrize("data,expected_indeces", (
+        pytest.param({"first": 1, "second": 2}, (0, 1, 2), id="All required keys"),
+        pytest.param({"first": 1}, (0, 2), id="Missing key"),
+        pytest.param({}, (2,), id="No keys"),
+        pytest.param([], (0, 1, 2), id="Not a mapping"),
+    ))
+    def test_load_candidates(self, ensure_schema_or_inpoly: MagicMock, data, expected_indeces):
+        schemas = (
+            Schema.from_dict({"first": fields.Integer(required=True)})(),
+            Schema.from_dict({"first": fields.Integer(required=True), "second": fields.Integer(required=True)})(),
+            Schema.from_dict({"first": fields.Integer()})(),
+        )
+        ensure_schema_or_inpoly.side_effect = schemas
+        inpoly = self.test_class(*schemas)
+
+        assert inpoly._load_candidates(data) == tuple(schemas[i] for i in expected_indeces)
+
+    @pytest.mark.parametrize("obj,expected_indeces", (
+        pytest.param(SimpleNamespace(first=1, second=2), (0, 1, 2), id="All required attributes"),
+        pytest.param(SimpleNamespace(first=1), (0, 2), id="Missing attribute"),
+        pytest.param({"first": 1}, (0, 2), id="Mapping"),
+        pytest.param(SimpleNamespace(), (2,), id="No attributes"),
+    ))
+    def test_dump_candidates(self, ensure_schema_or_inpoly: MagicMock, obj, expected_indeces):
+        schemas = (
+            Schema.from_dict({"first": fields.Integer(required=True)})(),
+            Schema.from_dict({"first": fields.Integer(required=True), "second": fields.Integer(required=True)})(),
+            Schema.from_dict({"first": fields.Integer()})(),
+        )
+        ensure_schema_or_inpoly.side_effect = schemas
+        inpoly = self.test_class(*schemas)
+
+        assert inpoly._dump_candidates(obj) == tuple(schemas[i] for i in expected_indeces)
+
+    def test_merged_schema(self, mocker: MockerFixture, ensure_schema_or_inpoly: MagicMock):
+        schemas = (
+            MagicMock(spec=Schema, fields={"first": ""}),
+            MagicMock(spec=Schema, fields={"second": ""}),
+            MagicMock(spec=Schema, fields={"third": ""}),
+        )
+        ensure_schema_or_inpoly.side_effect = schemas
+        inpoly = self.test_class(*schemas)
+        schema_class_mock = mocker.patch.object(in_poly, "Schema")
+
+        first_result = inpoly._merged_schema((schemas[2], schemas[0]))
+        second_result = inpoly._merged_schema([schemas[0], schemas[2]])
+
+        # Fields are merged in the order of `schemas` regardless of the order of the given members
+        schema_class_mock.from_dict.assert_called_once_with({"first": "", "third": ""})
+        schema_class_mock.from_dict.return_value.assert_called_once_with()
+        assert first_result == second_result == schema_class_mock.from_dict.return_value.return_value
+
 
 class TestOneOf(TestInPoly):
     test_class = in_poly.OneOf
@@ -147,6 +267,41 @@ class TestOneOf(TestInPoly):
         
         assert result == valid_schema
 
+    @staticmethod
+    @pytest.mark.parametrize("valid_count,error", (
+        pytest.param(2, in_poly.OneOfConflictError, id="Conflict"),
+        pytest.param(0, in_poly.OneOfValidationError, id="Validation"),
+    ))
+    def test_load_error(ensure_schema_or_inpoly: MagicMock, valid_count: int, error: type):
+        schemas = tuple(
+            MagicMock(spec=Schema, **({} if i < valid_count else {"load.side_effect": ValidationError("")}))
+            for i in range(2)
+        )
+        ensure_schema_or_inpoly.side_effect = schemas
+        oneof = in_poly.OneOf(*schemas)
+
+        with pytest.raises(error):
+            oneof.load("data")
+
+    @pytest.mark.parametrize("valid_index", schema_indeces)
+    def test_load(self, ensure_schema_or_inpoly: MagicMock, valid_index: int):
+        data = "data"
+        schemas = tuple(
+            MagicMock(spec=Schema, **{"load.side_effect": ValidationError("")})
+            for _ in range(len(self.schema_indeces))
+        )
+        valid_schema = schemas[valid_index]
+        valid_schema.load.side_effect = None
+        ensure_schema_or_inpoly.side_effect = schemas
+        oneof = in_poly.OneOf(*schemas)
+
+        result = oneof.load(data, unknown="unknown")
+
+        for schema in schemas:
+            schema.load.assert_called_once_with(data, unknown="unknown")
+
+        assert result == valid_schema.load.return_value
+
     @staticmethod
     def test_dump_conflict_error(ensure_schema_or_inpoly: MagicMock):
         obj = "obj"
@@ -192,6 +347,111 @@ class TestOneOf(TestInPoly):
         assert result == valid_schema.dump.return_value
 
 
+class SpoonSchema(Schema):
+    kind = fields.String()
+    volume = fields.Float(required=True)
+
+
+class ForkSchema(Schema):
+    kind = fields.String()
+    prongs = fields.Integer(required=True)
+
+
+class TestOneOfDiscriminator:
+    @staticmethod
+    @pytest.fixture
+    def schemas(mocker: MockerFixture, ensure_schema_or_inpoly: MagicMock):
+        schemas = (SpoonSchema(), ForkSchema())
+        for schema in schemas:
+            for method_name in ("load", "validate", "dump"): mocker.spy(schema, method_name)
+        ensure_schema_or_inpoly.side_effect = schemas
+        return schemas
+
+    @staticmethod
+    def test_init_mapping_without_discriminator(schemas):
+        with pytest.raises(ValueError):
+            in_poly.OneOf(*schemas, mapping={"spoon": SpoonSchema})
+
+    @staticmethod
+    def test_init_mapping_non_member(schemas):
+        with pytest.raises(ValueError):
+            in_poly.OneOf(*schemas, discriminator="kind", mapping={"spoon": Schema})
+
+    @staticmethod
+    def test_init_duplicate_default_names(ensure_schema_or_inpoly: MagicMock):
+        ensure_schema_or_inpoly.side_effect = (SpoonSchema(), SpoonSchema())
+
+        with pytest.raises(ValueError):
+            in_poly.OneOf(SpoonSchema, SpoonSchema, discriminator="kind")
+
+    @staticmethod
+    @pytest.mark.parametrize("mapping,expected_discriminator", (
+        pytest.param(None, {"propertyName": "kind"}, id="Default mapping"),
+        pytest.param(
+            {"spoon": SpoonSchema, "fork": ForkSchema},
+            {"propertyName": "kind", "mapping": {"spoon": 0, "fork": 1}},
+            id="Explicit mapping"
+        ),
+    ))
+    def test_unstructure(schemas, mapping, expected_discriminator):
+        oneof = in_poly.OneOf(*schemas, discriminator="kind", mapping=mapping)
+        if "mapping" in expected_discriminator:
+            expected_discriminator["mapping"] = {k: schemas[i] for k, i in expected_discriminator["mapping"].items()}
+
+        assert con.unstructure(oneof) == {"oneOf": schemas, "discriminator": expected_discriminator}
+
+    @staticmethod
+    @pytest.mark.parametrize("data", (
+        pytest.param({"volume": 1.0}, id="Missing"),
+        pytest.param({"kind": "Knife"}, id="Unmapped"),
+        pytest.param({"kind": ["Spoon"]}, id="Not a string"),
+    ))
+    def test_load_unknown_discriminator(schemas, data):
+        oneof = in_poly.OneOf(*schemas, discriminator="kind")
+
+        with pytest.raises(in_poly.OneOfValidationError):
+            oneof.load(data)
+
+    @staticmethod
+    def test_load_validation_error(schemas):
+        oneof = in_poly.OneOf(*schemas, discriminator="kind")
+
+        with pytest.raises(in_poly.OneOfValidationError):
+            oneof.load({"kind": "Fork", "volume": 1.0})
+
+    @staticmethod
+    def test_load(schemas):
+        data = {"kind": "fork", "prongs": 3}
+        oneof = in_poly.OneOf(*schemas, discriminator="kind", mapping={"spoon": SpoonSchema, "fork": ForkSchema})
+
+        result = oneof.load(data)
+
+        schemas[0].load.assert_not_called()
+        schemas[1].load.assert_called_once_with(data, unknown=None)
+        assert result == data
+
+    @staticmethod
+    def test_call(schemas):
+        request = MagicMock(spec=Request, json={"kind": "Spoon", "volume": 1.0})
+        oneof = in_poly.OneOf(*schemas, discriminator="kind")
+
+        result = oneof(request)
+
+        for schema in schemas: schema.validate.assert_not_called()
+        assert result == schemas[0]
+
+    @staticmethod
+    def test_dump(schemas):
+        obj = SimpleNamespace(kind="Fork", prongs=3)
+        oneof = in_poly.OneOf(*schemas, discriminator="kind")
+
+        result = oneof.dump(obj)
+
+        schemas[0].dump.assert_not_called()
+        schemas[1].validate.assert_not_called()
+        assert result == {"kind": "Fork", "prongs": 3}
+
+
 class TestAnyOf(TestInPoly):
     test_class = in_poly.AnyOf
 
@@ -261,6 +521,30 @@ class TestAnyOf(TestInPoly):
         schema_class_mock.from_dict.return_value.assert_called_once_with()
         assert result == schema_class_mock.from_dict.return_value.return_value
 
+    @staticmethod
+    @pytest.mark.parametrize("unknown", (
+        pytest.param(None, id="Without unknown"),
+        pytest.param(EXCLUDE, id="With unknown"),
+    ))
+    def test_load(ensure_schema_or_inpoly: MagicMock, unknown: str):
+        data = "data"
+        first_load = {"test_field": "", "first": ""}
+        schemas = (
+            MagicMock(spec=Schema, fields=first_load, **{"load.return_value": first_load}),
+            MagicMock(spec=Schema, fields={"second": ""}, **{"load.side_effect": ValidationError("")}),
+            MagicMock(spec=Schema, fields={"test_field": "", "third": ""}),
+        )
+        schemas[2].load.return_value = SimpleNamespace(test_field="", third="")
+        ensure_schema_or_inpoly.side_effect = schemas
+        anyof = in_poly.AnyOf(*schemas)
+
+        result = anyof.load(data, unknown=unknown)
+
+        for schema in schemas:
+            schema.load.assert_called_once_with(data, unknown=EXCLUDE)
+
+        assert result == {**first_load, "third": ""}
+
     @staticmethod
     def test_dump_validation_error(ensure_schema_or_inpoly: MagicMock):
         obj = "obj"
@@ -384,6 +668,25 @@ class TestAllOf(TestInPoly):
         schema_class_mock.from_dict.return_value.assert_called_once_with()
         assert result == schema_class_mock.from_dict.return_value.return_value
 
+    @staticmethod
+    def test_load(ensure_schema_or_inpoly: MagicMock):
+        data = "data"
+        first_load = {"test_field": "", "first": ""}
+        second_load = {"test_field": "", "second": ""}
+        schemas = (
+            MagicMock(spec=Schema, fields=first_load, **{"load.return_value": first_load}),
+            MagicMock(spec=Schema, fields=second_load, **{"load.return_value": second_load}),
+        )
+        ensure_schema_or_inpoly.side_effect = schemas
+        allof = in_poly.AllOf(*schemas)
+
+        result = allof.load(data)
+
+        for schema in schemas:
+            schema.load.assert_called_once_with(data, unknown=EXCLUDE)
+
+        assert result == {**first_load, **second_load}
+
     @staticmethod
     @pytest.mark.parametrize("cause", ("dump", "validate"))
     def test_dump_validation_error(ensure_schema_or_inpoly: MagicMock, cause: str):
@@ -439,3 +742,481 @@ class TestAllOf(TestInPoly):
             schema.validate.assert_called_once_with(schema.dump.return_value)
 
         assert result == expected_result
+
+
+class Spoon:
+    def __init__(self, volume: float):
+        self.volume = volume
+
+
+class Fork:
+    def __init__(self, prongs: int):
+        self.prongs = prongs
+
+
+class TestCandidates:
+    @staticmethod
+    def test_partial_schema_load():
+        oneof = in_poly.OneOf(
+            Schema.from_dict({"a": fields.String(), "b": fields.Integer(required=True)})(partial=True),
+            Schema.from_dict({"c": fields.String(required=True)}),
+        )
+
+        assert oneof.load({"a": "hi"}) == {"a": "hi"}
+
+    @staticmethod
+    def test_attributeless_field_dump():
+        oneof = in_poly.OneOf(
+            Schema.from_dict({"a": fields.String(), "b": fields.Function(lambda obj: "b", required=True)}),
+            Schema.from_dict({"c": fields.String(required=True)}),
+        )
+
+        assert oneof.dump(SimpleNamespace(a="hi")) == {"a": "hi", "b": "b"}
+
+    @staticmethod
+    def test_row_dump():
+        connection = sqlite3.connect(":memory:")
+        connection.row_factory = sqlite3.Row
+        row = connection.execute("SELECT 1 AS a").fetchone()
+        oneof = in_poly.OneOf({"a": fields.Integer(required=True)}, {"b": fields.Integer(required=True)})
+
+        assert oneof.dump(row) == {"a": 1}
+
+    @staticmethod
+    def test_item_access_dump():
+        class Record:
+            def __getitem__(self, key):
+                if key == "a": return 1
+                raise KeyError(key)
+
+        anyof = in_poly.AnyOf({"a": fields.Integer(required=True)}, {"b": fields.Integer(required=True)})
+
+        assert anyof.dump(Record()) == {"a": 1}
+
+    @staticmethod
+    def test_custom_get_attribute_dump():
+        class PrefixedSchema(Schema):
+            a = fields.Integer(required=True)
+
+            def get_attribute(self, obj, attr, default):
+                return getattr(obj, f"_{attr}", default)
+
+        oneof = in_poly.OneOf(PrefixedSchema, {"b": fields.Integer(required=True)})
+
+        assert oneof.dump(SimpleNamespace(_a=1)) == {"a": 1}
+
+
+class TestLoadUnknown:
+    @staticmethod
+    @pytest.fixture(params=(in_poly.AnyOf, in_poly.AllOf))
+    def inpoly(request: SubRequest):
+        return request.param({"a": fields.Integer(required=True)}, {"b": fields.Integer(data_key="B")})
+
+    @staticmethod
+    def test_raise(inpoly: in_poly.InPoly):
+        with pytest.raises(ValidationError) as exc_info:
+            inpoly.load({"a": 1, "B": 2, "c": 3})
+
+        assert exc_info.value.messages == {"c": ["Unknown field."]}
+
+    @staticmethod
+    def test_exclude(inpoly: in_poly.InPoly):
+        assert inpoly.load({"a": 1, "B": 2, "c": 3}, unknown=EXCLUDE) == {"a": 1, "b": 2}
+
+    @staticmethod
+    def test_include(inpoly: in_poly.InPoly):
+        assert inpoly.load({"a": 1, "c": 3}, unknown=INCLUDE) == {"a": 1, "c": 3}
+
+    @staticmethod
+    def test_member_unknown():
+        anyof = in_poly.AnyOf(
+            Schema.from_dict({"a": fields.Integer(required=True)})(unknown=EXCLUDE),
+            Schema.from_dict({"b": fields.Integer(required=True)})(unknown=INCLUDE),
+        )
+
+        assert anyof.load({"a": 1, "c": 3}) == {"a": 1, "c": 3}
+
+    @staticmethod
+    def test_anyof_invalid_member_keys_unknown():
+        anyof = in_poly.AnyOf({"a": fields.Integer(required=True)}, {"b": fields.Integer(required=True)})
+
+        # Keys of members that the data is invalid for aren't loaded, so they're unknown
+        with pytest.raises(ValidationError):
+            anyof.load({"a": 1, "b": "two"})
+
+
+class TestDumpMany:
+    @staticmethod
+    @pytest.fixture
+    def schemas(mocker: MockerFixture):
+        schemas = (SpoonSchema(), ForkSchema())
+        for schema in schemas:
+            for method_name in ("dump", "validate"): mocker.spy(schema, method_name)
+        return schemas
+
+    @staticmethod
+    def test_oneof(schemas):
+        objs = [Spoon(1.0), Fork(3), Spoon(2.0), {"prongs": 4}, Fork(5)]
+        oneof = in_poly.OneOf(*schemas, dump_cache_size=2)
+
+        result = oneof.dump(objs, many=True)
+
+        assert result == [{"volume": 1.0}, {"prongs": 3}, {"volume": 2.0}, {"prongs": 4}, {"prongs": 5}]
+        # The first object of each type and each mapping is serialized individually while classifying it
+        schemas[0].dump.assert_called_with([objs[2]], many=True)
+        schemas[1].dump.assert_called_with([objs[4]], many=True)
+        assert schemas[0].dump.call_count == 2
+        assert schemas[1].dump.call_count == 3
+
+    @staticmethod
+    def test_oneof_uncached(schemas):
+        objs = [Spoon(1.0), Fork(3), Spoon(2.0), {"prongs": 4}, SimpleNamespace(volume=3.0, prongs=None)]
+        oneof = in_poly.OneOf(*schemas)
+
+        result = oneof.dump(objs, many=True)
+
+        assert result == [{"volume": 1.0}, {"prongs": 3}, {"volume": 2.0}, {"prongs": 4}, {"volume": 3.0}]
+        # Each group of objects that share their candidate schemas is dumped once by each candidate
+        schemas[0].dump.assert_has_calls([call([objs[0], objs[2]], many=True), call([objs[4]], many=True)])
+        schemas[1].dump.assert_has_calls([call([objs[1], objs[3]], many=True), call([objs[4]], many=True)])
+        assert schemas[0].dump.call_count == 2
+        assert schemas[1].dump.call_count == 2
+
+    @staticmethod
+    def test_oneof_uncached_conflict_error():
+        oneof = in_poly.OneOf({"a": fields.Integer(required=True)}, {"a": fields.Integer(required=True)})
+
+        with pytest.raises(in_poly.OneOfConflictError):
+            oneof.dump([{"a": 1}, {"a": 2}], many=True)
+
+    @staticmethod
+    def test_anyof_uncached_validation_error():
+        anyof = in_poly.AnyOf({"a": fields.Integer(required=True)}, {"b": fields.Integer(required=True)})
+
+        with pytest.raises(in_poly.AnyOfValidationError):
+            anyof.dump([{"a": 1}, {"a": None}], many=True)
+
+    @staticmethod
+    def test_oneof_misclassified(schemas):
+        objs = [SimpleNamespace(volume=1.0), SimpleNamespace(prongs=3)]
+        oneof = in_poly.OneOf(*schemas)
+
+        assert oneof.dump(objs, many=True) == [{"volume": 1.0}, {"prongs": 3}]
+
+    @staticmethod
+    def test_oneof_validation_error(schemas):
+        oneof = in_poly.OneOf(*schemas)
+
+        with pytest.raises(in_poly.OneOfValidationError):
+            oneof.dump([Spoon(1.0), SimpleNamespace()], many=True)
+
+    @staticmethod
+    def test_oneof_discriminator(schemas):
+        objs = [SimpleNamespace(kind="Spoon", volume=1.0), SimpleNamespace(kind="Fork", prongs=3)]
+        oneof = in_poly.OneOf(*schemas, discriminator="kind")
+
+        result = oneof.dump(objs, many=True)
+
+        assert result == [{"kind": "Spoon", "volume": 1.0}, {"kind": "Fork", "prongs": 3}]
+        for schema in schemas: schema.validate.assert_not_called()
+
+    @staticmethod
+    def test_anyof():
+        objs = [{"a": 1, "shared": 0}, {"a": 2, "b": 3, "shared": 0}, {"a": 4, "shared": 0}]
+        anyof = in_poly.AnyOf(
+            {"a": fields.Integer(required=True), "shared": fields.Integer()},
+            {"b": fields.Integer(required=True), "shared": fields.Integer()},
+        )
+
+        assert anyof.dump(objs, many=True) == [anyof.dump(obj) for obj in objs]
+
+    @staticmethod
+    def test_anyof_conflict_error():
+        anyof = in_poly.AnyOf({"value": fields.Integer()}, {"value": fields.Integer(attribute="other")})
+
+        with pytest.raises(in_poly.AnyOfConflictError):
+            anyof.dump([{"value": 1, "other": 2}], many=True)
+
+    @staticmethod
+    def test_allof():
+        objs = [SimpleNamespace(a=1, b=2), SimpleNamespace(a=3, b=4)]
+        allof = in_poly.AllOf({"a": fields.Integer(required=True)}, {"b": fields.Integer(required=True)})
+
+        assert allof.dump(objs, many=True) == [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+
+    @staticmethod
+    def test_allof_validation_error():
+        allof = in_poly.AllOf({"a": fields.Integer(required=True)}, {"b": fields.Integer(required=True)})
+
+        with pytest.raises(in_poly.AllOfValidationError):
+            allof.dump([SimpleNamespace(a=1, b=2), SimpleNamespace(a=3)], many=True)
+
+
+class TestDumpCache:
+    @staticmethod
+    @pytest.fixture
+    def schemas(mocker: MockerFixture):
+        schemas = (SpoonSchema(), ForkSchema(), Schema.from_dict({"serrated": fields.Boolean(required=True)})())
+        for schema in schemas: mocker.spy(schema, "dump")
+        return schemas
+
+    @staticmethod
+    def test_cached_type(schemas):
+        oneof = in_poly.OneOf(*schemas, dump_cache_size=8)
+
+        assert oneof.dump(Spoon(1.0)) == {"volume": 1.0}
+        for schema in schemas: schema.dump.reset_mock()
+        # Spoon has no `prongs` attribute, so a cache miss would try every schema that `prongs` doesn't rule out
+        Spoon.prongs = property(lambda self: 3)
+        try:
+            assert oneof.dump(Spoon(2.0)) == {"volume": 2.0}
+        finally:
+            del Spoon.prongs
+
+        schemas[0].dump.assert_called_once()
+        schemas[1].dump.assert_not_called()
+
+    @staticmethod
+    def test_cached_type_mismatch(schemas):
+        oneof = in_poly.OneOf(*schemas, dump_cache_size=8)
+
+        assert oneof.dump(SimpleNamespace(volume=1.0)) == {"volume": 1.0}
+        assert oneof.dump(SimpleNamespace(prongs=3)) == {"prongs": 3}
+        assert oneof._dump_cache == {SimpleNamespace: (schemas[1],)}
+
+    @staticmethod
+    def test_mapping_not_cached(schemas):
+        oneof = in_poly.OneOf(*schemas, dump_cache_size=8)
+
+        oneof.dump({"volume": 1.0})
+
+        assert not oneof._dump_cache
+
+    @staticmethod
+    def test_lru_eviction(schemas):
+        oneof = in_poly.OneOf(*schemas, dump_cache_size=2)
+
+        oneof.dump(Spoon(1.0))
+        oneof.dump(Fork(3))
+        oneof.dump(Spoon(2.0))
+        oneof.dump(SimpleNamespace(serrated=True))
+
+        assert list(oneof._dump_cache) == [Spoon, SimpleNamespace]
+
+    @staticmethod
+    def test_disabled(schemas):
+        objs = [Spoon(1.0), Spoon(2.0)]
+        oneof = in_poly.OneOf(*schemas)
+
+        assert oneof.dump(objs, many=True) == [{"volume": 1.0}, {"volume": 2.0}]
+        assert not oneof._dump_cache
+        # Without the cache, objects are still dumped together by the schemas their attributes don't rule out
+        schemas[0].dump.assert_called_once_with(objs, many=True)
+
+    @staticmethod
+    @pytest.mark.parametrize("many", (False, True))
+    def test_disabled_optional_attributes(many: bool):
+        # Objects of the same type match different AnyOf schemas depending on which optional attributes they have
+        anyof = in_poly.AnyOf({"x": fields.Integer(required=True)}, {"y": fields.Integer(required=True)})
+        objs = [SimpleNamespace(x=1), SimpleNamespace(x=1, y=2)]
+
+        result = anyof.dump(objs, many=True) if many else [anyof.dump(obj) for obj in objs]
+
+        assert result == [{"x": 1}, {"x": 1, "y": 2}]
+
+
+class NestedItemSchema(Schema):
+    name = fields.String(required=True)
+
+
+class StructuralCheckSchema(Schema):
+    id = fields.Integer(required=True)
+    label = fields.String(data_key="title")
+    price = fields.Decimal(as_string=True)
+    note = fields.String(allow_none=True)
+    item = fields.Nested(NestedItemSchema)
+    items = fields.List(fields.Nested(NestedItemSchema))
+    tags = fields.List(fields.String())
+    ref = fields.UUID()
+    extra = fields.Raw()
+    extras = fields.List(fields.Raw())
+    counts = fields.Dict(keys=fields.String(), values=fields.Integer())
+    notes = fields.Mapping(values=fields.String(allow_none=True))
+    point = fields.Tuple((fields.Float(), fields.String()))
+    score = fields.Float()
+    limit = fields.Float(allow_nan=True)
+    ratio = fields.Float(as_string=True)
+    amount = fields.Decimal()
+
+
+class TestStructuralDumpCheck:
+    @staticmethod
+    @pytest.mark.parametrize("data", (
+        pytest.param({"id": 1}, id="Required only"),
+        pytest.param({}, id="Missing required"),
+        pytest.param([], id="Not a mapping"),
+        pytest.param({"id": None}, id="Null"),
+        pytest.param({"id": 1, "note": None}, id="Nullable"),
+        pytest.param({"id": 1, "note": 1}, id="Wrong type"),
+        pytest.param({"id": 1, "title": "label"}, id="Data key"),
+        pytest.param({"id": 1, "label": 1}, id="Unknown"),
+        pytest.param({"id": 1, "price": "1.50"}, id="Number as string"),
+        pytest.param({"id": 1, "item": {"name": "item"}}, id="Nested"),
+        pytest.param({"id": 1, "item": {}}, id="Nested missing required"),
+        pytest.param({"id": 1, "items": [{"name": "item"}, {}]}, id="Nested list missing required"),
+        pytest.param({"id": 1, "tags": ["a", 1]}, id="List wrong item type"),
+        pytest.param({"id": 1, "ref": "8c2f4a3e-5b7d-4e1f-9a6c-0d3b2e1f4a5c"}, id="UUID"),
+        pytest.param({"id": 1, "ref": "not-a-uuid"}, id="Invalid UUID"),
+        pytest.param({"id": 1, "extra": object()}, id="Unchecked"),
+        pytest.param({"id": 1, "extras": [None]}, id="Unchecked list null item"),
+        pytest.param({"id": True}, id="Boolean number"),
+        pytest.param({"id": 1.5}, id="Float integer"),
+        pytest.param({"id": 1, "counts": {"a": 1}}, id="Dict"),
+        pytest.param({"id": 1, "counts": {"a": None}}, id="Dict null value"),
+        pytest.param({"id": 1, "counts": {"a": "b"}}, id="Dict wrong value type"),
+        pytest.param({"id": 1, "counts": {1: 1}}, id="Dict wrong key type"),
+        pytest.param({"id": 1, "notes": {"a": None, "b": "c"}}, id="Mapping nullable value"),
+        pytest.param({"id": 1, "notes": {"a": 1}}, id="Mapping wrong value type"),
+        pytest.param({"id": 1, "point": (1.5, "a")}, id="Tuple"),
+        pytest.param({"id": 1, "point": [1.5, "a"]}, id="Tuple as list"),
+        pytest.param({"id": 1, "point": (1.5,)}, id="Tuple wrong length"),
+        pytest.param({"id": 1, "point": (None, "a")}, id="Tuple null item"),
+        pytest.param({"id": 1, "point": (1.5, 1)}, id="Tuple wrong item type"),
+        pytest.param({"id": 1, "score": 1.5}, id="Float"),
+        pytest.param({"id": 1, "score": float("nan")}, id="Float NaN"),
+        pytest.param({"id": 1, "score": float("inf")}, id="Float infinity"),
+        pytest.param({"id": 1, "limit": float("inf")}, id="Float allowed infinity"),
+        pytest.param({"id": 1, "ratio": "1.5"}, id="Float as string"),
+        pytest.param({"id": 1, "ratio": "nan"}, id="Float as string NaN"),
+        pytest.param({"id": 1, "ratio": "1e400"}, id="Float as string overflow"),
+        pytest.param({"id": 1, "amount": decimal.Decimal("1.5")}, id="Decimal"),
+        pytest.param({"id": 1, "amount": decimal.Decimal("NaN")}, id="Decimal NaN"),
+        pytest.param({"id": 1, "price": "Infinity"}, id="Decimal as string infinity"),
+        pytest.param({"id": 1, "price": "cheap"}, id="Decimal as string invalid"),
+    ))
+    @pytest.mark.parametrize("unknown", (EXCLUDE, RAISE))
+    def test_matches_validate(data, unknown: str):
+        schema = StructuralCheckSchema(unknown=unknown)
+
+        check = in_poly._structural_dump_check(schema)
+
+        assert check(data) == (len(schema.validate(data)) == 0)
+
+    @staticmethod
+    def test_self_referencing():
+        schema = Schema.from_dict({"id": fields.Integer(required=True), "parent": fields.Nested(lambda: schema_class())})
+        schema_class = type(schema())
+
+        check = in_poly._structural_dump_check(schema_class())
+
+        assert check({"id": 1, "parent": {"id": 2}})
+        assert not check({"id": 1, "parent": 2})
+
+    @staticmethod
+    def test_nested_validators():
+        class ValidatedItemSchema(Schema):
+            name = fields.String(validate=lambda name: name != "invalid")
+
+        schema = Schema.from_dict({"item": fields.Nested(ValidatedItemSchema)})()
+
+        check = in_poly._structural_dump_check(schema)
+
+        assert check({"item": {"name": "valid"}})
+        assert not check({"item": {"name": "invalid"}})
+
+    class FieldValidatorSchema(Schema):
+        kind = fields.String(validate=lambda kind: kind == "spoon")
+
+    class ValidatesSchema(Schema):
+        kind = fields.String()
+
+        @validates("kind")
+        def validate_kind(self, kind):
+            pass  # pragma: no cover
+
+    class ValidatesSchemaSchema(Schema):
+        kind = fields.String()
+
+        @validates_schema
+        def validate_schema(self, data, **kwargs):
+            pass  # pragma: no cover
+
+    class PreLoadSchema(Schema):
+        kind = fields.String()
+
+        @pre_load
+        def process(self, data, **kwargs):
+            return data  # pragma: no cover
+
+    class DateTimeSchema(Schema):
+        created = fields.DateTime()
+
+    class DateTimeListSchema(Schema):
+        created = fields.List(fields.DateTime())
+
+    class InnerValidatorSchema(Schema):
+        counts = fields.Dict(values=fields.Integer(validate=lambda count: count > 0))
+
+    @staticmethod
+    @pytest.mark.parametrize("schema_class", (
+        FieldValidatorSchema, ValidatesSchema, ValidatesSchemaSchema, PreLoadSchema, DateTimeSchema, DateTimeListSchema,
+        InnerValidatorSchema,
+    ))
+    def test_unsupported(schema_class: type):
+        assert in_poly._structural_dump_check(schema_class()) is None
+
+
+    @staticmethod
+    def test_nested_unsupported():
+        schema = Schema.from_dict({"item": fields.Nested(TestStructuralDumpCheck.DateTimeSchema)})()
+
+        check = in_poly._structural_dump_check(schema)
+
+        assert check({"item": {"created": "2020-01-01T00:00:00"}})
+        assert not check({"item": {"created": "yesterday"}})
+
+
+class TestDumpValidation:
+    @staticmethod
+    @pytest.fixture
+    def schemas(mocker: MockerFixture):
+        schemas = (SpoonSchema(), ForkSchema(), TestStructuralDumpCheck.FieldValidatorSchema())
+        for schema in schemas: mocker.spy(schema, "validate")
+        return schemas
+
+    @staticmethod
+    def test_invalid():
+        with pytest.raises(ValueError):
+            in_poly.OneOf(SpoonSchema, dump_validation="partial")
+
+    @staticmethod
+    def test_structural(schemas):
+        oneof = in_poly.OneOf(*schemas[:2])
+
+        assert oneof.dump([Spoon(1.0), Fork(3), Spoon(2.0)], many=True) == [
+            {"volume": 1.0}, {"prongs": 3}, {"volume": 2.0}
+        ]
+        for schema in schemas: schema.validate.assert_not_called()
+
+    @staticmethod
+    def test_structural_fallback(schemas):
+        anyof = in_poly.AnyOf(*schemas)
+
+        assert anyof.dump(SimpleNamespace(volume=1.0, kind="spoon")) == {"volume": 1.0, "kind": "spoon"}
+        schemas[0].validate.assert_not_called()
+        schemas[2].validate.assert_called_once_with({"kind": "spoon"})
+
+    @staticmethod
+    def test_structural_uuid():
+        oneof = in_poly.OneOf({"id": fields.UUID(required=True)}, {"id": fields.String(required=True)})
+
+        assert oneof.dump({"id": "not-a-uuid"}) == {"id": "not-a-uuid"}
+
+    @staticmethod
+    def test_full(schemas):
+        allof = in_poly.AllOf(*schemas[:2], dump_validation="full")
+
+        assert allof.dump(SimpleNamespace(kind="spork", volume=1.0, prongs=3)) == {
+            "kind": "spork", "volume": 1.0, "prongs": 3
+        }
+        for schema in schemas[:2]: schema.validate.assert_called_once()
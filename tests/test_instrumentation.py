@@ -0,0 +1,133 @@
+import asyncio
+from typing import Optional
+
+from flask import Flask
+from marshmallow import Schema, fields
+import pytest
+from pytest_mock import MockerFixture
+
+from specargs import OneOf, instrumentation, use_args, use_response
+from specargs.in_poly import OneOfValidationError
+
+
+class ASchema(Schema):
+    a = fields.String(required=True)
+
+
+class BSchema(Schema):
+    b = fields.Integer(required=True)
+
+
+@pytest.fixture
+def records(mocker: MockerFixture):
+    records = []
+    mocker.patch.object(instrumentation, "observers", ())
+    instrumentation.add_observer(lambda *record: records.append(record))
+    return records
+
+
+def test_add_and_remove_observer(mocker: MockerFixture):
+    mocker.patch.object(instrumentation, "observers", ())
+    first, second = mocker.Mock(), mocker.Mock()
+
+    instrumentation.add_observer(first)
+    instrumentation.add_observer(second)
+    instrumentation.record("phase", "route", 1, 2)
+    instrumentation.remove_observer(first)
+    instrumentation.record("phase", "route", 3, 4)
+
+    first.assert_called_once_with("phase", "route", 1, 2, None)
+    assert second.call_count == 2
+    assert instrumentation.observers == (second,)
+
+    with pytest.raises(ValueError):
+        instrumentation.remove_observer(first)
+
+
+def test_observe(records: list):
+    assert instrumentation.observe("phase", "route", lambda x, y: x + y, 1, y=2) == 3
+
+    error = RuntimeError("failed")
+    def fail():
+        raise error
+
+    with pytest.raises(RuntimeError):
+        instrumentation.observe("phase", "route", fail)
+
+    assert [(phase, route, error) for phase, route, _, _, error in records] == [
+        ("phase", "route", None),
+        ("phase", "route", error),
+    ]
+    assert all(start <= end for _, _, start, end, _ in records)
+
+
+def test_prometheus_histogram():
+    histogram = instrumentation.PrometheusHistogram("duration", buckets=(0.01, 0.001))
+    histogram("parse", "view", 0, 500_000, None)
+    histogram("parse", "view", 0, 5_000_000, None)
+    histogram("dump", "view", 0, 50_000_000, ValueError())
+
+    assert histogram.render().splitlines() == [
+        "# HELP duration Time spent in each phase of handling a request",
+        "# TYPE duration histogram",
+        'duration_bucket{phase="dump",route="view",error="true",le="0.001"} 0',
+        'duration_bucket{phase="dump",route="view",error="true",le="0.01"} 0',
+        'duration_bucket{phase="dump",route="view",error="true",le="+Inf"} 1',
+        'duration_sum{phase="dump",route="view",error="true"} 0.05',
+        'duration_count{phase="dump",route="view",error="true"} 1',
+        'duration_bucket{phase="parse",route="view",error="false",le="0.001"} 1',
+        'duration_bucket{phase="parse",route="view",error="false",le="0.01"} 2',
+        'duration_bucket{phase="parse",route="view",error="false",le="+Inf"} 2',
+        'duration_sum{phase="parse",route="view",error="false"} 0.0055',
+        'duration_count{phase="parse",route="view",error="false"} 2',
+    ]
+
+
+def test_flask_phases(records: list):
+    app = Flask(__name__, static_folder=None)
+
+    @app.post("/")
+    @use_args(OneOf(ASchema, BSchema))
+    @use_response(ASchema)
+    def view(args):
+        return args
+
+    route = f"{__name__}.test_flask_phases.<locals>.view"
+    client = app.test_client()
+
+    assert client.post("/", json={"a": "value"}).json == {"a": "value"}
+    assert [(phase, record_route, error) for phase, record_route, _, _, error in records] == [
+        (instrumentation.VALIDATE, route, None),
+        (instrumentation.PARSE, route, None),
+        (instrumentation.DISPATCH, route, None),
+        (instrumentation.DUMP, route, None),
+    ]
+
+    records.clear()
+    client.post("/", json={"c": "value"})
+    assert [(phase, type(error)) for phase, _, _, _, error in records] == [
+        (instrumentation.VALIDATE, OneOfValidationError),
+        (instrumentation.PARSE, OneOfValidationError),
+    ]
+
+
+@pytest.mark.parametrize("offload_threshold", (None, 0))
+def test_flask_phases_async(records: list, offload_threshold: Optional[int]):
+    app = Flask(__name__, static_folder=None)
+
+    @use_args(OneOf(ASchema, BSchema), offload_threshold=offload_threshold)
+    @use_response(ASchema)
+    async def view(args):
+        return args
+
+    route = f"{__name__}.test_flask_phases_async.<locals>.view"
+
+    with app.test_request_context("/", method="POST", json={"a": "value"}):
+        assert asyncio.run(view())[:2] == ({"a": "value"}, 200)
+
+    assert [(phase, record_route, error) for phase, record_route, _, _, error in records] == [
+        (instrumentation.VALIDATE, route, None),
+        (instrumentation.PARSE, route, None),
+        (instrumentation.DISPATCH, route, None),
+        (instrumentation.DUMP, route, None),
+    ]
@@ -0,0 +1,43 @@
+import sys
+import types
+
+import pytest
+from pytest_mock import MockerFixture
+
+from specargs import __main__, WebargsAPISpec
+
+
+@pytest.fixture
+def app_module(mocker: MockerFixture):
+    module = types.ModuleType("fake_app_module")
+    module.spec = mocker.Mock(spec=WebargsAPISpec)
+    module.nested = types.SimpleNamespace(app="app")
+    mocker.patch.dict(sys.modules, fake_app_module=module)
+    return module
+
+
+def test_import_object(app_module: types.ModuleType):
+    assert __main__.import_object("fake_app_module:nested.app") == "app"
+
+
+@pytest.mark.parametrize("import_path", ("fake_app_module", ":spec", "fake_app_module:"))
+def test_import_object_error(app_module: types.ModuleType, import_path: str):
+    with pytest.raises(ValueError):
+        __main__.import_object(import_path)
+
+
+def test_build(app_module: types.ModuleType):
+    __main__.main(["build", "fake_app_module:spec", "fake_app_module:nested.app", "--output", "artifact.json"])
+
+    app_module.spec.write_artifact.assert_called_once_with("app", "artifact.json", processes=None)
+
+
+def test_build_processes(app_module: types.ModuleType):
+    __main__.main(["build", "fake_app_module:spec", "fake_app_module:nested.app", "--processes", "4"])
+
+    app_module.spec.write_artifact.assert_called_once_with("app", "openapi-artifact.json", processes=4)
+
+
+def test_build_not_spec(app_module: types.ModuleType):
+    with pytest.raises(TypeError):
+        __main__.build("fake_app_module:nested.app", "fake_app_module:nested.app", "artifact.json")
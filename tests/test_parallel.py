@@ -0,0 +1,36 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from specargs import parallel, WebargsAPISpec
+
+
+pytestmark = pytest.mark.skipif(not parallel.is_supported(), reason="Forking processes is not supported")
+
+
+@pytest.mark.parametrize("count,processes", (
+    pytest.param(7, 3, id="Uneven partitions"),
+    pytest.param(2, 4, id="More processes than routes"),
+))
+def test_create_paths(count: int, processes: int):
+    spec = WebargsAPISpec("Test", "1.0.0", "3.0.2")
+    spec.path("/existing", operations={"get": {}})
+
+    def create_path(index: int):
+        spec.path("/shared", operations={f"x-{index}": {}})
+        spec.path(f"/items{index}", operations={"get": {"summary": str(index)}})
+
+    parallel.create_paths(spec, create_path, count, processes)
+
+    expected_paths = {"/existing": {"get": {}}, "/shared": {f"x-{index}": {} for index in range(count)}}
+    expected_paths.update({f"/items{index}": {"get": {"summary": str(index)}} for index in range(count)})
+    assert list(spec.to_dict()["paths"].items()) == list(expected_paths.items())
+    assert parallel._job is None
+
+
+def test_create_paths_error(mocker: MockerFixture):
+    spec = WebargsAPISpec("Test", "1.0.0", "3.0.2")
+    create_path = mocker.Mock(side_effect=ValueError)
+
+    with pytest.raises(ValueError):
+        parallel.create_paths(spec, create_path, 2, 2)
+    assert parallel._job is None
@@ -0,0 +1,272 @@
+import asyncio
+import json
+from typing import Optional
+
+from marshmallow import Schema, fields
+import pytest
+from pytest_mock import MockerFixture
+
+starlette = pytest.importorskip("starlette")
+
+from starlette.applications import Starlette
+from starlette.convertors import Convertor, register_url_convertor
+from starlette.endpoints import HTTPEndpoint
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Mount, Route, Router
+from starlette.testclient import TestClient
+from webargs import core
+
+from specargs import WebargsAPISpec, encoding, framework, use_args, use_response
+from specargs.framework import starlette as starlette_framework
+
+
+class ValueSchema(Schema):
+    value = fields.Integer(required=True)
+
+
+class HexConvertor(Convertor):
+    regex = "[0-9a-f]+"
+
+    def convert(self, value: str) -> int:
+        return int(value, 16)  # pragma: no cover
+
+    def to_string(self, value: int) -> str:
+        return format(value, "x")  # pragma: no cover
+
+
+register_url_convertor("hex", HexConvertor())
+
+
+@pytest.fixture(autouse=True)
+def active_framework(mocker: MockerFixture):
+    # Starlette is made the active framework even if other frameworks are installed
+    # The module's dictionary is patched directly so the originals aren't looked up through framework detection
+    mocker.patch.dict(framework.__dict__, {
+        attribute: getattr(starlette_framework, attribute) for attribute in framework.FRAMEWORK_ATTRIBUTES
+    })
+
+
+@pytest.fixture
+def spec():
+    return WebargsAPISpec("Test", "1.0.0", "3.0.2", plugins=[starlette_framework.StarletteWebargsPlugin()])
+
+
+def make_request(body: bytes, headers: Optional[dict] = None) -> Request:
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    raw_headers = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "POST", "path": "/", "headers": raw_headers}, receive)
+
+
+def test_create_paths_type_error(spec: WebargsAPISpec):
+    with pytest.raises(TypeError):
+        starlette_framework.create_paths(spec, "not an app")
+
+
+def test_create_paths(spec: WebargsAPISpec):
+    @use_response({})
+    async def users(request):
+        ...  # pragma: no cover
+
+    @use_args(ValueSchema(), location="json")
+    async def user(request, args):
+        ...  # pragma: no cover
+
+    async def replaced_user(request):
+        ...  # pragma: no cover
+
+    class Page(HTTPEndpoint):
+        async def get(self, request):
+            ...  # pragma: no cover
+
+        async def delete(self, request):
+            ...  # pragma: no cover
+
+    async def item(request):
+        ...  # pragma: no cover
+
+    app = Starlette(routes=[
+        Route("/users", users),
+        Route("/users/{user_id:int}", user, methods=["PUT"]),
+        Route("/users/{user_id:int}", replaced_user, methods=["PUT"]),
+        Route("/pages/{name}/{version:float}/{path:path}", Page),
+        Mount("/admin/{tenant:uuid}", routes=[Route("/items/{item_id:hex}", item, methods=["DELETE"])]),
+    ])
+
+    starlette_framework.create_paths(spec, app)
+
+    paths = spec.to_dict()["paths"]
+    assert paths.keys() == {
+        "/users", "/users/{user_id}", "/pages/{name}/{version}/{path}", "/admin/{tenant}/items/{item_id}"
+    }
+    assert paths["/users"].keys() == {"get"}
+    assert paths["/users/{user_id}"].keys() == {"parameters", "put"}
+    assert "requestBody" in paths["/users/{user_id}"]["put"]
+    assert paths["/users/{user_id}"]["parameters"] == [
+        {"name": "user_id", "in": "path", "required": True, "schema": {"type": "integer", "minimum": 0}}
+    ]
+    assert paths["/pages/{name}/{version}/{path}"].keys() == {"parameters", "get", "delete"}
+    assert [parameter["schema"] for parameter in paths["/pages/{name}/{version}/{path}"]["parameters"]] == [
+        {"type": "string", "minLength": 1},
+        {"type": "number", "minimum": 0},
+        {"type": "string", "format": "url"},
+    ]
+    assert paths["/admin/{tenant}/items/{item_id}"].keys() == {"parameters", "delete"}
+    assert [parameter["schema"] for parameter in paths["/admin/{tenant}/items/{item_id}"]["parameters"]] == [
+        {"type": "string", "format": "uuid"},
+        {"type": "string", "pattern": "^[0-9a-f]+$"},
+    ]
+
+
+def test_create_paths_incremental(mocker: MockerFixture, spec: WebargsAPISpec):
+    async def first(request):
+        ...  # pragma: no cover
+
+    async def second(request):
+        ...  # pragma: no cover
+
+    router = Router([Route("/first", first)])
+    starlette_framework.create_paths(spec, router)
+
+    router.routes.append(Route("/first", second, methods=["POST"]))
+    path = mocker.spy(spec, "path")
+    starlette_framework.create_paths(spec, router)
+
+    path.assert_called_once()
+    assert path.call_args.kwargs["view"] is second
+    assert spec.to_dict()["paths"]["/first"].keys() == {"get", "post"}
+
+
+def test_path_without_route(spec: WebargsAPISpec):
+    async def user(request):
+        ...  # pragma: no cover
+
+    spec.path(view=user, app=Starlette(routes=[Route("/users/{user_id:int}", user)]))
+
+    assert spec.to_dict()["paths"]["/users/{user_id}"].keys() == {"parameters", "get"}
+
+
+def test_route_views():
+    async def users(request):
+        ...  # pragma: no cover
+
+    class User(HTTPEndpoint):
+        async def get(self, request):
+            ...  # pragma: no cover
+
+    app = Starlette(routes=[Route("/users", users, methods=["GET", "POST"]), Route("/users/{user_id}", User)])
+
+    assert list(starlette_framework.route_views(app)) == [
+        ("GET /users", users),
+        ("POST /users", users),
+        ("GET /users/{user_id}", User.get),
+    ]
+
+
+def test_add_spec_route(spec: WebargsAPISpec):
+    app = Starlette()
+    spec.add_spec_route(app)
+    client = TestClient(app)
+
+    response = client.get("/openapi.json")
+    assert response.json()["info"]["title"] == "Test"
+    assert response.headers["Content-Type"] == "application/json"
+
+    not_modified = client.get("/openapi.json", headers={"If-None-Match": response.headers["ETag"]})
+    assert not_modified.status_code == 304
+
+
+@pytest.mark.parametrize("data,content_type,expected_body,expected_content_type", (
+    pytest.param({"value": 1}, None, b'{"value":1}', "application/json", id="Unencoded"),
+    pytest.param(b'{"value":1}', "application/json", b'{"value":1}', "application/json", id="Encoded"),
+    pytest.param("", None, b"", None, id="Empty"),
+))
+def test_make_response(data, content_type, expected_body, expected_content_type: Optional[str]):
+    response = starlette_framework.make_response(data, 201, content_type)
+
+    assert isinstance(response, Response)
+    assert response.status_code == 201
+    assert response.body == expected_body
+    assert response.headers.get("Content-Type") == expected_content_type
+
+
+def test_make_streaming_response():
+    response = starlette_framework.make_streaming_response(iter([b"1", b"2"]), 200, "application/x-ndjson")
+
+    assert isinstance(response, StreamingResponse)
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+
+
+@pytest.mark.parametrize("offload_threshold", (None, 0))
+def test_endpoint(offload_threshold: Optional[int]):
+    @use_args(ValueSchema(), location="json", offload_threshold=offload_threshold)
+    @use_response(ValueSchema, status_code=201)
+    async def create(request, args):
+        return {**args, "other": 1}
+
+    class Values(HTTPEndpoint):
+        @use_args({"value": fields.Integer(required=True)}, location="query")
+        @use_response(ValueSchema, stream="ndjson")
+        async def get(self, request, args):
+            return ({"value": args["value"] + i} for i in range(2))
+
+    client = TestClient(Starlette(routes=[Route("/", create, methods=["POST"]), Route("/values", Values)]))
+
+    created = client.post("/", content=b'{"value": 1}', headers={"Content-Type": "application/json"})
+    assert created.status_code == 201
+    assert created.headers["Content-Type"] == "application/json"
+    assert created.json() == {"value": 1}
+
+    invalid = client.post("/", content=b'{"value": "one"}', headers={"Content-Type": "application/json"})
+    assert invalid.status_code == 422
+    assert json.loads(invalid.text) == {"json": {"value": ["Not a valid integer."]}}
+
+    streamed = client.get("/values", params={"value": 3})
+    assert streamed.text.splitlines() == ['{"value":3}', '{"value":4}']
+
+
+def test_get_request_body_not_received():
+    request = make_request(b'{"value": 1}', {"Content-Type": "application/json"})
+
+    with pytest.raises(RuntimeError):
+        starlette_framework.get_request_body(request)
+
+
+def test_get_request_body_cached(mocker: MockerFixture):
+    decoder = mocker.patch.object(encoding, "json_decoder", mocker.Mock(side_effect=encoding.json_decoder))
+    request = make_request(b'{"value": 1}', {"Content-Type": "application/json"})
+
+    asyncio.run(starlette_framework.receive_request_body(request))
+
+    assert starlette_framework.parser.load_json(request, ValueSchema()) == {"value": 1}
+    assert starlette_framework.get_request_body(request) == {"value": 1}
+    decoder.assert_called_once()
+
+
+def test_parser_non_json_request():
+    request = make_request(b"value=1")
+
+    assert starlette_framework.parser.load_json(request, ValueSchema()) is core.missing
+
+
+def test_explicit_backend(mocker: MockerFixture):
+    # Without an active framework, the endpoint can only be served by the explicitly selected backend
+    mocker.patch.dict(framework.__dict__, dict.fromkeys(framework.FRAMEWORK_ATTRIBUTES))
+    spec = WebargsAPISpec(
+        "Test", "1.0.0", "3.0.2", plugins=[starlette_framework.StarletteWebargsPlugin()], backend="starlette"
+    )
+
+    @use_args(ValueSchema(), location="json", backend="starlette")
+    @use_response(ValueSchema, status_code=201, backend="starlette")
+    async def create(request, args):
+        return args
+
+    app = Starlette(routes=[Route("/", create, methods=["POST"])])
+    spec.create_paths(app)
+    spec.add_spec_route(app)
+    client = TestClient(app)
+
+    assert client.post("/", json={"value": 1}).json() == {"value": 1}
+    assert client.get("/openapi.json").json()["paths"].keys() == {"/"}
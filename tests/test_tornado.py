@@ -0,0 +1,213 @@
+import asyncio
+import json
+from typing import Optional
+
+from marshmallow import Schema, fields
+import pytest
+from pytest_mock import MockerFixture
+
+tornado = pytest.importorskip("tornado")
+
+from tornado.httpclient import AsyncHTTPClient, HTTPResponse
+from tornado.httpserver import HTTPServer
+from tornado.httputil import HTTPServerRequest
+from tornado.netutil import bind_sockets
+from tornado.web import Application, RequestHandler
+from webargs import core
+
+from specargs import OneOf, WebargsAPISpec, encoding, framework, use_args, use_response
+from specargs.framework import tornado as tornado_framework
+
+
+class ValueSchema(Schema):
+    value = fields.Integer(required=True)
+
+
+@pytest.fixture(autouse=True)
+def active_framework(mocker: MockerFixture):
+    # Tornado is made the active framework even if other frameworks are installed
+    # The module's dictionary is patched directly so the originals aren't looked up through framework detection
+    mocker.patch.dict(framework.__dict__, {
+        attribute: getattr(tornado_framework, attribute) for attribute in framework.FRAMEWORK_ATTRIBUTES
+    })
+
+
+@pytest.fixture
+def spec():
+    return WebargsAPISpec("Test", "1.0.0", "3.0.2", plugins=[tornado_framework.TornadoWebargsPlugin()])
+
+
+def fetch(app: Application, path: str, **kwargs) -> HTTPResponse:
+    async def serve_and_fetch():
+        sockets = bind_sockets(0, "127.0.0.1")
+        server = HTTPServer(app)
+        server.add_sockets(sockets)
+        try:
+            url = f"http://127.0.0.1:{sockets[0].getsockname()[1]}{path}"
+            return await AsyncHTTPClient().fetch(url, raise_error=False, **kwargs)
+        finally:
+            server.stop()
+
+    return asyncio.run(serve_and_fetch())
+
+
+def test_create_paths_type_error(spec: WebargsAPISpec):
+    with pytest.raises(TypeError):
+        tornado_framework.create_paths(spec, "not an app")
+
+
+def test_create_paths(spec: WebargsAPISpec):
+    class UsersHandler(RequestHandler):
+        @use_response({})
+        def get(self):
+            ...  # pragma: no cover
+
+    class UserHandler(RequestHandler):
+        @use_args(ValueSchema(), location="json")
+        def put(self, user_id, args):
+            ...  # pragma: no cover
+
+        def delete(self, user_id):
+            ...  # pragma: no cover
+
+    class ItemHandler(RequestHandler):
+        def get(self, item_id):
+            ...  # pragma: no cover
+
+    app = Application([
+        (r"/users/?", UsersHandler),
+        (r"/users/([0-9]+)", UserHandler),
+        (r"/users/([0-9]+)", ItemHandler),
+        (r"/items/(?P<item_id>[a-z]{3}(?:-[a-z]{3})?)\.json", ItemHandler),
+    ])
+
+    tornado_framework.create_paths(spec, app)
+
+    paths = spec.to_dict()["paths"]
+    assert paths.keys() == {"/users", "/users/{user_id}", "/items/{item_id}.json"}
+    assert paths["/users"].keys() == {"get"}
+    assert paths["/users/{user_id}"].keys() == {"parameters", "put", "delete"}
+    assert "requestBody" in paths["/users/{user_id}"]["put"]
+    assert paths["/users/{user_id}"]["parameters"] == [
+        {"name": "user_id", "in": "path", "required": True, "schema": {"type": "string", "pattern": "^[0-9]+$"}}
+    ]
+    assert paths["/items/{item_id}.json"]["parameters"][0]["schema"] == {
+        "type": "string", "pattern": "^[a-z]{3}(?:-[a-z]{3})?$"
+    }
+
+
+def test_create_paths_incremental(mocker: MockerFixture, spec: WebargsAPISpec):
+    class FirstHandler(RequestHandler):
+        def get(self):
+            ...  # pragma: no cover
+
+    class SecondHandler(RequestHandler):
+        def get(self):
+            ...  # pragma: no cover
+
+    app = Application([(r"/first", FirstHandler)])
+    tornado_framework.create_paths(spec, app)
+
+    app.wildcard_router.add_rules([(r"/second", SecondHandler)])
+    path = mocker.spy(spec, "path")
+    tornado_framework.create_paths(spec, app)
+
+    path.assert_called_once()
+    assert path.call_args.kwargs["view"] is SecondHandler
+    assert spec.to_dict()["paths"].keys() == {"/first", "/second"}
+
+
+def test_path_without_rule(spec: WebargsAPISpec):
+    class Handler(RequestHandler):
+        def get(self):
+            ...  # pragma: no cover
+
+    spec.path(view=Handler, app=Application([(r"/handler", Handler)]))
+
+    assert spec.to_dict()["paths"].keys() == {"/handler"}
+
+
+def test_route_views():
+    class Handler(RequestHandler):
+        def get(self):
+            ...  # pragma: no cover
+
+        def post(self):
+            ...  # pragma: no cover
+
+    assert list(tornado_framework.route_views(Application([(r"/handler", Handler)]))) == [
+        ("GET /handler$", Handler.get),
+        ("POST /handler$", Handler.post),
+    ]
+
+
+def test_add_spec_route(spec: WebargsAPISpec):
+    app = Application()
+    spec.add_spec_route(app)
+
+    response = fetch(app, "/openapi.json")
+    assert json.loads(response.body)["info"]["title"] == "Test"
+    assert response.headers["Content-Type"] == "application/json"
+
+    not_modified = fetch(app, "/openapi.json", headers={"If-None-Match": response.headers["Etag"]})
+    assert not_modified.code == 304
+
+
+@pytest.mark.parametrize("offload_threshold", (None, 0))
+def test_handler(offload_threshold: Optional[int]):
+    class Handler(RequestHandler):
+        @use_args(OneOf(ValueSchema), location="json")
+        @use_response(ValueSchema, status_code=201)
+        def post(self, args):
+            return {**args, "other": 1}
+
+        @use_response(ValueSchema, offload_threshold=offload_threshold)
+        async def get(self):
+            return [{"value": 1}, {"value": 2}]
+
+        @use_response(None, status_code=204)
+        def delete(self):
+            ...
+
+    app = Application([(r"/", Handler)])
+
+    created = fetch(app, "/", method="POST", body=b'{"value": 1}', headers={"Content-Type": "application/json"})
+    assert created.code == 201
+    assert created.headers["Content-Type"] == "application/json"
+    assert json.loads(created.body) == {"value": 1}
+
+    listed = fetch(app, "/")
+    assert json.loads(listed.body) == [{"value": 1}, {"value": 2}]
+
+    deleted = fetch(app, "/", method="DELETE")
+    assert deleted.code == 204
+    assert deleted.body == b""
+
+
+def test_handler_stream():
+    class Handler(RequestHandler):
+        @use_response(ValueSchema, stream="ndjson")
+        def get(self):
+            return ({"value": i} for i in range(3))
+
+    response = fetch(Application([(r"/", Handler)]), "/")
+
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    assert response.body.splitlines() == [b'{"value":0}', b'{"value":1}', b'{"value":2}']
+
+
+def test_get_request_body_cached(mocker: MockerFixture):
+    decoder = mocker.patch.object(encoding, "json_decoder", mocker.Mock(side_effect=encoding.json_decoder))
+    request = HTTPServerRequest(
+        method="POST", uri="/", body=b'{"value": 1}', headers={"Content-Type": "application/json"}
+    )
+
+    assert tornado_framework.parser.load_json(request, ValueSchema()) == {"value": 1}
+    assert tornado_framework.get_request_body(request) == {"value": 1}
+    decoder.assert_called_once()
+
+
+def test_parser_non_json_request():
+    request = HTTPServerRequest(method="POST", uri="/", body=b"value=1")
+
+    assert tornado_framework.parser.load_json(request, ValueSchema()) is core.missing